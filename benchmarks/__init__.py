@@ -0,0 +1,10 @@
+"""
+PyAstra benchmark suite.
+
+Runs the hot paths of the library, emits the results as JSON and compares them against a stored
+baseline. Run it from the repository root with:
+
+    python -m benchmarks --output results.json
+    python -m benchmarks --baseline results.json --threshold 0.2
+
+"""
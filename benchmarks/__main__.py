@@ -0,0 +1,28 @@
+"""
+Command line interface of the benchmark suite.
+
+Results are printed as JSON to the standard output (or saved to a file with --output) and the
+progress to the standard error. With --baseline, the exit status is 1 if any benchmark regressed.
+
+"""
+
+import sys
+
+from benchmarks import cases, cli, runner
+
+
+def main(argv=None):
+    parser = cli.get_parser('python -m benchmarks', __doc__)
+    parser.add_argument('--repeat', type=int, default=runner.REPEAT,
+                        help='number of timed repeats')
+    parser.add_argument('--min-time', type=float, default=runner.MIN_TIME,
+                        help='minimum time of each repeat, in seconds')
+    args = parser.parse_args(argv)
+
+    results = runner.run(cases.get_cases(), args.filter, args.repeat, args.min_time,
+                         cli.get_logger(args))
+    return cli.report(results, args, 'median')
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,67 @@
+"""
+Defines the benchmark cases of the suite.
+
+Each case is a name and a function without arguments. Setup work (such as building the chart
+used by the case) is done when the cases are created, so that only the function is timed.
+Cases which use the cached values of the chart clear them on each run.
+
+"""
+
+from pyastra import const
+from pyastra.core.chart import Chart
+from pyastra.core.datetime import Datetime
+from pyastra.core.geopos import GeoPos
+from pyastra.ephem import ephem, swe
+from pyastra.integrations import llm
+from pyastra.predictives.primarydirections import PDTable
+from pyastra.tools import planetarytime
+
+# Date and location of the benchmark chart
+DATE = Datetime('2015/03/13', '17:00', '+00:00')
+POS = GeoPos('38n32', '8w54')
+
+
+def _chart_case(**kwargs):
+    """ Returns a function which builds a chart with the given arguments. """
+    return lambda: Chart(DATE, POS, **kwargs)
+
+
+def _accidental_scores(chart):
+    """ Scores the accidental dignities of the seven planets. """
+    chart.clear_cache()
+    return [chart.get_object(obj_id).accidental_dignities().score()
+            for obj_id in const.LIST_SEVEN_PLANETS]
+
+
+def _describe_chart(chart):
+    """ Describes the chart, including its receptions. """
+    chart.clear_cache()
+    return llm.describe_chart(chart)
+
+
+def get_cases() -> list[tuple]:
+    """ Returns the list of (name, function) benchmark cases. """
+    chart = Chart(DATE, POS)
+    cases = []
+
+    # Chart construction for each house system and zodiac
+    for hsys in swe.SWE_HOUSESYS:
+        cases.append((f'chart.hsys.{hsys}', _chart_case(hsys=hsys)))
+    cases.append(('chart.zodiac.Tropical', _chart_case(zodiac=const.ZODIAC_TROPICAL)))
+    for ayanamsa in swe.SWE_AYANAMSAS:
+        cases.append((f'chart.zodiac.Sidereal.{ayanamsa}',
+                      _chart_case(zodiac=const.ZODIAC_SIDEREAL, ayanamsa=ayanamsa)))
+
+    # Chart properties
+    cases += [
+        ('chart.fixed_stars', chart.get_fixed_stars),
+        ('dignities.accidental', lambda: _accidental_scores(chart)),
+        ('predictives.primary_directions', lambda: PDTable(chart)),
+        ('predictives.solar_return', lambda: chart.solar_return(2020)),
+        ('predictives.profection', lambda: chart.profection(Datetime('2020/06/01', '12:00'))),
+        ('ephem.station', lambda: ephem.find_next_station(const.MARS, DATE)),
+        ('tools.planetary_hours', lambda: planetarytime.get_hour_table(DATE, POS)),
+        ('llm.describe_chart', lambda: _describe_chart(chart)),
+        ('llm.describe_chart_as_json', lambda: llm.describe_chart_as_json(chart)),
+    ]
+    return cases
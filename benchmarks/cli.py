@@ -0,0 +1,70 @@
+"""
+Implements the command line arguments and reporting shared by the benchmark commands.
+
+"""
+
+import argparse
+import json
+import sys
+
+from benchmarks import runner
+
+
+def _parse_threshold(value):
+    """ Parses a PATTERN=VALUE threshold. """
+    pattern, _, threshold = value.rpartition('=')
+    if not pattern:
+        raise argparse.ArgumentTypeError(f"'{value}' is not a PATTERN=VALUE threshold.")
+    return pattern, float(threshold)
+
+
+def get_parser(prog, description) -> argparse.ArgumentParser:
+    """ Returns an argument parser with the output and baseline arguments. """
+    parser = argparse.ArgumentParser(prog=prog, description=description)
+    parser.add_argument('--filter', default='*',
+                        help='run only the benchmarks matching a glob pattern')
+    parser.add_argument('--output', help='save the results to a JSON file')
+    parser.add_argument('--baseline', help='compare the results against a JSON file')
+    parser.add_argument('--threshold', type=float, default=runner.THRESHOLD,
+                        help='allowed increase ratio (0.2 means 20%% more)')
+    parser.add_argument('--threshold-for', type=_parse_threshold, action='append', default=[],
+                        metavar='PATTERN=VALUE', help='threshold for benchmarks matching PATTERN')
+    parser.add_argument('--quiet', action='store_true', help='do not print the progress')
+    return parser
+
+
+def get_logger(args):
+    """ Returns a function which prints the progress to the standard error. """
+    def log(message):
+        if not args.quiet:
+            print(message, file=sys.stderr)
+    return log
+
+
+def report(results, args, metric) -> int:
+    """
+    Compares the results against the baseline (if given) and saves or prints them.
+    Returns the exit status, which is 1 if any benchmark regressed.
+
+    """
+    log = get_logger(args)
+    status = 0
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as file:
+            baseline = json.load(file)
+        comparison = runner.compare(results, baseline, args.threshold,
+                                    dict(args.threshold_for), metric)
+        results['comparison'] = comparison
+        for name, values in comparison.items():
+            if values['regression']:
+                status = 1
+                log(f'REGRESSION {name}: {values["ratio"]:.2f}x the baseline '
+                    f'(threshold {values["threshold"]:.2f})')
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(results, file, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+    return status
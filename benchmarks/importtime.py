@@ -0,0 +1,97 @@
+"""
+Import time benchmarks of the library.
+
+Each case runs an import statement in a new interpreter, so that no module is cached, and
+reports the time of the statement and the pyastra modules it loaded. Subsystems such as the
+protocols, predictives and dignities load on first use, so importing the package or the chart
+must not load them. Run it with:
+
+    python -m benchmarks.importtime --output importtime.json
+    python -m benchmarks.importtime --baseline importtime.json --threshold 0.2
+
+Use 'python -X importtime -c "import pyastra"' for the time per module.
+
+"""
+
+import fnmatch
+import json
+import statistics
+import subprocess
+import sys
+
+from benchmarks import cli, runner
+
+# Version of the results format
+RESULTS_VERSION = 1
+
+# Default number of interpreters run per case
+REPEAT = 10
+
+# Runs a statement and prints its time and the pyastra modules it loaded
+_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+modules = [name for name in sys.modules if name.split('.')[0] == 'pyastra']
+print(json.dumps({{'time': elapsed, 'modules': sorted(modules)}}))
+"""
+
+
+def import_time(statement) -> dict:
+    """ Runs a statement in a new interpreter and returns its time and loaded modules. """
+    output = subprocess.run([sys.executable, '-c', _SCRIPT.format(statement=statement)],
+                            capture_output=True, text=True, check=True).stdout
+    return json.loads(output)
+
+
+def get_cases() -> list[tuple]:
+    """ Returns the list of (name, statement) import benchmark cases. """
+    return [
+        ('import.pyastra', 'import pyastra'),
+        ('import.datetime', 'from pyastra.core.datetime import Datetime'),
+        ('import.chart', 'from pyastra import Chart'),
+        ('import.chart_and_protocols', 'from pyastra import Chart; '
+                                       'import pyastra.protocols.pipeline'),
+        ('import.primary_directions', 'import pyastra.predictives.primarydirections'),
+    ]
+
+
+def run(cases, pattern='*', repeat=REPEAT, log=None) -> dict:
+    """ Runs the import cases matching a pattern and returns the results. """
+    benchmarks = {}
+    for name, statement in cases:
+        if not fnmatch.fnmatch(name, pattern):
+            continue
+        runs = [import_time(statement) for _ in range(repeat)]
+        times = [res['time'] for res in runs]
+        benchmarks[name] = {
+            'statement': statement,
+            'repeat': repeat,
+            'median': statistics.median(times),
+            'min': min(times),
+            'modules': len(runs[0]['modules']),
+        }
+        if log:
+            log(f'{name:40} {benchmarks[name]["median"] * 1e3:9.2f} ms '
+                f'{benchmarks[name]["modules"]:4} modules')
+
+    return {
+        'version': RESULTS_VERSION,
+        'machine': runner.machine_info(),
+        'benchmarks': benchmarks,
+    }
+
+
+def main(argv=None):
+    parser = cli.get_parser('python -m benchmarks.importtime', __doc__)
+    parser.add_argument('--repeat', type=int, default=REPEAT,
+                        help='number of interpreters run per case')
+    args = parser.parse_args(argv)
+
+    results = run(get_cases(), args.filter, args.repeat, cli.get_logger(args))
+    return cli.report(results, args, 'median')
+
+
+if __name__ == '__main__':
+    sys.exit(main())
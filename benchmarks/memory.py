@@ -0,0 +1,150 @@
+"""
+Memory benchmarks of the charts and derived objects, using tracemalloc.
+
+It reports the bytes allocated per Chart, Object, PDTable and AccidentalDignity kept alive, and
+the memory retained after building and discarding N charts. Memory retained before a garbage
+collection is held by reference cycles, which are also reported by counting the charts still
+alive and the unreachable objects found by the collector. Run it with:
+
+    python -m benchmarks.memory --output memory.json
+    python -m benchmarks.memory --baseline memory.json --threshold 0.1
+
+"""
+
+import fnmatch
+import gc
+import sys
+import tracemalloc
+import weakref
+
+from pyastra import const
+from pyastra.core.chart import Chart
+from pyastra.dignities.accidental import AccidentalDignity
+from pyastra.ephem import ephem
+from pyastra.predictives.primarydirections import PDTable
+
+from benchmarks import cli, runner
+from benchmarks.cases import DATE, POS
+
+# Version of the results format
+RESULTS_VERSION = 1
+
+# Default number of items measured
+SIZE = 200
+
+
+def allocated(factory, n) -> float:
+    """ Returns the bytes allocated per item when keeping 'n' items built by a factory. """
+    factory()  # Warm up caches
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start, _ = tracemalloc.get_traced_memory()
+        items = [factory() for _ in range(n)]
+        end, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del items
+    return (end - start) / n
+
+
+def retained(factory, n) -> dict:
+    """
+    Builds and discards 'n' items with a factory, which must return objects supporting weak
+    references, and returns:
+    - bytes: the memory retained before a garbage collection;
+    - bytes_after_gc: the memory retained after a garbage collection;
+    - cyclic: the number of items kept alive only by reference cycles;
+    - unreachable: the number of unreachable objects found by the garbage collector.
+
+    """
+    factory()  # Warm up caches
+    gc.collect()
+    gc.disable()
+    tracemalloc.start()
+    try:
+        start, _ = tracemalloc.get_traced_memory()
+        refs = []
+        for _ in range(n):
+            item = factory()
+            refs.append(weakref.ref(item))
+            del item
+        before_gc, _ = tracemalloc.get_traced_memory()
+        cyclic = sum(1 for ref in refs if ref() is not None)
+        unreachable = gc.collect()
+        after_gc, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        gc.enable()
+
+    return {
+        'bytes': before_gc - start,
+        'bytes_after_gc': after_gc - start,
+        'cyclic': cyclic,
+        'unreachable': unreachable,
+    }
+
+
+def _chart_with_dignities():
+    """ Builds a chart and scores the accidental dignities of the seven planets. """
+    chart = Chart(DATE, POS)
+    for obj_id in const.LIST_SEVEN_PLANETS:
+        chart.get_object(obj_id).accidental_dignities().score()
+    return chart
+
+
+def _accidental_dignity(chart):
+    """ Builds the accidental dignities of the Sun with its score computed. """
+    dignity = AccidentalDignity(chart.get_object(const.SUN), chart)
+    dignity.score()
+    return dignity
+
+
+def get_cases(n=SIZE) -> list[tuple]:
+    """ Returns the list of (name, function) memory benchmark cases. """
+    chart = Chart(DATE, POS)
+    n_objects = len(const.LIST_OBJECTS_TRADITIONAL)
+    return [
+        ('chart', lambda: {'bytes': allocated(lambda: Chart(DATE, POS), n)}),
+        ('object', lambda: {'bytes': allocated(
+            lambda: ephem.get_objects(const.LIST_OBJECTS_TRADITIONAL, chart.context, chart),
+            n) / n_objects}),
+        ('pd_table', lambda: {'bytes': allocated(lambda: PDTable(chart), max(n // 20, 1))}),
+        ('accidental_dignity', lambda: {'bytes': allocated(
+            lambda: _accidental_dignity(chart), n)}),
+        ('retained.chart', lambda: retained(lambda: Chart(DATE, POS), n)),
+        ('retained.chart_with_dignities', lambda: retained(_chart_with_dignities, n)),
+        ('retained.chart_weak_refs', lambda: retained(
+            lambda: Chart(DATE, POS, weak_refs=True), n)),
+    ]
+
+
+def run(cases, pattern='*', log=None) -> dict:
+    """ Runs the memory cases matching a pattern and returns the results. """
+    benchmarks = {}
+    for name, func in cases:
+        if not fnmatch.fnmatch(name, pattern):
+            continue
+        benchmarks[name] = func()
+        if log:
+            log(f'{name:40} {benchmarks[name]["bytes"]:12.0f} bytes')
+
+    return {
+        'version': RESULTS_VERSION,
+        'machine': runner.machine_info(),
+        'benchmarks': benchmarks,
+    }
+
+
+def main(argv=None):
+    parser = cli.get_parser('python -m benchmarks.memory', __doc__)
+    parser.add_argument('--size', type=int, default=SIZE, help='number of items measured')
+    args = parser.parse_args(argv)
+
+    results = run(get_cases(args.size), args.filter, cli.get_logger(args))
+    results['size'] = args.size
+    return cli.report(results, args, 'bytes')
+
+
+if __name__ == '__main__':
+    sys.exit(main())
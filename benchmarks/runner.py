@@ -0,0 +1,119 @@
+"""
+Implements the timing of the benchmark cases and the comparison against a baseline.
+
+"""
+
+import fnmatch
+import platform
+import statistics
+import time
+
+import swisseph
+
+# Version of the results format
+RESULTS_VERSION = 1
+
+# Default number of repeats and minimum time of each repeat (in seconds)
+REPEAT = 5
+MIN_TIME = 0.05
+
+# Default allowed slowdown before a benchmark is a regression (0.2 = 20% slower)
+THRESHOLD = 0.2
+
+
+def _time_calls(func, number) -> float:
+    """ Returns the time per call of calling a function a number of times. """
+    start = time.perf_counter()
+    for _ in range(number):
+        func()
+    return (time.perf_counter() - start) / number
+
+
+def time_case(func, repeat=REPEAT, min_time=MIN_TIME) -> dict:
+    """
+    Times a function and returns the statistics of the time per call, in seconds.
+    The number of calls per repeat is calibrated so that each repeat takes at least 'min_time'.
+
+    """
+    number = 1
+    while True:
+        times = [_time_calls(func, number)]
+        if times[0] * number >= min_time:
+            break
+        number *= 2
+
+    times += [_time_calls(func, number) for _ in range(repeat - 1)]
+
+    return {
+        'min': min(times),
+        'median': statistics.median(times),
+        'mean': statistics.mean(times),
+        'stdev': statistics.stdev(times) if len(times) > 1 else 0.0,
+        'number': number,
+        'repeat': repeat,
+    }
+
+
+def run(cases, pattern='*', repeat=REPEAT, min_time=MIN_TIME, log=None) -> dict:
+    """ Runs the cases matching a pattern and returns the results. """
+    benchmarks = {}
+    for name, func in cases:
+        if not fnmatch.fnmatch(name, pattern):
+            continue
+        benchmarks[name] = time_case(func, repeat, min_time)
+        if log:
+            log(f'{name:60} {benchmarks[name]["median"] * 1000:10.3f} ms')
+
+    return {
+        'version': RESULTS_VERSION,
+        'machine': machine_info(),
+        'benchmarks': benchmarks,
+    }
+
+
+def threshold_for(name, threshold=THRESHOLD, thresholds=None) -> float:
+    """ Returns the threshold of a benchmark given per-pattern thresholds. """
+    for pattern, value in (thresholds or {}).items():
+        if fnmatch.fnmatch(name, pattern):
+            return value
+    return threshold
+
+
+def machine_info() -> dict:
+    """ Returns information about the machine running the benchmarks. """
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'swisseph': swisseph.version,
+    }
+
+
+def compare(results, baseline, threshold=THRESHOLD, thresholds=None, metric='median') -> dict:
+    """
+    Compares a metric of the results (by default, the median time) against a baseline.
+
+    Returns a dict indexed by benchmark name with the baseline and current values, their ratio,
+    the threshold and a 'regression' flag, which is set when the ratio is above 1 + threshold.
+    Benchmarks missing from the baseline are ignored.
+
+    """
+    res = {}
+    base_benchmarks = baseline['benchmarks']
+    for name, values in results['benchmarks'].items():
+        if name not in base_benchmarks:
+            continue
+        base = base_benchmarks[name][metric]
+        if base > 0:
+            ratio = values[metric] / base
+        else:
+            ratio = 1.0 if values[metric] <= base else float('inf')
+        limit = threshold_for(name, threshold, thresholds)
+        res[name] = {
+            'baseline': base,
+            'current': values[metric],
+            'ratio': ratio,
+            'threshold': limit,
+            'regression': ratio > 1 + limit,
+        }
+    return res
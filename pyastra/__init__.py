@@ -11,9 +11,16 @@ PATH_RES = PATH_LIB + 'resources' + os.sep
 
 # Imports for easy access
 from pyastra import const
-from pyastra.core.chart import Chart
 from pyastra.core.datetime import Datetime
 from pyastra.core.geopos import GeoPos
 
 # Available on "from pyastra import *"
 __all__ = ['const', 'Chart', 'Datetime', 'GeoPos']
+
+
+def __getattr__(name):
+    # The Chart loads the ephemeris, so it is imported on first access
+    if name == 'Chart':
+        from pyastra.core.chart import Chart
+        return Chart
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,156 @@
+"""
+This module provides an asyncio API for the computations which block the event loop, such as
+building charts, solar returns, primary directions and fixed stars:
+
+    chart = await aio.achart(date, pos)
+    table = await aio.aprimary_directions(chart)
+
+Computations run on the executor of a Runner. The Swiss Ephemeris is serialized by a lock, so
+a thread pool only adds requests waiting for the lock: a process pool (the default) runs them
+in parallel. The runner bounds the number of concurrent computations, so that waiting requests
+queue on the event loop instead of in the executor, and supports per-call timeouts.
+
+On cancellation or timeout, computations which have not started are dropped. Computations
+already running in the executor cannot be interrupted and run until they finish.
+
+"""
+
+import asyncio
+import os
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+
+from pyastra import const
+from pyastra.core.chart import Chart
+from pyastra.predictives.primarydirections import PDTable
+
+
+# === Computations === #
+
+# Computations run on the executor, so they are module functions which can be pickled by
+# process pools.
+
+def _chart(date, pos, kwargs):
+    return Chart(date, pos, **kwargs)
+
+
+def _solar_return(chart, year):
+    return chart.solar_return(year)
+
+
+def _primary_directions(chart, asp_list):
+    return PDTable(chart, asp_list)
+
+
+def _fixed_stars(chart):
+    return chart.get_fixed_stars()
+
+
+# ---------------- #
+#   Runner Class   #
+# ---------------- #
+
+class Runner:
+    """
+    This class runs computations on an executor from asyncio tasks.
+
+    Receives an optional executor (by default a process pool created on first use), the
+    maximum number of concurrent computations (by default the number of CPUs) and the
+    default timeout in seconds of each call (by default no timeout).
+
+    """
+
+    def __init__(self, executor=None, max_concurrency=None, timeout=None):
+        self.max_concurrency = max_concurrency or os.cpu_count() or 1
+        self.timeout = timeout
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._semaphores = weakref.WeakKeyDictionary()
+
+    @property
+    def executor(self):
+        """ Returns the executor, creating the default process pool if needed. """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(self.max_concurrency)
+        return self._executor
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        """ Returns the concurrency limit of the running event loop. """
+        loop = asyncio.get_running_loop()
+        if loop not in self._semaphores:
+            self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphores[loop]
+
+    async def _run(self, func, args):
+        async with self._semaphore():
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, func, *args)
+
+    async def run(self, func, *args, timeout=None):
+        """
+        Runs a function on the executor and returns its result.
+        The timeout includes the time waiting for a free slot and raises TimeoutError.
+
+        """
+        timeout = timeout if timeout is not None else self.timeout
+        return await asyncio.wait_for(self._run(func, args), timeout)
+
+    def shutdown(self, wait=True):
+        """ Shuts down the executor if it was created by this runner. """
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+        self._semaphores.clear()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        self.shutdown(wait=False)
+
+
+# Runner used when none is given
+_DEFAULT_RUNNER = None
+
+
+def get_runner() -> Runner:
+    """ Returns the default runner. """
+    global _DEFAULT_RUNNER
+    if _DEFAULT_RUNNER is None:
+        _DEFAULT_RUNNER = Runner()
+    return _DEFAULT_RUNNER
+
+
+def set_runner(runner):
+    """ Sets the default runner, shutting down the previous one. """
+    global _DEFAULT_RUNNER
+    if _DEFAULT_RUNNER is not None and _DEFAULT_RUNNER is not runner:
+        _DEFAULT_RUNNER.shutdown(wait=False)
+    _DEFAULT_RUNNER = runner
+
+
+# === Asyncio API === #
+
+async def achart(date, pos, runner=None, timeout=None, **kwargs) -> Chart:
+    """ Builds a chart as in Chart(date, pos, **kwargs). """
+    runner = runner if runner else get_runner()
+    return await runner.run(_chart, date, pos, kwargs, timeout=timeout)
+
+
+async def asolar_return(chart, year, runner=None, timeout=None) -> Chart:
+    """ Returns the solar return of a chart for a given year. """
+    runner = runner if runner else get_runner()
+    return await runner.run(_solar_return, chart, year, timeout=timeout)
+
+
+async def aprimary_directions(chart, asp_list=const.MAJOR_ASPECTS, runner=None,
+                              timeout=None) -> PDTable:
+    """ Returns the primary directions table of a chart. """
+    runner = runner if runner else get_runner()
+    return await runner.run(_primary_directions, chart, asp_list, timeout=timeout)
+
+
+async def afixed_stars(chart, runner=None, timeout=None) -> list:
+    """ Returns the list of fixed stars of a chart. """
+    runner = runner if runner else get_runner()
+    return await runner.run(_fixed_stars, chart, timeout=timeout)
@@ -0,0 +1,158 @@
+"""
+This module implements a cache of charts which coalesces identical computations.
+
+Charts are identified by their ChartContext and list of object IDs. When several callers
+(threads or asyncio tasks) request the same chart at the same time, only the first computes it
+and the others wait for its result. Computed charts are kept for a short time (TTL), so bursts
+of identical requests collapse to one computation per distinct chart:
+
+    cache = ChartCache(ttl=60)
+    chart = cache.get(context)
+    chart = await cache.aget(context)
+
+Charts are shared between callers, so they must not be modified.
+
+"""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+
+from pyastra import aio
+from pyastra import const
+from pyastra.core.chart import Chart
+
+# Default time to live of the cached charts, in seconds
+TTL = 60.0
+
+# Default maximum number of cached charts
+MAX_SIZE = 1024
+
+
+def _from_context(context, ids, store=None):
+    return Chart.from_context(context, list(ids), store=store)
+
+
+# -------------------- #
+#   ChartCache Class   #
+# -------------------- #
+
+class ChartCache:
+    """
+    This class represents a cache of charts indexed by context and object IDs, which coalesces
+    concurrent computations of the same chart.
+
+    Receives the time to live of the charts in seconds, the maximum number of charts kept,
+    evicting the least recently used, and an optional ChartStore where charts are loaded
+    from before being computed.
+
+    """
+
+    def __init__(self, ttl=TTL, max_size=MAX_SIZE, store=None):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.store = store
+        self.hits = 0
+        self.computations = 0
+        self.coalesced = 0
+        self._charts = OrderedDict()    # Charts and expiration times by key
+        self._flights = {}              # Futures of the computations by key
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._charts)
+
+    @staticmethod
+    def key(context, ids) -> tuple:
+        """ Returns the key of a chart. """
+        return context, tuple(ids)
+
+    def _lookup(self, key):
+        """
+        Returns a (chart, future, leader) tuple with the cached chart or the future of its
+        computation, and if the caller is the leader which must compute the chart.
+
+        """
+        with self._lock:
+            entry = self._charts.get(key)
+            if entry is not None:
+                chart, expires = entry
+                if time.monotonic() < expires:
+                    self._charts.move_to_end(key)
+                    self.hits += 1
+                    return chart, None, False
+                del self._charts[key]
+
+            future = self._flights.get(key)
+            if future is not None:
+                self.coalesced += 1
+                return None, future, False
+
+            # The future is running, so that cancelling a waiter does not cancel it
+            future = Future()
+            future.set_running_or_notify_cancel()
+            self._flights[key] = future
+            self.computations += 1
+            return None, future, True
+
+    def _finish(self, key, future, chart=None, exception=None):
+        """ Stores the result of a computation and wakes up its waiters. """
+        with self._lock:
+            del self._flights[key]
+            if exception is None and self.ttl > 0:
+                self._charts[key] = (chart, time.monotonic() + self.ttl)
+                while len(self._charts) > self.max_size:
+                    self._charts.popitem(last=False)
+        if exception is None:
+            future.set_result(chart)
+        else:
+            future.set_exception(exception)
+
+    def get(self, context, ids=const.LIST_OBJECTS_TRADITIONAL) -> Chart:
+        """ Returns the chart of a context, computing it in the calling thread if needed. """
+        key = self.key(context, ids)
+        chart, future, leader = self._lookup(key)
+        if future is None:
+            return chart
+        if leader:
+            try:
+                chart = _from_context(context, ids, self.store)
+            except Exception as exc:
+                self._finish(key, future, exception=exc)
+                raise
+            self._finish(key, future, chart)
+        return future.result()
+
+    async def aget(self, context, ids=const.LIST_OBJECTS_TRADITIONAL, runner=None,
+                   timeout=None) -> Chart:
+        """
+        Returns the chart of a context, computing it on an aio runner if needed.
+        Cancelling or timing out a caller does not cancel the computation of the others.
+
+        """
+        key = self.key(context, ids)
+        chart, future, leader = self._lookup(key)
+        if future is None:
+            return chart
+        if leader:
+            runner = runner if runner else aio.get_runner()
+            task = asyncio.ensure_future(runner.run(_from_context, context, tuple(ids),
+                                                     self.store))
+            task.add_done_callback(lambda task_: self._finish_task(key, future, task_))
+        return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+
+    def _finish_task(self, key, future, task):
+        """ Stores the result of an asyncio computation. """
+        if task.cancelled():
+            self._finish(key, future, exception=asyncio.CancelledError())
+        elif task.exception() is not None:
+            self._finish(key, future, exception=task.exception())
+        else:
+            self._finish(key, future, task.result())
+
+    def clear(self):
+        """ Removes all cached charts. """
+        with self._lock:
+            self._charts.clear()
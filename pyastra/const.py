@@ -276,6 +276,20 @@ PD_TYPE_ZODIACAL = 'Zodiacal'
 PD_TYPE_MUNDANE = 'Mundane'
 
 
+# === Eclipses === */
+
+# Eclipse kinds
+ECLIPSE_SOLAR = 'Solar Eclipse'
+ECLIPSE_LUNAR = 'Lunar Eclipse'
+
+# Eclipse types
+ECLIPSE_TOTAL = 'Total'
+ECLIPSE_ANNULAR = 'Annular'
+ECLIPSE_HYBRID = 'Hybrid'
+ECLIPSE_PARTIAL = 'Partial'
+ECLIPSE_PENUMBRAL = 'Penumbral'
+
+
 # === Zodiac Types === */
 ZODIAC_TROPICAL = "Tropical Zodiac"
 ZODIAC_SIDEREAL = "Sidereal Zodiac"
@@ -293,6 +307,13 @@ AYANANMSA_ALDEBARAN_15TAU = "Ayanamsa Aldebaran 15 Taurus"
 AYANANMSA_GALCENTER_0SAG = "Ayanamsa Galactic Eq. 00 Sag"
 
 
+# === Ephemeris backends === */
+
+EPHEM_SWISS = "Swiss Ephemeris"
+EPHEM_MOSHIER = "Moshier Ephemeris"
+EPHEM_TABLES = "Ephemeris Tables"
+
+
 # === Some Lists === */
 
 LIST_SIGNS = [
@@ -336,3 +357,9 @@ LIST_FIXED_STARS = [
     STAR_LESATH, STAR_VEGA, STAR_ALTAIR, STAR_DENEB_ALGEDI,
     STAR_FOMALHAUT, STAR_DENEB_ADIGE, STAR_ACHERNAR,
 ]
+
+LIST_AYANAMSAS = [
+    AYANANMSA_FAGAN_BRADLEY, AYANANMSA_LAHIRI, AYANANMSA_DELUCE,
+    AYANANMSA_RAMAN, AYANANMSA_KRISHNAMURTI, AYANANMSA_SASSANIAN,
+    AYANANMSA_ALDEBARAN_15TAU, AYANANMSA_GALCENTER_0SAG,
+]
@@ -7,9 +7,16 @@ including date, time, position, and calculation settings.
 
 """
 
+from __future__ import annotations
+
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
 from pyastra import const
 
+if TYPE_CHECKING:
+    from pyastra.dignities.essential import DignityConfig
+
 @dataclass(frozen=True)
 class ChartContext:
     """
@@ -26,3 +33,21 @@ class ChartContext:
     zodiac: str = const.ZODIAC_TROPICAL
     ayanamsa: str = const.AYANANMSA_FAGAN_BRADLEY
     alt: float = 0.0   # Altitude above mean sea level
+    terms: str | None = None   # Terms variant (None for the essential module default)
+    faces: str | None = None   # Faces variant (None for the essential module default)
+    ephemeris: str | None = None   # Ephemeris backend name (None for the default backend)
+
+    def __post_init__(self):
+        # Validates the terms and faces variants (the default variants need no validation)
+        if self.terms is not None or self.faces is not None:
+            from pyastra.dignities import essential
+            essential.get_config(self.terms, self.faces)
+        if self.ephemeris is not None:
+            from pyastra.ephem import backends
+            backends.get(self)
+
+    @property
+    def dignities(self) -> DignityConfig:
+        """ Returns the DignityConfig with the terms and faces variants of this context. """
+        from pyastra.dignities import essential
+        return essential.get_config(self.terms, self.faces)
@@ -16,6 +16,8 @@ Minor aspects only when within a max allowed orb.
 
 """
 
+from typing import NamedTuple
+
 from pyastra.core import angle
 from pyastra import const
 
@@ -26,8 +28,8 @@ MAX_EXACT_ORB = 0.3
 
 # === Private functions === #
 
-def _raw_aspect(obj1, obj2, asp_list) -> dict | None:
-    """ Returns a dictionary with the aspect type, orb, separation, and active/passive objects."""
+def _active_passive(obj1, obj2) -> tuple | None:
+    """ Returns the active and passive objects, or None if the objects cannot aspect. """
 
     # Ignore same object
     if obj1.id == obj2.id:
@@ -42,115 +44,89 @@ def _raw_aspect(obj1, obj2, asp_list) -> dict | None:
     if active.id in [const.SYZYGY, const.NORTH_NODE, const.SOUTH_NODE, const.PARS_FORTUNA]:
         return None
 
+    return active, passive
+
+
+def _is_valid_orb(asp_type, asp_orb, active, passive) -> bool:
+    """ Returns if an aspect type is valid given its orb and the active/passive objects. """
+    if asp_type in const.MAJOR_ASPECTS:
+        # For major aspects ignore aspects out of orb
+        return asp_orb <= active.orb() or asp_orb <= passive.orb()
+    # For minor aspects ignore aspects out of max orb
+    return asp_orb <= MAX_MINOR_ASP_ORB
+
+
+def _match(obj1, obj2, asp_list) -> tuple | None:
+    """
+    Returns the best aspect between objects as a (type, orb, separation, active, passive) tuple,
+    or None if there is no aspect within orb.
+
+    """
+    pair = _active_passive(obj1, obj2)
+    if not pair:
+        return None
+    active, passive = pair
+
     # Calculate angular separation
     separation = angle.closest_distance(active.lon, passive.lon)
     abs_sep = abs(separation)
 
-    # Find the best match for the aspect type
+    # Return the best match for the aspect type within orb
     for asp_type in asp_list:
         asp_orb = abs(abs_sep - asp_type)
-
-        # Check aspect orb
-        if asp_type in const.MAJOR_ASPECTS:
-            # For major aspects ignore aspects out of orb
-            if asp_orb > active.orb() and asp_orb > passive.orb():
-                continue
-        else:
-            # For minor aspects ignore aspects out of max orb
-            if asp_orb > MAX_MINOR_ASP_ORB:
-                continue
-
-        # Return valid aspect within orb
-        return {
-            'asp_type': asp_type,
-            'asp_orb': asp_orb,
-            'separation': separation,
-            'active': active,
-            'passive': passive
-        }
+        if _is_valid_orb(asp_type, asp_orb, active, passive):
+            return asp_type, asp_orb, separation, active, passive
 
     return None
 
 
-def _aspect_properties(asp_dict):
-    """ Returns the properties of an aspect given by the 'asp_dict'. """
-
-    asp_type = asp_dict['asp_type']
-    asp_orb = asp_dict['asp_orb']
-    sep = asp_dict['separation']
-    active = asp_dict['active']
-    passive = asp_dict['passive']
-
-    # Properties
-    props_active = {
-        'id': active.id,
-        'in_orb': False,
-        'movement': const.NO_MOVEMENT
-    }
-    props_passive = {
-        'id': passive.id,
-        'in_orb': False,
-        'movement': const.NO_MOVEMENT
-    }
-    props = {
-        'asp_type': asp_type,
-        'asp_orb': asp_orb,
-        'direction': -1,
-        'condition': -1,
-        'active': props_active,
-        'passive': props_passive
-    }
-
-    if asp_type == const.NO_ASPECT:
-        return props
-
-    # Aspect within orb
-    props_active['in_orb'] = asp_orb <= active.orb()
-    props_passive['in_orb'] = asp_orb <= passive.orb()
+def _record(asp_type, asp_orb, sep, active, passive):
+    """ Returns the AspectRecord of an aspect between the active and passive objects. """
 
     # Direction
-    props['direction'] = const.DEXTER if sep <= 0 else const.SINISTER
+    direction = const.DEXTER if sep <= 0 else const.SINISTER
 
     # Sign conditions
     # Note: if obj1 is before obj2, orb_dir will be less than zero
     orb_dir = sep - asp_type if sep >= 0 else sep + asp_type
     offset = active.signlon + orb_dir
-    if 0 <= offset < 30:
-        props['condition'] = const.ASSOCIATE
-    else:
-        props['condition'] = const.DISSOCIATE
+    condition = const.ASSOCIATE if 0 <= offset < 30 else const.DISSOCIATE
 
-        # Movement of the individual objects
+    # Movement of the individual objects
     if abs(orb_dir) < MAX_EXACT_ORB:
-        props_active['movement'] = props_passive['movement'] = const.EXACT
+        active_movement = passive_movement = const.EXACT
     else:
         # Active object applies to Passive if it is before
         # and direct, or after the Passive and Rx.
-        props_active['movement'] = const.SEPARATIVE
+        active_movement = const.SEPARATIVE
         if (orb_dir > 0 and active.is_direct()) or \
                 (orb_dir < 0 and active.is_retrograde()):
-            props_active['movement'] = const.APPLICATIVE
+            active_movement = const.APPLICATIVE
         elif active.is_stationary():
-            props_active['movement'] = const.STATIONARY
+            active_movement = const.STATIONARY
 
         # The Passive applies or separates from the Active
         # if it has a different direction..
         # Note: Non-planets have zero speed
-        props_passive['movement'] = const.NO_MOVEMENT
+        passive_movement = const.NO_MOVEMENT
         obj2speed = passive.lon_speed if passive.is_planet() else 0.0
         same_dir = active.lon_speed * obj2speed >= 0
         if not same_dir:
-            props_passive['movement'] = props_active['movement']
+            passive_movement = active_movement
 
-    return props
+    return AspectRecord(
+        asp_type, asp_orb, sep, direction, condition,
+        AspectObject(active.id, active_movement, asp_orb <= active.orb()),
+        AspectObject(passive.id, passive_movement, asp_orb <= passive.orb()),
+    )
 
 
 # === Public functions === #
 
 def aspect_type(obj1, obj2, asp_list):
     """ Returns the aspect type between objects considering a list of possible aspects. """
-    asp_dict = _raw_aspect(obj1, obj2, asp_list)
-    return asp_dict['asp_type'] if asp_dict else const.NO_ASPECT
+    match = _match(obj1, obj2, asp_list)
+    return match[0] if match else const.NO_ASPECT
 
 
 def has_aspect(obj1, obj2, asp_list):
@@ -163,60 +139,90 @@ def has_aspect(obj1, obj2, asp_list):
 
 def is_aspecting(obj1, obj2, asp_list):
     """ Returns if obj1 aspects obj2 within orb, considering a list of possible aspects. """
-    asp_dict = _raw_aspect(obj1, obj2, asp_list)
-    if asp_dict:
-        return asp_dict['asp_orb'] < obj1.orb()
+    match = _match(obj1, obj2, asp_list)
+    if match:
+        return match[1] < obj1.orb()
     return False
 
 
+def aspect_orbs(obj1, obj2, asp_list) -> dict:
+    """
+    Returns a dict with all valid aspect types between objects and their orbs, considering a list
+    of possible aspects. The aspect type between the objects for any sublist of 'asp_list' is the
+    first type of the sublist in this dict.
+
+    """
+    pair = _active_passive(obj1, obj2)
+    if not pair:
+        return {}
+    active, passive = pair
+    abs_sep = abs(angle.closest_distance(active.lon, passive.lon))
+    res = {}
+    for asp_type in asp_list:
+        asp_orb = abs(abs_sep - asp_type)
+        if _is_valid_orb(asp_type, asp_orb, active, passive):
+            res[asp_type] = asp_orb
+    return res
+
+
+def aspect_record(obj1, obj2, asp_list):
+    """
+    Returns the AspectRecord between two objects considering a list of possible aspects, or
+    None if there is no aspect. This is cheaper than building an Aspect, since records are
+    tuples and the no aspect case does not allocate.
+
+    """
+    match = _match(obj1, obj2, asp_list)
+    return _record(*match) if match else None
+
+
 def get_aspect(obj1, obj2, asp_list):
     """ Builds an Aspect from two objects considering a list of possible aspects. """
     return Aspect.from_objects(obj1, obj2, asp_list)
 
 
-# ---------------- #
-#   Aspect Class   #
-# ---------------- #
+# ----------------- #
+#   Aspect Records  #
+# ----------------- #
 
-class AspectObject:
-    """
-    Dummy class to represent the Active and Passive objects and to allow access to their
-    properties using the dot notation.
-    
-    """
+class AspectObject(NamedTuple):
+    """ Represents the Active and Passive objects of an aspect and their properties. """
 
-    def __init__(self, properties):
-        self.id = None
-        self.movement = None
-        self.in_orb = None
-        self.__dict__.update(properties)
+    id: str | None = None
+    movement: str | None = None
+    in_orb: bool | None = None
 
 
-class Aspect:
-    """ This class represents an aspect with all its properties. """
+class AspectRecord(NamedTuple):
+    """ This class is an immutable record of an aspect with all its properties. """
 
-    def __init__(self, properties):
-        self.type = properties.get('asp_type', None)
-        self.orb = properties.get('asp_orb', None)
-        self.direction = properties.get('direction')
-        self.condition = properties.get('condition')
-        self.active = AspectObject(properties.get('active'))
-        self.passive = AspectObject(properties.get('passive'))
+    type: float | None
+    orb: float | None
+    separation: float
+    direction: int
+    condition: int
+    active: AspectObject
+    passive: AspectObject
 
     @classmethod
-    def from_objects(cls, obj1, obj2, asp_list):
-        """ Builds an Aspect from two objects within a list of possible aspects. """
-        asp_dict = _raw_aspect(obj1, obj2, asp_list)
-        if not asp_dict:
-            asp_dict = {
-                'asp_type': const.NO_ASPECT,
-                'asp_orb': 0,
-                'separation': 0,
-                'active': obj1,
-                'passive': obj2
-            }
-        asp_props = _aspect_properties(asp_dict)
-        return Aspect(asp_props)
+    def from_dict(cls, properties):
+        """ Builds a record from a dictionary of properties as used by Aspect. """
+        return cls(
+            properties.get('asp_type', None),
+            properties.get('asp_orb', None),
+            properties.get('separation', 0),
+            properties.get('direction'),
+            properties.get('condition'),
+            AspectObject(**properties.get('active')),
+            AspectObject(**properties.get('passive')),
+        )
+
+    @classmethod
+    def no_aspect(cls, obj1, obj2):
+        """ Returns the record of the absence of aspect between two objects. """
+        return cls(const.NO_ASPECT, 0, 0, -1, -1,
+                   AspectObject(obj1.id, const.NO_MOVEMENT, False),
+                   AspectObject(obj2.id, const.NO_MOVEMENT, False))
 
     def exists(self):
         """ Returns if this aspect is valid. """
@@ -269,3 +275,90 @@ class Aspect:
                                      self.type,
                                      self.active.movement,
                                      angle.to_string(self.orb))
+
+
+# ---------------- #
+#   Aspect Class   #
+# ---------------- #
+
+class Aspect:
+    """
+    This class represents an aspect with all its properties.
+    It is a facade over an AspectRecord, which can be built from the record or from a dictionary
+    of properties.
+
+    """
+
+    __slots__ = ('record',)
+
+    def __init__(self, properties):
+        if not isinstance(properties, AspectRecord):
+            properties = AspectRecord.from_dict(properties)
+        self.record = properties
+
+    @classmethod
+    def from_objects(cls, obj1, obj2, asp_list):
+        """ Builds an Aspect from two objects within a list of possible aspects. """
+        record = aspect_record(obj1, obj2, asp_list)
+        return cls(record if record else AspectRecord.no_aspect(obj1, obj2))
+
+    # === Properties === #
+
+    @property
+    def type(self):
+        """ The aspect type. """
+        return self.record.type
+
+    @property
+    def orb(self):
+        """ The orb distance between the active and passive objects. """
+        return self.record.orb
+
+    @property
+    def direction(self):
+        """ The aspect direction (dexter or sinister). """
+        return self.record.direction
+
+    @property
+    def condition(self):
+        """ The aspect sign condition (associate or dissociate). """
+        return self.record.condition
+
+    @property
+    def active(self) -> AspectObject:
+        """ The active object. """
+        return self.record.active
+
+    @property
+    def passive(self) -> AspectObject:
+        """ The passive object. """
+        return self.record.passive
+
+    # === Functions === #
+
+    def exists(self):
+        """ Returns if this aspect is valid. """
+        return self.record.exists()
+
+    def movement(self):
+        """ Returns the movement of this aspect, as in AspectRecord.movement(). """
+        return self.record.movement()
+
+    def mutual_aspect(self):
+        """ Returns if both object are within aspect orb. """
+        return self.record.mutual_aspect()
+
+    def mutual_movement(self):
+        """ Returns if both objects are mutually applying or separating. """
+        return self.record.mutual_movement()
+
+    def get_role(self, obj_id):
+        """ Returns the role (active or passive) of an object in this aspect. """
+        return self.record.get_role(obj_id)
+
+    def in_orb(self, obj_id):
+        """ Returns if the object (given by ID) is within orb in the Aspect. """
+        return self.record.in_orb(obj_id)
+
+    def __str__(self):
+        return str(self.record)
@@ -0,0 +1,239 @@
+"""
+This module implements astrocartography, the lines of the map where the objects are angular
+at a julian date.
+
+An object is on the MC where the local sidereal time equals its right ascension, and on the Asc
+and Desc where its hour angle is minus and plus its diurnal semi-arc. So the longitude of the
+MC and IC lines does not depend on the latitude, and the longitude of the Asc and Desc lines
+is solved from the declination at each latitude. The sidereal time and the equatorial
+coordinates of the objects are computed once:
+
+    astromap = AstroMap.build(date, const.LIST_SEVEN_PLANETS)
+    astromap.lines()[const.SUN][const.ASC]      # Polylines of (lat, lon) points
+    astromap.parans()
+
+Objects do not rise or set at latitudes where they are circumpolar, so their Asc and Desc lines
+end where they meet the MC or IC lines. Lines are split in polylines where they cross the
+antimeridian.
+
+Parans are the locations where two objects are angular at the same time, which are the
+crossings of their lines. An object is angular at the same hour angles every day, so the
+latitude of a paran holds for the whole day.
+
+"""
+
+import math
+from dataclasses import dataclass
+
+from pyastra import const, utils
+from pyastra.core import angle
+from pyastra.ephem import backends, swe
+
+# Angles of the lines, with meridian lines first
+LIST_LINE_ANGLES = [const.MC, const.IC, const.ASC, const.DESC]
+
+# Default latitude range and step, in degrees, of the lines
+MAX_LAT = 85.0
+LAT_STEP = 0.5
+
+# Precision, in degrees, of the latitudes of the parans
+PARAN_PRECISION = 1e-9
+
+
+def _lon(lon):
+    """ Normalizes a geographic longitude between -180 and 180. """
+    return angle.znorm(lon)
+
+
+def _split(points) -> list:
+    """
+    Splits a line of (lat, lon) points in polylines where it crosses the antimeridian,
+    ending and starting them at the interpolated crossing.
+
+    """
+    polylines = [[points[0]]]
+    for (lat0, lon0), (lat1, lon1) in zip(points, points[1:]):
+        if abs(lon1 - lon0) > 180:
+            edge = 180.0 if lon0 > 0 else -180.0
+            unwrapped = lon1 + 2 * edge
+            lat = lat0 + (lat1 - lat0) * (edge - lon0) / (unwrapped - lon0)
+            polylines[-1].append((lat, edge))
+            polylines.append([(lat, -edge)])
+        polylines[-1].append((lat1, lon1))
+    return polylines
+
+
+@dataclass(frozen=True)
+class Paran:
+    """
+    An immutable data class representing a paran, where two objects are angular at the same
+    time. The longitude is where their lines cross at the julian date of the map.
+
+    """
+
+    id1: str
+    angle1: str
+    id2: str
+    angle2: str
+    lat: float
+    lon: float
+
+
+# ------------------ #
+#   AstroMap Class   #
+# ------------------ #
+
+class AstroMap:
+    """
+    This class represents the astrocartography map of a list of objects at a julian date.
+    Receives the Greenwich sidereal time and a dict of object IDs to their (ra, decl).
+
+    """
+
+    def __init__(self, jd, gst, coords):
+        self.jd = jd
+        self.gst = gst
+        self.coords = coords
+
+    @classmethod
+    def from_jd(cls, jd, obj_ids=const.LIST_SEVEN_PLANETS, backend=None):
+        """ Builds the map of a list of objects at a julian date, with an optional backend. """
+        backend = backend if backend else backends.get()
+        gst, eps = swe.swe_sidtime(jd)
+        coords = {}
+        for obj_id in obj_ids:
+            lon, lat, _, _ = backend.object_fast(obj_id, jd)
+            coords[obj_id] = utils.eq_coords(lon, lat, eps)
+        return cls(jd, gst, coords)
+
+    @classmethod
+    def build(cls, date, obj_ids=const.LIST_SEVEN_PLANETS):
+        """ Builds the map of a list of objects at a date. """
+        return cls.from_jd(date.jd, obj_ids)
+
+    def __iter__(self):
+        return iter(self.coords)
+
+    def __len__(self):
+        return len(self.coords)
+
+    def limit(self, obj_id) -> float:
+        """
+        Returns the latitude from which an object is circumpolar, and has no Asc and Desc
+        lines, towards the pole of its declination.
+
+        """
+        decl = self.coords[obj_id][1]
+        return math.copysign(90 - abs(decl), decl)
+
+    def longitudes(self, obj_id, angle_id, lats) -> list:
+        """
+        Returns the longitudes where an object is on an angle at each latitude of a list,
+        or None where the object does not rise or set.
+
+        """
+        ra, decl = self.coords[obj_id]
+        mc = ra - self.gst
+        if angle_id == const.MC:
+            return [_lon(mc)] * len(lats)
+        if angle_id == const.IC:
+            return [_lon(mc + 180)] * len(lats)
+        sign = -1 if angle_id == const.ASC else 1
+        limit = abs(self.limit(obj_id))
+        tan_decl = math.tan(math.radians(decl))
+        res = []
+        for lat in lats:
+            if abs(lat) > limit:
+                res.append(None)
+                continue
+            # Diurnal semi-arc
+            x = max(-1.0, min(1.0, tan_decl * math.tan(math.radians(lat))))
+            res.append(_lon(mc + sign * (90 + math.degrees(math.asin(x)))))
+        return res
+
+    def _lats(self, obj_id, max_lat, step) -> list:
+        """ Returns the latitude grid of an object, with its circumpolar limits. """
+        count = round(2 * max_lat / step)
+        lats = [-max_lat + i * 2 * max_lat / count for i in range(count + 1)]
+        limit = abs(self.limit(obj_id))
+        if limit < max_lat:
+            lats.extend([-limit, limit])
+            lats.sort()
+        return lats
+
+    def lines(self, max_lat=MAX_LAT, step=LAT_STEP) -> dict:
+        """
+        Returns a dict of object IDs to dicts of angle IDs to lists of polylines, each a list
+        of (lat, lon) points, between -max_lat and max_lat with a latitude step.
+
+        """
+        res = {}
+        for obj_id in self.coords:
+            lats = self._lats(obj_id, max_lat, step)
+            res[obj_id] = {}
+            for angle_id in LIST_LINE_ANGLES:
+                lons = self.longitudes(obj_id, angle_id, lats)
+                points = [(lat, lon) for lat, lon in zip(lats, lons) if lon is not None]
+                res[obj_id][angle_id] = _split(points) if points else []
+        return res
+
+    def parans(self, max_lat=MAX_LAT, step=LAT_STEP) -> list:
+        """
+        Returns the list of parans between -max_lat and max_lat, sorted by latitude.
+        Crossings are searched with a latitude step and refined by bisection.
+
+        """
+        obj_ids = list(self.coords)
+        res = []
+        for i, id1 in enumerate(obj_ids):
+            for id2 in obj_ids[i+1:]:
+                lats = sorted(set(self._lats(id1, max_lat, step) + self._lats(id2, max_lat, step)))
+                lons1 = {angle_id: self.longitudes(id1, angle_id, lats)
+                         for angle_id in LIST_LINE_ANGLES}
+                lons2 = {angle_id: self.longitudes(id2, angle_id, lats)
+                         for angle_id in LIST_LINE_ANGLES}
+                for angle1 in LIST_LINE_ANGLES:
+                    for angle2 in LIST_LINE_ANGLES:
+                        # Meridian lines do not cross
+                        if angle1 in (const.MC, const.IC) and angle2 in (const.MC, const.IC):
+                            continue
+                        res.extend(self._crossings(id1, angle1, id2, angle2, lats,
+                                                   lons1[angle1], lons2[angle2]))
+        res.sort(key=lambda paran: paran.lat)
+        return res
+
+    def _crossings(self, id1, angle1, id2, angle2, lats, lons1, lons2) -> list:
+        """ Returns the parans of two lines sampled at a list of latitudes. """
+        res = []
+        prev = None
+        for lat, lon1, lon2 in zip(lats, lons1, lons2):
+            if lon1 is None or lon2 is None:
+                prev = None
+                continue
+            dist = angle.closest_distance(lon1, lon2)
+            # Sign changes across the opposite side of the lines are not crossings
+            if prev and abs(dist) < 90 and abs(prev[1]) < 90 and (dist == 0 or
+                                                                   prev[1] * dist < 0):
+                paran_lat = self._bisect(id1, angle1, id2, angle2, prev[0], lat)
+                lon = self.longitudes(id1, angle1, [paran_lat])[0]
+                res.append(Paran(id1, angle1, id2, angle2, paran_lat, lon))
+            prev = (lat, dist)
+        return res
+
+    def _bisect(self, id1, angle1, id2, angle2, lat0, lat1) -> float:
+        """ Returns the latitude where two lines cross between two latitudes. """
+
+        def dist(lat):
+            lon1 = self.longitudes(id1, angle1, [lat])[0]
+            lon2 = self.longitudes(id2, angle2, [lat])[0]
+            return angle.closest_distance(lon1, lon2)
+
+        dist0 = dist(lat0)
+        while lat1 - lat0 > PARAN_PRECISION:
+            mid = (lat0 + lat1) / 2
+            dist_mid = dist(mid)
+            if dist0 * dist_mid <= 0:
+                lat1 = mid
+            else:
+                lat0, dist0 = mid, dist_mid
+        return (lat0 + lat1) / 2
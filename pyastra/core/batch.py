@@ -0,0 +1,120 @@
+"""
+This module implements a columnar representation of a batch of charts.
+
+Research and cohort computations evaluate the same properties over many charts. Instead of a list
+of Chart objects, with one object per planet, house and angle, the ChartBatch keeps one column of
+values per property so that batch algorithms can iterate over plain lists of floats.
+
+"""
+
+import bisect
+
+from pyastra import const, utils
+from pyastra.core import angle
+
+# The traditional house offset (see House._OFFSET)
+HOUSE_OFFSET = -5.0
+
+
+# === House assignment === #
+
+def house_index(cusps, lon) -> int | None:
+    """
+    Returns the index [0..11] of the house containing a longitude given the list of the twelve
+    house cusps. It uses the same rules as HouseList.get_house_by_lon.
+
+    """
+    for i in range(12):
+        size = angle.distance(cusps[i], cusps[(i + 1) % 12])
+        if angle.distance(cusps[i] + HOUSE_OFFSET, lon) < size:
+            return i
+    return None
+
+
+def house_indexes(cusps, lons) -> list[int | None]:
+    """
+    Returns the index [0..11] of the house containing each longitude of a list, given the list
+    of the twelve house cusps. It uses the same rules as house_index, with one binary search
+    per longitude.
+
+    """
+    # Distances of the cusps from the first cusp, which increase for ordered cusps
+    starts = [angle.distance(cusps[0], cusp) for cusp in cusps]
+    if any(starts[i] > starts[i + 1] for i in range(11)):
+        return [house_index(cusps, lon) for lon in lons]
+
+    start = cusps[0] + HOUSE_OFFSET
+    return [bisect.bisect_right(starts, angle.distance(start, lon)) - 1 for lon in lons]
+
+
+# === Sect and Pars Fortuna === #
+
+def is_diurnal(sun_ra, sun_decl, mc, lat) -> bool:
+    """
+    Returns if a chart is diurnal given the right ascension and declination of the Sun,
+    the longitude of the MC and the latitude, as in Chart.is_diurnal.
+
+    """
+    return utils.is_above_horizon(sun_ra, sun_decl, utils.eq_coords(mc, 0)[0], lat)
+
+
+def pars_fortuna(asc, sun, moon, diurnal) -> float:
+    """ Returns the longitude of the Pars Fortuna, as in tools.pars_fortuna_lon. """
+    if diurnal:
+        return angle.norm(asc + moon - sun)
+    return angle.norm(asc + sun - moon)
+
+
+# -------------------- #
+#   ChartBatch Class   #
+# -------------------- #
+
+class ChartBatch:
+    """
+    This class represents a batch of charts in columnar format.
+
+    For a batch of N charts, every column is a list with N values:
+    - jd, lat, lon and utc_offset: the date and location of each chart;
+    - lons: a dict of object and angle IDs to their longitudes;
+    - cusps: the twelve house cusps of each chart;
+    - dignities: the DignityConfig of each chart, or None for the module defaults.
+
+    """
+
+    def __init__(self, jd, lat, lon, utc_offset, lons, cusps, dignities=None):
+        self.jd = jd
+        self.lat = lat
+        self.lon = lon
+        self.utc_offset = utc_offset
+        self.lons = lons
+        self.cusps = cusps
+        self.dignities = dignities if dignities is not None else [None] * len(jd)
+
+    @classmethod
+    def from_charts(cls, charts):
+        """ Builds a batch from a list of charts. """
+        charts = list(charts)
+        ids = [obj.id for obj in charts[0].objects] + const.LIST_ANGLES if charts else []
+        return cls(
+            jd=[chart.context.jd for chart in charts],
+            lat=[chart.context.lat for chart in charts],
+            lon=[chart.context.lon for chart in charts],
+            utc_offset=[chart.date.utcoffset.value for chart in charts],
+            lons={obj_id: [chart.get(obj_id).lon for chart in charts] for obj_id in ids},
+            cusps=[[house.lon for house in chart.houses] for chart in charts],
+            dignities=[chart.context.dignities for chart in charts],
+        )
+
+    @classmethod
+    def from_any(cls, charts):
+        """ Returns a batch given a ChartBatch or a list of charts. """
+        if isinstance(charts, ChartBatch):
+            return charts
+        return cls.from_charts(charts)
+
+    def __len__(self):
+        return len(self.jd)
+
+    def house_indexes(self, obj_id) -> list[int | None]:
+        """ Returns the house index [0..11] of an object for each chart. """
+        return [house_index(cusps, lon) for cusps, lon in zip(self.cusps, self.lons[obj_id])]
@@ -0,0 +1,228 @@
+"""
+This module implements the envelope of a chart over an uncertain birth time.
+
+Houses and angles move about one degree every four minutes, while the objects move slowly. So
+the envelope samples a window of minutes around the time of a chart without building a chart
+per sample: the angles and cusps are computed from the sidereal time, which advances at the
+sidereal rate, and the objects are moved by their speeds. The exact times at which a sign or
+a house changes are then found by bisection:
+
+    envelope = TimeEnvelope.from_chart(chart, minutes=30)
+    envelope.changes        # Sign and house changes, sorted by time
+    envelope.stable()       # Features which do not change within the window
+    envelope.arcs(const.SUN, const.ASC)
+
+Features are (kind, ID) pairs, where the kind is SIGN for the signs of the objects, angles and
+house cusps, and HOUSE for the houses of the objects.
+
+"""
+
+from dataclasses import dataclass
+
+from pyastra import const, utils
+from pyastra.core import angle, batch
+from pyastra.core.batch import ChartBatch
+from pyastra.core.chart import Chart
+from pyastra.core.housesystems import armc_houses
+from pyastra.core.zodiacs import ayanamsa
+from pyastra.ephem import swe
+
+# Feature kinds
+SIGN = 'Sign'
+HOUSE = 'House'
+
+# Mean sidereal rate of the Earth, in degrees per day
+SIDEREAL_RATE = 360.98564736629
+
+# Default window and step of the samples, in minutes
+WINDOW = 30.0
+STEP = 1.0
+
+# Precision, in days, of the times of the changes (one second)
+PRECISION = 1 / 86400
+
+
+def _columns(chart, gst, eps, offset, jds) -> tuple:
+    """
+    Returns the (lons, cusps, diurnal) columns of a chart at a list of julian dates, given the
+    sidereal time and obliquity at the julian date of the chart and the ayanamsa offset.
+
+    """
+    context = chart.context
+    armcs = [angle.norm(gst + SIDEREAL_RATE * (jd - context.jd) + context.lon) for jd in jds]
+    houses = armc_houses(context.hsys, armcs, [context.lat] * len(jds), eps, offset)
+    ascs = [values[1][0] for values in houses]
+    mcs = [values[1][1] for values in houses]
+
+    # The syzygy is fixed and the south node has no speed
+    lons = {}
+    for obj in chart.objects:
+        speed = 0.0 if obj.id == const.SYZYGY else obj.lon_speed
+        lons[obj.id] = [angle.norm(obj.lon + speed * (jd - context.jd)) for jd in jds]
+    if const.SOUTH_NODE in lons and const.NORTH_NODE in lons:
+        lons[const.SOUTH_NODE] = [angle.norm(lon + 180) for lon in lons[const.NORTH_NODE]]
+
+    # Sect, as in Chart.is_diurnal
+    sun_lat = chart.get_object(const.SUN).lat
+    diurnal = []
+    for sun, mc in zip(lons[const.SUN], mcs):
+        sun_ra, sun_decl = utils.eq_coords(sun, sun_lat)
+        diurnal.append(batch.is_diurnal(sun_ra, sun_decl, mc, context.lat))
+
+    if const.PARS_FORTUNA in lons:
+        lons[const.PARS_FORTUNA] = [batch.pars_fortuna(asc, sun, moon, is_diurnal)
+                                    for asc, sun, moon, is_diurnal in
+                                    zip(ascs, lons[const.SUN], lons[const.MOON], diurnal)]
+    lons[const.ASC] = ascs
+    lons[const.MC] = mcs
+    lons[const.DESC] = [angle.norm(asc + 180) for asc in ascs]
+    lons[const.IC] = [angle.norm(mc + 180) for mc in mcs]
+    return lons, [values[0] for values in houses], diurnal
+
+
+def _features(obj_ids, lons, cusps) -> dict:
+    """ Returns a dict of features to their values for each sample of the columns. """
+    res = {}
+    for obj_id in obj_ids + [const.ASC, const.MC]:
+        res[(SIGN, obj_id)] = [const.LIST_SIGNS[int(lon // 30)] for lon in lons[obj_id]]
+    for i, house_id in enumerate(const.LIST_HOUSES):
+        res[(SIGN, house_id)] = [const.LIST_SIGNS[int(values[i] // 30)] for values in cusps]
+    indexes = [batch.house_indexes(values, [lons[obj_id][j] for obj_id in obj_ids])
+               for j, values in enumerate(cusps)]
+    for k, obj_id in enumerate(obj_ids):
+        res[(HOUSE, obj_id)] = [const.LIST_HOUSES[values[k]] for values in indexes]
+    return res
+
+
+@dataclass(frozen=True)
+class Change:
+    """
+    An immutable data class representing the change of a feature of a chart within the
+    window of an envelope. The minutes are relative to the time of the chart.
+
+    """
+
+    jd: float
+    minutes: float
+    kind: str       # SIGN or HOUSE
+    id: str         # Object, angle or house ID
+    before: str
+    after: str
+
+
+# ---------------------- #
+#   TimeEnvelope Class   #
+# ---------------------- #
+
+class TimeEnvelope(ChartBatch):
+    """
+    This class represents a chart sampled over a window of birth times, in the columnar format
+    of the ChartBatch. It adds the minutes column, with the offset of each sample from the time
+    of the chart, the diurnal column and the list of changes.
+
+    """
+
+    def __init__(self, jd, lat, lon, utc_offset, lons, cusps, minutes, diurnal, changes,
+                 offset=0.0, dignities=None):
+        super().__init__(jd, lat, lon, utc_offset, lons, cusps, dignities)
+        self.minutes = minutes
+        self.diurnal = diurnal
+        self.changes = changes
+        self.offset = offset
+
+    @classmethod
+    def from_chart(cls, chart, minutes=WINDOW, step=STEP):
+        """
+        Samples a chart between minus and plus a number of minutes, with a step in minutes.
+        The chart provides the objects, house system and zodiac.
+
+        """
+        context = chart.context
+        gst, eps = swe.swe_sidtime(context.jd)
+        offset = 0.0
+        if context.zodiac == const.ZODIAC_SIDEREAL:
+            offset, _ = ayanamsa(context.jd, context.ayanamsa)
+
+        count = max(1, round(2 * minutes / step))
+        offsets = [-minutes + i * 2 * minutes / count for i in range(count + 1)]
+        jds = [context.jd + value / 1440 for value in offsets]
+        lons, cusps, diurnal = _columns(chart, gst, eps, offset, jds)
+
+        # Changes between samples are refined by bisection
+        obj_ids = [obj.id for obj in chart.objects]
+        features = _features(obj_ids, lons, cusps)
+        changes = []
+        for (kind, obj_id), values in features.items():
+            for i in range(count):
+                if values[i] == values[i + 1]:
+                    continue
+                start, end = jds[i], jds[i + 1]
+                while end - start > PRECISION:
+                    mid = (start + end) / 2
+                    mid_lons, mid_cusps, _ = _columns(chart, gst, eps, offset, [mid])
+                    if _features(obj_ids, mid_lons, mid_cusps)[(kind, obj_id)][0] == values[i]:
+                        start = mid
+                    else:
+                        end = mid
+                jd = (start + end) / 2
+                changes.append(Change(jd, (jd - context.jd) * 1440, kind, obj_id,
+                                      values[i], values[i + 1]))
+        changes.sort(key=lambda change: change.jd)
+
+        return cls(
+            jd=jds,
+            lat=[context.lat] * len(jds),
+            lon=[context.lon] * len(jds),
+            utc_offset=[chart.date.utcoffset.value] * len(jds),
+            lons=lons,
+            cusps=cusps,
+            minutes=offsets,
+            diurnal=diurnal,
+            changes=changes,
+            offset=offset,
+            dignities=[context.dignities] * len(jds),
+        )
+
+    @classmethod
+    def build(cls, date, pos, minutes=WINDOW, step=STEP, **kwargs):
+        """ Samples the chart of a date and location, with the optional Chart arguments. """
+        return cls.from_chart(Chart(date, pos, **kwargs), minutes, step)
+
+    def features(self) -> dict:
+        """ Returns a dict of features to their values for each sample. """
+        obj_ids = [obj_id for obj_id in self.lons if obj_id not in const.LIST_ANGLES]
+        return _features(obj_ids, self.lons, self.cusps)
+
+    def stable(self) -> dict:
+        """ Returns a dict of the features which do not change to their values. """
+        changed = {(change.kind, change.id) for change in self.changes}
+        return {feature: values[0] for feature, values in self.features().items()
+                if feature not in changed}
+
+    def unstable(self) -> dict:
+        """ Returns a dict of the features which change to their values, in time order. """
+        res = {}
+        for change in self.changes:
+            values = res.setdefault((change.kind, change.id), [change.before])
+            values.append(change.after)
+        return res
+
+    def arcs(self, promissor, significator) -> list:
+        """
+        Returns the zodiacal arcs of direction between a promissor and a significator, which
+        may be an angle, for each sample. Arcs move about one degree every four minutes.
+
+        """
+        from pyastra.predictives import primarydirections
+
+        def eq_coords(obj_id, i):
+            # Equatorial coordinates of the tropical longitude
+            return utils.eq_coords(angle.norm(self.lons[obj_id][i] + self.offset), 0)
+
+        res = []
+        for i, lat in enumerate(self.lat):
+            p_ra, p_decl = eq_coords(promissor, i)
+            s_ra, s_decl = eq_coords(significator, i)
+            mc_ra, _ = eq_coords(const.MC, i)
+            res.append(primarydirections.arc(p_ra, p_decl, s_ra, s_decl, mc_ra, lat))
+        return res
@@ -11,22 +11,27 @@ the list of angles. The angles should be used when you want to deal with angle's
 There are also methods to access fixed stars.
     
 """
+from __future__ import annotations
+
 import copy
 import dataclasses
+from typing import TYPE_CHECKING
 
 from pyastra.core import angle
 from pyastra import const
 from pyastra import utils
+from pyastra import profiling
 
 from pyastra.context import ChartContext
 from pyastra.ephem import ephem
 from pyastra.core.datetime import Datetime
 from pyastra.core.geopos import GeoPos
 
-from pyastra.protocols import almutem, behavior
-from pyastra.protocols.temperament import Temperament
-from pyastra.predictives import profections
-from pyastra.predictives.primarydirections import PrimaryDirections
+# Protocols and predictives are imported by the methods which use them, so that importing the
+# chart does not load them
+if TYPE_CHECKING:
+    from pyastra.protocols.temperament import Temperament
+    from pyastra.tools.receptions import ReceptionMatrix
 
 
 # ------------------ #
@@ -36,17 +41,24 @@ from pyastra.predictives.primarydirections import PrimaryDirections
 class Chart:
     """ This class represents an astrology chart. """
 
+    @profiling.traced(profiling.OPERATION_CHART)
     def __init__(self, date, pos, **kwargs):
         """ Creates an astrology chart for a given date and location.
         
         Optional arguments are:
         - hsys: house system
         - IDs: list of objects to include
+        - weak_refs: if the chart objects keep weak references to the chart, so that the chart
+          is freed without the garbage collector. Objects must then be used while the chart
+          is alive.
+        - store: a ChartStore where the chart is loaded from, or saved to if not stored.
         
         """
         # Handle optional arguments
         hsys = kwargs.get('hsys', const.HOUSES_DEFAULT)
         ids = kwargs.pop('ids', const.LIST_OBJECTS_TRADITIONAL)
+        self.weak_refs = kwargs.pop('weak_refs', False)
+        store = kwargs.pop('store', None)
 
         self.date = date
         self.pos = pos
@@ -58,11 +70,19 @@ class Chart:
             **kwargs
         )
 
+        stored = store.get(self.context, ids, self) if store is not None else None
+        if stored:
+            self.objects, self.houses, self.angles = stored
+            return
+
         self.objects = ephem.get_objects(ids, context=self.context, chart=self)
         self.houses, self.angles = ephem.get_houses_and_angles(context=self.context, chart=self)
+        if store is not None:
+            store.save(self, ids)
 
     @classmethod
-    def from_context(cls, context, ids=const.LIST_OBJECTS_TRADITIONAL):
+    def from_context(cls, context, ids=const.LIST_OBJECTS_TRADITIONAL, weak_refs=False,
+                     store=None):
         """
         Creates a new chart from a ChartContext.
         Object ids are not restored from the context.
@@ -73,11 +93,12 @@ class Chart:
         del context_dict['lon']
         date = Datetime.from_jd(context.jd, context.utc_offset)
         pos = GeoPos(context.lat, context.lon)
-        return Chart(date, pos, ids=ids, **context_dict)
+        return Chart(date, pos, ids=ids, weak_refs=weak_refs, store=store, **context_dict)
 
     def copy(self):
         """ Returns a deep copy of this chart. """
         chart = Chart.__new__(Chart)
+        chart.weak_refs = self.weak_refs
         chart.date = self.date
         chart.pos = self.pos
         chart.hsys = self.hsys
@@ -85,6 +106,8 @@ class Chart:
         chart.houses = self.houses.copy()
         chart.angles = self.angles.copy()
         chart.context = copy.copy(self.context)
+        for obj in [*chart.objects, *chart.houses, *chart.angles]:
+            obj.chart = chart
         return chart
 
     def __str__(self):
@@ -124,6 +147,7 @@ class Chart:
         """ Returns a fixed star from the ephemeris. """
         return ephem.get_fixed_star(obj_id, context=self.context, chart=self)
 
+    @profiling.traced(profiling.OPERATION_FIXED_STARS)
     def get_fixed_stars(self):
         """ Returns a list with all fixed stars. """
         ids = const.LIST_FIXED_STARS
@@ -158,6 +182,23 @@ class Chart:
         mc_ra, _ = utils.eq_coords(mc.lon, 0)
         return utils.is_above_horizon(sun_ra, sun_decl, mc_ra, lat)
 
+    def receptions(self) -> ReceptionMatrix:
+        """
+        Returns the reception matrix of the chart planets. It is computed on first use and
+        shared by the accidental dignities of all objects, until an object is relocated.
+        Objects whose longitudes are set directly require a call to clear_cache.
+
+        """
+        receptions = getattr(self, '_receptions', None)
+        if receptions is None:
+            from pyastra.tools.receptions import ReceptionMatrix
+            receptions = self._receptions = ReceptionMatrix(self)
+        return receptions
+
+    def clear_cache(self):
+        """ Clears the values computed from the positions of the objects. """
+        self._receptions = None
+
     def get_moon_phase(self):
         """ Returns the phase of the moon. """
         sun = self.get_object(const.SUN)
@@ -173,6 +214,7 @@ class Chart:
 
     # === Predictives === #
 
+    @profiling.traced(profiling.OPERATION_SOLAR_RETURN)
     def solar_return(self, year):
         """ Returns this chart's solar return for a given year. """
         sun = self.get_object(const.SUN)
@@ -181,26 +223,36 @@ class Chart:
         sr_date = ephem.next_solar_return(sun.lon, context=context)
         context = dataclasses.replace(self.context, jd=sr_date.jd)
         ids = [obj.id for obj in self.objects]
-        return Chart.from_context(context, ids)
+        return Chart.from_context(context, ids, self.weak_refs)
 
     def profection(self, date, fixed_objects=False):
         """ Returns the profection of the chart for a given date. """
+        from pyastra.predictives import profections
         return profections.compute(self, date, fixed_objects)
 
     def primary_directions(self):
         """ Returns the primary directions of the chart. """
+        from pyastra.predictives.primarydirections import PrimaryDirections
         return PrimaryDirections.get_table(self)
 
     # === Traditional protocolos === #
 
     def almutem(self) -> dict:
         """ Returns the almutem of the chart. """
+        from pyastra.protocols import almutem
         return almutem.compute(self)
 
     def behavior(self) -> list:
         """ Returns the behavior of the chart's native. """
+        from pyastra.protocols import behavior
         return behavior.compute(self)
 
     def temperament(self) -> Temperament:
         """ Returns the temperament of the chart's native. """
+        from pyastra.protocols.temperament import Temperament
         return Temperament(self)
+
+    def protocols(self) -> dict:
+        """ Returns the almutem, behavior and temperament computed over shared chart facts. """
+        from pyastra.protocols import pipeline
+        return pipeline.compute(self)
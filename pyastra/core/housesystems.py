@@ -0,0 +1,167 @@
+"""
+This module implements bundles of the same chart in several house systems.
+
+The positions of the objects do not depend on the house system, so a bundle computes them
+once and copies them to the chart of each system. The cusps of all systems are computed from
+one evaluation of the sidereal time and obliquity of the ecliptic:
+
+    bundle = HouseSystemBundle.build(date, pos, [const.HOUSES_PLACIDUS,
+                                                 const.HOUSES_REGIOMONTANUS])
+    bundle[const.HOUSES_PLACIDUS].get(const.HOUSE10)
+    bundle.house_indexes()
+
+"""
+
+import dataclasses
+
+from pyastra import const, utils
+from pyastra.core import angle, batch
+from pyastra.core.chart import Chart
+from pyastra.core.lists import ObjectList
+from pyastra.ephem import backends, builder, swe
+
+
+# House systems whose cusps only depend on the Asc and MC
+ANALYTIC_HOUSES = [
+    const.HOUSES_EQUAL,
+    const.HOUSES_EQUAL_2,
+    const.HOUSES_VEHLOW_EQUAL,
+    const.HOUSES_WHOLE_SIGN,
+    const.HOUSES_PORPHYRIUS,
+]
+
+
+def analytic_cusps(hsys, asc, mc) -> list:
+    """ Returns the twelve house cusps of a system of ANALYTIC_HOUSES given the Asc and MC. """
+    if hsys in (const.HOUSES_EQUAL, const.HOUSES_EQUAL_2):
+        return [angle.norm(asc + 30 * i) for i in range(12)]
+    if hsys == const.HOUSES_VEHLOW_EQUAL:
+        return [angle.norm(asc - 15 + 30 * i) for i in range(12)]
+    if hsys == const.HOUSES_WHOLE_SIGN:
+        return [angle.norm(asc // 30 * 30 + 30 * i) for i in range(12)]
+    if hsys == const.HOUSES_PORPHYRIUS:
+        # Each quadrant from an angle is divided in three equal houses
+        first = angle.distance(asc, mc + 180)
+        second = 180 - first
+        res = []
+        for start, size in [(asc, first), (mc + 180, second), (asc + 180, first), (mc, second)]:
+            res.extend(angle.norm(start + size * i / 3) for i in range(3))
+        return res
+    raise ValueError(f"'{hsys}' cusps do not only depend on the Asc and MC.")
+
+
+def armc_houses(hsys, armcs, lats, eps, offset=0.0) -> list:
+    """
+    Returns the (cusps, (asc, mc)) of a house system for lists of ARMCs and latitudes, given
+    the obliquity of the ecliptic and an optional offset subtracted from the longitudes, such
+    as the ayanamsa of sidereal charts.
+
+    The Asc and MC are computed from the ARMC and the cusps of the ANALYTIC_HOUSES from the
+    Asc and MC. Swisseph computes the cusps of the other systems and the angles inside the
+    polar circles, where it moves the Asc to the other side of the horizon.
+
+    """
+    analytic = hsys in ANALYTIC_HOUSES
+    indexes = [i for i in range(len(armcs)) if not analytic or abs(lats[i]) > 90 - eps]
+    values = dict(zip(indexes, swe.swe_houses_armcs([armcs[i] for i in indexes],
+                                                    [lats[i] for i in indexes], eps, hsys)))
+    res = []
+    for i, (armc, lat) in enumerate(zip(armcs, lats)):
+        if i in values:
+            swe_cusps, (asc, mc) = values[i]
+        else:
+            asc, mc = utils.asc_lon(armc, lat, eps), utils.mc_lon(armc, eps)
+        asc, mc = angle.norm(asc - offset), angle.norm(mc - offset)
+        if analytic:
+            res.append((analytic_cusps(hsys, asc, mc), (asc, mc)))
+        else:
+            res.append(([angle.norm(cusp - offset) for cusp in swe_cusps], (asc, mc)))
+    return res
+
+
+def cusps(context, hsys_list) -> dict:
+    """ Returns a dict of house system IDs to the (cusps, (asc, mc)) of a context. """
+    return backends.get(context).houses_multi(context, hsys_list)
+
+
+def house_indexes(cusps_by_system, lons) -> dict:
+    """
+    Returns a dict of house system IDs to the house index [0..11] of each longitude of a list,
+    given a dict of house system IDs to their twelve house cusps.
+
+    """
+    lons = list(lons)
+    return {hsys: batch.house_indexes(cusps_, lons) for hsys, cusps_ in cusps_by_system.items()}
+
+
+# --------------------------- #
+#   HouseSystemBundle Class   #
+# --------------------------- #
+
+class HouseSystemBundle:
+    """
+    This class represents the same chart in several house systems.
+    Charts are indexed by the house system IDs.
+
+    """
+
+    def __init__(self, charts):
+        self.charts = charts
+
+    @classmethod
+    def from_chart(cls, chart, hsys_list):
+        """
+        Builds a bundle from a chart and a list of house systems. The chart is kept for its
+        own house system and the objects are copied to the charts of the other systems.
+
+        """
+        others = [hsys for hsys in hsys_list if hsys != chart.context.hsys]
+        values = cusps(chart.context, others)
+        charts = {}
+        for hsys in hsys_list:
+            if hsys == chart.context.hsys:
+                charts[hsys] = chart
+                continue
+            res = Chart.__new__(Chart)
+            res.weak_refs = chart.weak_refs
+            res.date = chart.date
+            res.pos = chart.pos
+            res.hsys = hsys
+            res.context = dataclasses.replace(chart.context, hsys=hsys)
+            res.objects = ObjectList([obj.copy() for obj in chart.objects])
+            for obj in res.objects:
+                obj.chart = res
+            res.houses, res.angles = builder.build_houses_and_angles(*values[hsys], chart=res)
+            charts[hsys] = res
+        return cls(charts)
+
+    @classmethod
+    def build(cls, date, pos, hsys_list, **kwargs):
+        """ Builds a bundle for a date and location, with the optional Chart arguments. """
+        return cls.from_chart(Chart(date, pos, hsys=hsys_list[0], **kwargs), hsys_list)
+
+    def __getitem__(self, key) -> Chart:
+        return self.charts[key]
+
+    def __iter__(self):
+        return iter(self.charts)
+
+    def __len__(self):
+        return len(self.charts)
+
+    def cusps(self) -> dict:
+        """ Returns a dict of house system IDs to their twelve house cusps. """
+        return {hsys: [house.lon for house in chart.houses]
+                for hsys, chart in self.charts.items()}
+
+    def house_indexes(self, obj_ids=None) -> dict:
+        """
+        Returns a dict of house system IDs to dicts of object IDs to their house index [0..11].
+        Receives an optional list of object IDs, by default all objects of the charts.
+
+        """
+        chart = next(iter(self.charts.values()))
+        obj_ids = list(obj_ids) if obj_ids is not None else [obj.id for obj in chart.objects]
+        lons = [chart.get(obj_id).lon for obj_id in obj_ids]
+        return {hsys: dict(zip(obj_ids, indexes))
+                for hsys, indexes in house_indexes(self.cusps(), lons).items()}
@@ -37,7 +37,7 @@ class GenericList:
     def copy(self):
         """ Returns a deep copy of this list. """
         values = [obj.copy() for obj in self]
-        return GenericList(values)
+        return type(self)(values)
 
     def __iter__(self):
         """ Returns an iterator to this list. """
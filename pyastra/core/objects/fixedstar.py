@@ -12,6 +12,8 @@ from pyastra.core.objects.house import House
 class FixedStar(GenericObject):
     """ This class represents a generic fixed star. """
 
+    __slots__ = ('mag',)
+
     def __init__(self, *args, **kwargs):
         self.mag = 0.0
         super().__init__(*args, **kwargs)
@@ -4,9 +4,11 @@ Generic objects are all astrological objects that have a position in the chart.
 
 """
 
+import weakref
+
 from pyastra import const, utils
 from pyastra.core import angle
-from pyastra.core.sign import Sign
+from pyastra.core.sign import Sign, SIGNS
 
 
 class GenericObject:
@@ -14,28 +16,87 @@ class GenericObject:
     This class represents a generic object and includes properties which are common to all
     objects on a chart.
 
+    The attributes of the objects use slots, so subclasses should declare their own attributes
+    in '__slots__'. Other attributes are kept in the dict of the object.
+
     """
 
+    __slots__ = ('id', 'type', 'lon', 'lat', '_chart', '__dict__')
+
+    # Names of all slots, including the ones of the subclasses
+    _FIELDS = __slots__[:-1]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._FIELDS = tuple(name for klass in reversed(cls.__mro__)
+                            for name in klass.__dict__.get('__slots__', ())
+                            if name != '__dict__')
+
     def __init__(self, **kwargs):
         self.id = const.NO_PLANET
         self.type = const.OBJ_GENERIC
         self.lon = 0.0
         self.lat = 0.0
 
-        # Strong reference to chart which may cause problems in long-running applications.
-        self.chart = None
-        self.__dict__.update(kwargs)
+        # Reference to the chart, which is weak if the chart was created with 'weak_refs'.
+        # Strong references create a cycle between the chart and its objects, so charts are
+        # only freed by the garbage collector.
+        self._chart = None
+        self.chart = kwargs.pop('chart', None)
+        for key, value in kwargs.items():
+            setattr(self, key, value)
 
     @classmethod
     def from_dict(cls, _dict):
         """ Builds instance from dictionary of properties. """
         obj = cls()
-        obj.__dict__.update(_dict)
+        for key, value in _dict.items():
+            setattr(obj, key, value)
         return obj
 
+    def as_dict(self) -> dict:
+        """ Returns the dictionary of properties of this object. """
+        res = {name: getattr(self, name) for name in self._FIELDS}
+        res.update(self.__dict__)
+        return res
+
+    def __getstate__(self):
+        """ Returns the state for pickling, with a strong reference to the chart. """
+        state = self.as_dict()
+        state['_chart'] = self.chart
+        state['_weak'] = isinstance(self._chart, weakref.ref)
+        return state
+
+    def __setstate__(self, state):
+        state = dict(state)
+        weak = state.pop('_weak', False)
+        chart = state.pop('_chart', None)
+        for key, value in state.items():
+            setattr(self, key, value)
+        self._chart = weakref.ref(chart) if weak and chart is not None else chart
+
+    @property
+    def chart(self):
+        """ The chart of this object, or None if it has no chart or the chart was freed. """
+        if isinstance(self._chart, weakref.ref):
+            return self._chart()
+        return self._chart
+
+    @chart.setter
+    def chart(self, chart):
+        if chart is not None and getattr(chart, 'weak_refs', False):
+            self._chart = weakref.ref(chart)
+        else:
+            self._chart = chart
+
     def copy(self):
-        """ Returns a deep copy of this object. """
-        return self.from_dict(self.__dict__)
+        """ Returns a copy of this object, sharing its chart. """
+        cls = self.__class__
+        obj = cls.__new__(cls)
+        for name in cls._FIELDS:
+            setattr(obj, name, getattr(self, name))
+        obj.__dict__.update(self.__dict__)
+        return obj
 
     def __str__(self):
         lon = angle.to_string(self.signlon)
@@ -49,7 +110,7 @@ class GenericObject:
     @property
     def sign(self) -> Sign:
         """ Object sign (from longitude). """
-        return Sign(const.LIST_SIGNS[int(self.lon / 30)])
+        return SIGNS[int(self.lon / 30)]
 
     @property
     def signlon(self) -> float:
@@ -78,6 +139,10 @@ class GenericObject:
     def relocate(self, lon):
         """ Relocates this object to a new longitude. """
         self.lon = angle.norm(lon)
+        # Copies which share the chart, such as antiscia, do not change it
+        chart = self.chart
+        if chart is not None and chart.objects.content.get(self.id) is self:
+            chart.clear_cache()
 
     def antiscia(self):
         """ Returns the antiscia object. """
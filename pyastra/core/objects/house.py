@@ -6,7 +6,6 @@ This module implements the House class.
 from pyastra import const, definitions
 from pyastra.core import angle
 from pyastra.core.objects.generic import GenericObject
-from pyastra.dignities import essential
 
 
 class House(GenericObject):
@@ -15,6 +14,8 @@ class House(GenericObject):
     # The traditional house offset
     _OFFSET = -5.0
 
+    __slots__ = ('size',)
+
     def __init__(self, *args, **kwargs):
         self.size = 30.0
         super().__init__(*args, **kwargs)
@@ -58,12 +59,14 @@ class House(GenericObject):
     @property
     def ruler(self):
         """ Returns the house ruler. """
+        from pyastra.dignities import essential
         return essential.ruler(self.sign)
 
     @property
     def almutem(self):
         """ Returns the almutem of this house. """
-        return essential.almutem(self.sign, self.signlon)
+        from pyastra.dignities import essential
+        return essential.almutem(self.sign, self.signlon, essential.chart_config(self.chart))
 
     # === Functions === #
 
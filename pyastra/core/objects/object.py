@@ -4,14 +4,20 @@ Objects are astrology objects such as planets, lunar nodes, arabic parts, and ot
 
 """
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from pyastra import const
 from pyastra import definitions
 from pyastra.core import angle
 from pyastra.core.aspects import Aspect
 from pyastra.core.objects.generic import GenericObject
 from pyastra.core.objects.house import House
-from pyastra.dignities.accidental import AccidentalDignity
-from pyastra.dignities.essential import EssentialInfo
+
+if TYPE_CHECKING:
+    from pyastra.dignities.accidental import AccidentalDignity
+    from pyastra.dignities.essential import EssentialInfo
 
 
 class Object(GenericObject):
@@ -21,6 +27,8 @@ class Object(GenericObject):
     
     """
 
+    __slots__ = ('lon_speed', 'lat_speed')
+
     def __init__(self, *args, **kwargs):
         self.lon_speed = 0.0
         self.lat_speed = 0.0
@@ -115,12 +123,18 @@ class Object(GenericObject):
 
     # === Dignities === #
 
-    def essential_dignities(self) -> EssentialInfo:
-        """ Returns the essential dignities of this object. """
-        return EssentialInfo(self)
+    def essential_dignities(self, config=None) -> EssentialInfo:
+        """
+        Returns the essential dignities of this object.
+        Receives an optional DignityConfig, which defaults to the one of the chart.
+
+        """
+        from pyastra.dignities.essential import EssentialInfo
+        return EssentialInfo(self, config)
 
     def accidental_dignities(self) -> AccidentalDignity:
         """ Returns the accidental dignities of this object. """
+        from pyastra.dignities.accidental import AccidentalDignity
         return AccidentalDignity(self, self.chart)
 
     def describe(self) -> str:
@@ -0,0 +1,102 @@
+"""
+This module implements the relocation of a chart to many locations at the same instant.
+
+The positions of the objects do not depend on the location, so they are computed once. For
+each location, the Asc and MC are computed from the sidereal time (by swisseph inside the polar
+circles), the cusps of the systems in ANALYTIC_HOUSES from the Asc and MC, and the cusps of the
+other systems from the ARMC without recomputing the sidereal time and obliquity. The sect and
+the Pars Fortuna, which depend on the Asc, are computed for each location.
+
+Results are returned as a RelocationBatch, a ChartBatch with one chart per location:
+
+    batch = RelocationBatch.build(date, [(38.72, -9.14), (40.71, -74.01)])
+    batch.lons[const.ASC]
+    batch.house_indexes(const.SUN)
+
+Topocentric positions depend on the location, so charts with altitude are not supported.
+
+"""
+
+from pyastra import const, utils
+from pyastra.core import angle, batch
+from pyastra.core.batch import ChartBatch
+from pyastra.core.chart import Chart
+from pyastra.core.geopos import GeoPos
+from pyastra.core.housesystems import armc_houses
+from pyastra.core.zodiacs import ayanamsa
+from pyastra.ephem import swe
+
+
+# ------------------------- #
+#   RelocationBatch Class   #
+# ------------------------- #
+
+class RelocationBatch(ChartBatch):
+    """
+    This class represents a chart relocated to many locations, in the columnar format of the
+    ChartBatch. It adds the diurnal column, with the sect of the chart at each location.
+
+    """
+
+    def __init__(self, jd, lat, lon, utc_offset, lons, cusps, diurnal, dignities=None):
+        super().__init__(jd, lat, lon, utc_offset, lons, cusps, dignities)
+        self.diurnal = diurnal
+
+    @classmethod
+    def from_chart(cls, chart, locations):
+        """
+        Relocates a chart to a list of locations, given as GeoPos or (lat, lon) pairs.
+        The chart provides the objects, house system and zodiac.
+
+        """
+        context = chart.context
+        if context.alt > 0.0:
+            raise ValueError('Topocentric charts cannot be relocated.')
+        locations = [loc if isinstance(loc, GeoPos) else GeoPos(*loc) for loc in locations]
+        lats = [loc.lat for loc in locations]
+        lons = [loc.lon for loc in locations]
+        size = len(locations)
+
+        # Angles and cusps from the sidereal time, in the zodiac of the chart
+        gst, eps = swe.swe_sidtime(context.jd)
+        armcs = [angle.norm(gst + lon) for lon in lons]
+        offset = 0.0
+        if context.zodiac == const.ZODIAC_SIDEREAL:
+            offset, _ = ayanamsa(context.jd, context.ayanamsa)
+        houses = armc_houses(context.hsys, armcs, lats, eps, offset)
+        cusps = [values[0] for values in houses]
+        ascs = [values[1][0] for values in houses]
+        mcs = [values[1][1] for values in houses]
+
+        # Sect, as in Chart.is_diurnal
+        sun = chart.get_object(const.SUN)
+        sun_ra, sun_decl = utils.eq_coords(sun.lon, sun.lat)
+        diurnal = [batch.is_diurnal(sun_ra, sun_decl, mc, lat) for mc, lat in zip(mcs, lats)]
+
+        columns = {obj.id: [obj.lon] * size for obj in chart.objects}
+        if const.PARS_FORTUNA in columns:
+            moon = chart.get_object(const.MOON)
+            columns[const.PARS_FORTUNA] = [batch.pars_fortuna(asc, sun.lon, moon.lon, is_diurnal)
+                                           for asc, is_diurnal in zip(ascs, diurnal)]
+        columns[const.ASC] = ascs
+        columns[const.MC] = mcs
+        columns[const.DESC] = [angle.norm(asc + 180) for asc in ascs]
+        columns[const.IC] = [angle.norm(mc + 180) for mc in mcs]
+
+        return cls(
+            jd=[context.jd] * size,
+            lat=lats,
+            lon=lons,
+            utc_offset=[chart.date.utcoffset.value] * size,
+            lons=columns,
+            cusps=cusps,
+            diurnal=diurnal,
+            dignities=[context.dignities] * size,
+        )
+
+    @classmethod
+    def build(cls, date, locations, **kwargs):
+        """ Relocates the chart of a date to a list of locations, with the Chart arguments. """
+        locations = list(locations)
+        first = locations[0] if isinstance(locations[0], GeoPos) else GeoPos(*locations[0])
+        return cls.from_chart(Chart(date, first, **kwargs), locations)
@@ -5,18 +5,24 @@ This module provides a rich sign object.
 
 from pyastra import const
 from pyastra import definitions
-from pyastra.dignities import essential
 
 class Sign(str):
     """
     Represents a Zodiac Sign.
     Inherits from 'str' for backward compatibility and extends it with astrological context.
+    Signs are interned, so there is a single instance of each sign.
     """
 
+    __slots__ = ()
+
+    # Interned instances by name
+    _INSTANCES = {}
+
     def __new__(cls, name):
-        if name not in const.LIST_SIGNS:
-            raise ValueError(f"'{name}' is not a valid Zodiac Sign.")
-        return super().__new__(cls, name)
+        try:
+            return cls._INSTANCES[name]
+        except (KeyError, TypeError):
+            raise ValueError(f"'{name}' is not a valid Zodiac Sign.") from None
 
     @property
     def name(self) -> str:
@@ -81,7 +87,13 @@ class Sign(str):
     @property
     def ruler(self) -> str:
         """ Returns the sign ruler ID. """
+        from pyastra.dignities import essential
         return essential.ruler(self)
 
     def __repr__(self):
         return f"<Sign: {self} ({self.element}, {self.modality})>"
+
+
+# Interned signs, indexed by their position in the zodiac [0..11]
+Sign._INSTANCES.update({name: str.__new__(Sign, name) for name in const.LIST_SIGNS})
+SIGNS = tuple(Sign(name) for name in const.LIST_SIGNS)
@@ -0,0 +1,140 @@
+"""
+This module implements bundles of the same chart in several zodiacs.
+
+Sidereal longitudes are the tropical longitudes minus the ayanamsa. A bundle computes the
+tropical chart once and derives each sidereal chart by subtracting the ayanamsa of its julian
+date from the objects, houses and angles, and its daily motion from the speeds. Ayanamsas are
+cached by julian date, so sidereal variants only call the ephemeris for new ayanamsas:
+
+    bundle = ZodiacBundle.build(date, pos, [const.AYANANMSA_LAHIRI, const.AYANANMSA_RAMAN])
+    bundle[const.ZODIAC_TROPICAL].get(const.SUN)
+    bundle[const.AYANANMSA_LAHIRI].get(const.SUN)
+
+Whole sign houses start at the sign of the Asc, so their sidereal cusps are rebuilt from the
+sidereal Asc instead.
+
+"""
+
+import dataclasses
+import functools
+
+from pyastra import const
+from pyastra.core import angle
+from pyastra.core.chart import Chart
+from pyastra.core.lists import GenericList, HouseList, ObjectList
+from pyastra.ephem import backends, swe, tools
+
+# Maximum number of cached ayanamsas
+AYANAMSA_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=AYANAMSA_CACHE_SIZE)
+def ayanamsa(jd: float, ayanamsa_id: str) -> tuple:
+    """ Returns the (value, daily motion) of an ayanamsa at a julian date. """
+    speed = swe.swe_ayanamsa(jd + 0.5, ayanamsa_id) - swe.swe_ayanamsa(jd - 0.5, ayanamsa_id)
+    return swe.swe_ayanamsa(jd, ayanamsa_id), speed
+
+
+def _syzygy_jd(chart) -> float | None:
+    """ Returns the julian date of the syzygy of a chart, or None if it has no syzygy. """
+    if all(obj.id != const.SYZYGY for obj in chart.objects):
+        return None
+    return tools.syzygy_jd(chart.context.jd, backends.get(chart.context))
+
+
+def sidereal_chart(chart: Chart, ayanamsa_id: str, syzygy_jd: float = None) -> Chart:
+    """
+    Returns a tropical chart converted to the sidereal zodiac of an ayanamsa.
+    Receives the optional julian date of the syzygy, which is computed if needed.
+
+    """
+    if chart.context.zodiac != const.ZODIAC_TROPICAL:
+        raise ValueError('Sidereal charts must be derived from tropical charts.')
+    if syzygy_jd is None:
+        syzygy_jd = _syzygy_jd(chart)
+
+    context = chart.context
+    res = Chart.__new__(Chart)
+    res.weak_refs = chart.weak_refs
+    res.date = chart.date
+    res.pos = chart.pos
+    res.hsys = chart.hsys
+    res.context = dataclasses.replace(context, zodiac=const.ZODIAC_SIDEREAL,
+                                      ayanamsa=ayanamsa_id)
+    value, speed = ayanamsa(context.jd, ayanamsa_id)
+
+    objects = []
+    for obj in chart.objects:
+        obj_value, obj_speed = value, speed
+        if obj.id == const.SYZYGY:
+            obj_value, obj_speed = ayanamsa(syzygy_jd, ayanamsa_id)
+        obj = _shifted(obj, obj_value, res)
+        # Objects without speed (such as computed points) keep a zero speed
+        if obj.lon_speed:
+            obj.lon_speed -= obj_speed
+        objects.append(obj)
+    res.objects = ObjectList(objects)
+
+    houses = [_shifted(house, value, res) for house in chart.houses]
+    res.angles = GenericList([_shifted(obj, value, res) for obj in chart.angles])
+    if context.hsys == const.HOUSES_WHOLE_SIGN:
+        first = res.angles.get(const.ASC).lon // 30 * 30
+        for i, house in enumerate(houses):
+            house.lon = angle.norm(first + i * 30)
+    res.houses = HouseList(houses)
+    return res
+
+
+def _shifted(obj, value, chart):
+    """ Returns a copy of an object of a chart with the ayanamsa subtracted. """
+    obj = obj.copy()
+    obj.lon = angle.norm(obj.lon - value)
+    obj.chart = chart
+    return obj
+
+
+# ---------------------- #
+#   ZodiacBundle Class   #
+# ---------------------- #
+
+class ZodiacBundle:
+    """
+    This class represents the same chart in the tropical zodiac and in the sidereal zodiacs
+    of several ayanamsas. Charts are indexed by const.ZODIAC_TROPICAL and by the ayanamsa IDs.
+
+    """
+
+    def __init__(self, charts):
+        self.charts = charts
+
+    @classmethod
+    def from_chart(cls, chart, ayanamsas=const.LIST_AYANAMSAS):
+        """ Builds a bundle from a tropical chart and a list of ayanamsas. """
+        charts = {const.ZODIAC_TROPICAL: chart}
+        syzygy_jd = _syzygy_jd(chart)
+        for ayanamsa_id in ayanamsas:
+            charts[ayanamsa_id] = sidereal_chart(chart, ayanamsa_id, syzygy_jd)
+        return cls(charts)
+
+    @classmethod
+    def build(cls, date, pos, ayanamsas=const.LIST_AYANAMSAS, **kwargs):
+        """ Builds a bundle for a date and location, with the optional Chart arguments. """
+        return cls.from_chart(Chart(date, pos, **kwargs), ayanamsas)
+
+    def __getitem__(self, key) -> Chart:
+        return self.charts[key]
+
+    def __iter__(self):
+        return iter(self.charts)
+
+    def __len__(self):
+        return len(self.charts)
+
+    @property
+    def tropical(self) -> Chart:
+        """ Returns the tropical chart. """
+        return self.charts[const.ZODIAC_TROPICAL]
+
+    def lons(self, obj_id) -> dict:
+        """ Returns the longitudes of an object, house or angle in each zodiac. """
+        return {key: chart.get(obj_id).lon for key, chart in self.charts.items()}
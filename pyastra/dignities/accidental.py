@@ -8,9 +8,11 @@ from copy import copy
 
 from pyastra import const
 from pyastra import definitions
+from pyastra import profiling
 from pyastra.core import aspects, angle
 from pyastra.dignities import essential
 from pyastra.tools.chartdynamics import ChartDynamics
+from pyastra.tools.receptions import ReceptionMatrix
 
 # Relations with Sun
 COMBUST = 'Combust'
@@ -170,13 +172,25 @@ HOUSE_SCORES = {
 
 
 class AccidentalDignity:
-    """ This class provides methods to access the accidental dignities of an object in a Chart. """
+    """
+    This class provides methods to access the accidental dignities of an object in a Chart.
+    Receives an optional ReceptionMatrix, which defaults to the one shared by the chart.
 
-    def __init__(self, obj, chart):
+    """
+
+    def __init__(self, obj, chart, receptions=None):
         self.obj = obj
         self.chart = chart
         self.dyn = ChartDynamics(chart)
         self.score_properties = None
+        self._receptions = receptions
+
+    @property
+    def receptions(self) -> ReceptionMatrix:
+        """ Returns the reception matrix of the chart. """
+        if self._receptions is None:
+            self._receptions = self.chart.receptions()
+        return self._receptions
 
     # === Houses === #
 
@@ -250,7 +264,7 @@ class AccidentalDignity:
         planets.remove(self.obj.id)
         mrs = {}
         for obj_id in planets:
-            mr = self.dyn.re_mutual_receptions(self.obj.id, obj_id)
+            mr = self.receptions.re_mutual_receptions(self.obj.id, obj_id)
             if mr:
                 mrs[obj_id] = mr
         return mrs
@@ -288,9 +302,9 @@ class AccidentalDignity:
 
             # Get aspects to the other object
             other_obj = self.chart.get_object(other_id)
-            asp = aspects.get_aspect(self.obj, other_obj, asp_list)
+            asp = aspects.aspect_record(self.obj, other_obj, asp_list)
 
-            if asp.type == const.NO_ASPECT:
+            if asp is None:
                 continue
             if asp.type == const.CONJUNCTION:
                 res.append(asp.type)
@@ -383,7 +397,8 @@ class AccidentalDignity:
         score = {}
 
         # Peregrine
-        is_peregrine = essential.is_peregrine(obj.id, obj.sign, obj.signlon)
+        is_peregrine = essential.is_peregrine(obj.id, obj.sign, obj.signlon,
+                                              essential.chart_config(self.chart))
         score['peregrine'] = -5 if is_peregrine else 0
 
         # Ruler-Ruler and Exalt-Exalt mutual receptions
@@ -469,6 +484,7 @@ class AccidentalDignity:
         return {key: value for (key, value) in score.items()
                 if value != 0}
 
+    @profiling.traced(profiling.OPERATION_ACCIDENTAL_DIGNITIES)
     def score(self):
         """ Returns the sum of the accidental dignities score. """
         if not self.score_properties:
@@ -3,8 +3,15 @@ This module provides useful functions for handling essential dignities. It provi
 an essential dignity table, functions for retrieving information from the table and to compute
 scores and almutems.
 
+Terms and faces have several variants. The module defaults are set with set_terms() and
+set_faces(), and a DignityConfig selects the variants of a single call (or chart, by the terms
+and faces of its ChartContext), so that different variants can be used concurrently.
+
 """
 
+import functools
+from dataclasses import dataclass
+
 from pyastra import const
 from . import tables
 
@@ -17,11 +24,25 @@ EGYPTIAN_TERMS = 'Egyptian Terms'
 TETRABIBLOS_TERMS = 'Tetrabiblos Terms'
 LILLY_TERMS = 'Lilly Terms'
 
+# Tables of each variant
+FACES_VARIANTS = {
+    CHALDEAN_FACES: tables.CHALDEAN_FACES,
+    TRIPLICITY_FACES: tables.TRIPLICITY_FACES,
+}
+TERMS_VARIANTS = {
+    EGYPTIAN_TERMS: tables.EGYPTIAN_TERMS,
+    TETRABIBLOS_TERMS: tables.TETRABIBLOS_TERMS,
+    LILLY_TERMS: tables.LILLY_TERMS,
+}
+
 # Defaults
 FACES = tables.CHALDEAN_FACES
 TERMS = tables.EGYPTIAN_TERMS
 TABLE = tables.ESSENTIAL_DIGNITIES
 
+# Index of each sign in the zodiac
+_SIGN_INDEX = {sign: i for (i, sign) in enumerate(const.LIST_SIGNS)}
+
 
 def set_faces(variant):
     """ Sets the default faces variant. """
@@ -43,6 +64,53 @@ def set_terms(variant):
         TERMS = tables.LILLY_TERMS
 
 
+# ----------------------- #
+#   DignityConfig Class   #
+# ----------------------- #
+
+@dataclass(frozen=True)
+class DignityConfig:
+    """
+    This class represents the terms and faces variants of an essential dignities computation.
+    A None variant stands for the module default, as set by set_terms() and set_faces().
+
+    """
+
+    terms: str | None = None
+    faces: str | None = None
+
+    def __post_init__(self):
+        if self.terms is not None and self.terms not in TERMS_VARIANTS:
+            raise ValueError(f"'{self.terms}' is not a valid terms variant.")
+        if self.faces is not None and self.faces not in FACES_VARIANTS:
+            raise ValueError(f"'{self.faces}' is not a valid faces variant.")
+
+    @property
+    def terms_table(self) -> dict:
+        """ Returns the terms table of this configuration. """
+        return TERMS_VARIANTS[self.terms] if self.terms else TERMS
+
+    @property
+    def faces_table(self) -> dict:
+        """ Returns the faces table of this configuration. """
+        return FACES_VARIANTS[self.faces] if self.faces else FACES
+
+
+@functools.lru_cache(maxsize=None)
+def get_config(terms=None, faces=None) -> DignityConfig:
+    """ Returns the (shared) DignityConfig of a terms and faces variants. """
+    return DignityConfig(terms, faces)
+
+
+# Configuration using the module defaults
+DEFAULT_CONFIG = get_config()
+
+
+def chart_config(chart) -> DignityConfig:
+    """ Returns the DignityConfig of a chart, or the default one if there is no chart. """
+    return chart.context.dignities if chart is not None else DEFAULT_CONFIG
+
+
 # === Table properties === #
 
 def ruler(sign):
@@ -90,18 +158,18 @@ def fall_deg(sign):
     return TABLE[sign]['fall'][1]
 
 
-def term(sign, lon):
+def term(sign, lon, config=None):
     """ Returns the term for a sign and longitude. """
-    terms = TERMS[sign]
+    terms = (config or DEFAULT_CONFIG).terms_table[sign]
     for (obj_id, a, b) in terms:
         if a <= lon < b:
             return obj_id
     return None
 
 
-def face(sign, lon):
+def face(sign, lon, config=None):
     """ Returns the face for a sign and longitude. """
-    faces = FACES[sign]
+    faces = (config or DEFAULT_CONFIG).faces_table[sign]
     if lon < 10:
         return faces[0]
     if lon < 20:
@@ -111,24 +179,58 @@ def face(sign, lon):
 
 # === Complex properties === #
 
-def get_info(sign, lon):
-    """ Returns the complete essential dignities for a sign and longitude. """
+def _compute_info(sign, lon, config):
+    """ Computes the complete essential dignities for a sign and longitude. """
     return {
         'ruler': ruler(sign),
         'exalt': exalt(sign),
         'dayTrip': day_trip(sign),
         'nightTrip': night_trip(sign),
         'partTrip': part_trip(sign),
-        'term': term(sign, lon),
-        'face': face(sign, lon),
+        'term': term(sign, lon, config),
+        'face': face(sign, lon, config),
         'exile': exile(sign),
         'fall': fall(sign)
     }
 
 
-def is_peregrine(obj_id, sign, lon):
+# Cache of essential dignity tables indexed by terms and faces variants
+_INFO_TABLES = {}
+
+
+def get_info_table(config=None) -> list[dict]:
+    """
+    Returns the complete essential dignities for each degree of the zodiac, considering the
+    terms and faces of a DignityConfig (or the current defaults). Since all term and face
+    boundaries are whole degrees, the info of a longitude is given by 'table[int(lon)]'. Tables
+    are computed once per variant.
+
+    """
+    config = config or DEFAULT_CONFIG
+    terms, faces = config.terms_table, config.faces_table
+    key = (id(terms), id(faces))
+    if key not in _INFO_TABLES:
+        _INFO_TABLES[key] = [
+            _compute_info(sign, degree, config) for sign in const.LIST_SIGNS
+            for degree in range(30)
+        ]
+    return _INFO_TABLES[key]
+
+
+def get_info(sign, lon, config=None):
+    """
+    Returns the complete essential dignities for a sign and longitude.
+    Receives an optional DignityConfig with the terms and faces variants.
+
+    """
+    if 0 <= lon < 30:
+        return dict(get_info_table(config)[_SIGN_INDEX[sign] * 30 + int(lon)])
+    return _compute_info(sign, lon, config)
+
+
+def is_peregrine(obj_id, sign, lon, config=None):
     """ Returns if an object is peregrine on a sign and longitude. """
-    info = get_info(sign, lon)
+    info = get_info(sign, lon, config)
     for dign, objID in info.items():
         if dign not in ['exile', 'fall'] and obj_id == objID:
             return False
@@ -150,19 +252,19 @@ SCORES = {
 }
 
 
-def score(obj_id, sign, lon):
+def score(obj_id, sign, lon, config=None):
     """ Returns the score of an object on a sign and longitude. """
-    info = get_info(sign, lon)
+    info = get_info(sign, lon, config)
     dignities = [dign for (dign, objID) in info.items() if objID == obj_id]
     return sum(SCORES[dign] for dign in dignities)
 
 
-def almutem(sign, lon):
+def almutem(sign, lon, config=None):
     """ Returns the almutem for a given sign and longitude. """
     planets = const.LIST_SEVEN_PLANETS
     res = [None, 0]
     for obj_id in planets:
-        sc = score(obj_id, sign, lon)
+        sc = score(obj_id, sign, lon, config)
         if sc > res[1]:
             res = [obj_id, sc]
     return res[0]
@@ -173,20 +275,25 @@ def almutem(sign, lon):
 # ----------------------- #
 
 class EssentialInfo:
-    """ This class represents the Essential dignities information for a given object. """
+    """
+    This class represents the Essential dignities information for a given object.
+    Receives an optional DignityConfig, which defaults to the one of the object's chart.
+
+    """
 
-    def __init__(self, obj):
+    def __init__(self, obj, config=None):
         self.obj = obj
+        self.config = config if config else chart_config(obj.chart)
         # Include info in instance properties
-        info = get_info(obj.sign, obj.signlon)
+        info = get_info(obj.sign, obj.signlon, self.config)
         self.__dict__.update(info)
         # Add score and almutem
-        self.score = score(obj.id, obj.sign, obj.signlon)
-        self.almutem = almutem(obj.sign, obj.signlon)
+        self.score = score(obj.id, obj.sign, obj.signlon, self.config)
+        self.almutem = almutem(obj.sign, obj.signlon, self.config)
 
     def get_info(self):
         """ Returns the essential dignities for this object. """
-        return get_info(self.obj.sign, self.obj.signlon)
+        return get_info(self.obj.sign, self.obj.signlon, self.config)
 
     def get_dignities(self):
         """ Returns the dignities belonging to this object. """
@@ -197,4 +304,4 @@ class EssentialInfo:
 
     def is_peregrine(self):
         """ Returns if this object is peregrine. """
-        return is_peregrine(self.obj.id, self.obj.sign, self.obj.signlon)
+        return is_peregrine(self.obj.id, self.obj.sign, self.obj.signlon, self.config)
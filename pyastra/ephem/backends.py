@@ -0,0 +1,257 @@
+"""
+Implements the ephemeris backends, which compute the positions of the objects, the houses,
+the fixed stars and the rise and set times used by the builder and tools.
+
+There are three backends:
+- SwissBackend: uses the Swiss Ephemeris files (the default);
+- MoshierBackend: uses the analytic Moshier ephemeris of the Swiss Ephemeris, which reads no
+  files and is precise to a few arc-seconds;
+- TableBackend: interpolates the positions of the objects from tables of positions and speeds
+  computed by another backend. Tables are filled on first use or with precompute(), so that
+  high volume jobs over a period of time only compute a few positions per day.
+
+The Swiss and Moshier backends may skip the speeds of the objects, which are then zero, for
+jobs which do not need them. Backends are registered by name and selected per chart with the
+'ephemeris' argument of the ChartContext, or globally with set_default():
+
+    backends.register('No speeds', SwissBackend(speed=False))
+    chart = Chart(date, pos, ephemeris='No speeds')
+
+The registry and the default backend are module globals, so they must be set in each process
+(for instance, in the initializer of a process pool).
+
+"""
+
+import abc
+import dataclasses
+import functools
+import math
+
+from pyastra import const
+from pyastra.context import ChartContext
+from pyastra.core import angle
+from . import swe
+
+# Default step, in days, of the tables
+TABLE_STEP = 1.0
+
+# Default maximum number of table entries kept
+TABLE_SIZE = 100000
+
+
+# ---------------------------- #
+#   EphemerisBackend Classes   #
+# ---------------------------- #
+
+class EphemerisBackend(abc.ABC):
+    """
+    This class represents an ephemeris backend.
+    Subclasses must implement the positions of the objects, houses, fixed stars and transits,
+    or they cannot be instantiated.
+
+    """
+
+    # If the backend computes the speeds of the objects
+    speed = True
+
+    @abc.abstractmethod
+    def object(self, obj_id: str, context: ChartContext) -> tuple:
+        """ Returns the (lon, lat, lon_speed, lat_speed) of an object. """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def object_fast(self, obj_id: str, jd: float) -> tuple:
+        """
+        Returns the (lon, lat, lon_speed, lat_speed) of an object in the tropical zodiac,
+        ignoring the chart context.
+
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def houses(self, context: ChartContext) -> tuple:
+        """ Returns the house cusps and the angles as (asc, mc). """
+        raise NotImplementedError
+
+    def houses_multi(self, context: ChartContext, hsys_list: list) -> dict:
+        """ Returns a dict of house system IDs to the house cusps and angles of the system. """
+        return {hsys: self.houses(dataclasses.replace(context, hsys=hsys)) for hsys in hsys_list}
+
+    @abc.abstractmethod
+    def fixed_star(self, obj_id: str, context: ChartContext) -> tuple:
+        """ Returns the (mag, lon, lat) of a fixed star. """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def next_transit(self, obj_id: str, jd: float, lat: float, lon: float, flag: int) -> float:
+        """ Returns the julian date of the next transit (swe.CALC_RISE or CALC_SET). """
+        raise NotImplementedError
+
+
+class SwissBackend(EphemerisBackend):
+    """
+    This class represents the Swiss Ephemeris backend, which reads the ephemeris files.
+    Receives if the speeds of the objects are computed.
+
+    """
+
+    # Swiss Ephemeris flags of the ephemeris used
+    EPHEMERIS = swe.FLG_SWIEPH
+
+    def __init__(self, speed=True):
+        self.speed = speed
+        self.flags = self.EPHEMERIS | swe.FLG_SPEED if speed else self.EPHEMERIS
+
+    def __repr__(self):
+        return f'{type(self).__name__}(speed={self.speed})'
+
+    def object(self, obj_id, context):
+        return swe.swe_object(obj_id, context, self.flags)
+
+    def object_fast(self, obj_id, jd):
+        return swe.swe_object_fast(obj_id, jd, self.flags)
+
+    def houses(self, context):
+        return swe.swe_houses(context, self.EPHEMERIS)
+
+    def houses_multi(self, context, hsys_list):
+        # Sidereal houses are left to swisseph, which also handles the whole sign houses
+        if context.zodiac != const.ZODIAC_TROPICAL:
+            return super().houses_multi(context, hsys_list)
+        return swe.swe_houses_armc(context, hsys_list, self.EPHEMERIS)
+
+    def fixed_star(self, obj_id, context):
+        return swe.swe_fixed_star(obj_id, context, self.EPHEMERIS)
+
+    def next_transit(self, obj_id, jd, lat, lon, flag):
+        return swe.swe_next_transit(obj_id, jd, lat, lon, flag, self.EPHEMERIS)
+
+
+class MoshierBackend(SwissBackend):
+    """
+    This class represents the analytic Moshier ephemeris backend, which reads no files.
+    Receives if the speeds of the objects are computed.
+
+    """
+
+    EPHEMERIS = swe.FLG_MOSEPH
+
+
+class TableBackend(EphemerisBackend):
+    """
+    This class represents a backend which interpolates the positions of the objects from
+    tables computed by another backend, at julian dates multiple of a step in days.
+
+    Positions are interpolated with cubic Hermite polynomials of the positions and speeds at
+    the two closest table dates. With the default one day step, the error is below 0.001
+    degrees for the Moon and much smaller for the planets. Houses, fixed stars, transits and
+    topocentric positions are computed by the other backend.
+
+    """
+
+    def __init__(self, base=None, step=TABLE_STEP, max_size=TABLE_SIZE):
+        self.base = base if base else SwissBackend()
+        if not self.base.speed:
+            raise ValueError('Table backends need a base backend which computes speeds.')
+        self.step = step
+        self._entry = functools.lru_cache(maxsize=max_size)(self._compute_entry)
+
+    def __repr__(self):
+        return f'TableBackend({self.base!r}, step={self.step})'
+
+    def _compute_entry(self, obj_id, index, zodiac, ayanamsa) -> tuple:
+        """ Returns the table entry of an object at the julian date index * step. """
+        context = ChartContext(jd=index * self.step, lat=0.0, lon=0.0, zodiac=zodiac,
+                               ayanamsa=ayanamsa)
+        return self.base.object(obj_id, context)
+
+    def _interpolate(self, obj_id, jd, zodiac, ayanamsa) -> tuple:
+        """ Returns the interpolated (lon, lat, lon_speed, lat_speed) of an object. """
+        index = math.floor(jd / self.step)
+        lon0, lat0, lon_speed0, lat_speed0 = self._entry(obj_id, index, zodiac, ayanamsa)
+        lon1, lat1, lon_speed1, lat_speed1 = self._entry(obj_id, index + 1, zodiac, ayanamsa)
+        lon1 = lon0 + angle.closest_distance(lon0, lon1)
+
+        h = self.step
+        t = jd / h - index
+        t2, t3 = t * t, t * t * t
+        h00, h10, h01, h11 = 2*t3 - 3*t2 + 1, t3 - 2*t2 + t, -2*t3 + 3*t2, t3 - t2
+        d00, d10, d01, d11 = 6*t2 - 6*t, 3*t2 - 4*t + 1, -6*t2 + 6*t, 3*t2 - 2*t
+        return (
+            angle.norm(h00*lon0 + h10*h*lon_speed0 + h01*lon1 + h11*h*lon_speed1),
+            h00*lat0 + h10*h*lat_speed0 + h01*lat1 + h11*h*lat_speed1,
+            (d00*lon0 + d01*lon1) / h + d10*lon_speed0 + d11*lon_speed1,
+            (d00*lat0 + d01*lat1) / h + d10*lat_speed0 + d11*lat_speed1,
+        )
+
+    def precompute(self, obj_ids, start_jd, end_jd, zodiac=const.ZODIAC_TROPICAL,
+                   ayanamsa=const.AYANANMSA_FAGAN_BRADLEY):
+        """ Fills the tables of a list of objects between two julian dates. """
+        for index in range(math.floor(start_jd / self.step), math.floor(end_jd / self.step) + 2):
+            for obj_id in obj_ids:
+                self._entry(obj_id, index, zodiac, ayanamsa)
+
+    def clear(self):
+        """ Removes all table entries. """
+        self._entry.cache_clear()
+
+    def object(self, obj_id, context):
+        if context.alt > 0.0:
+            return self.base.object(obj_id, context)
+        return self._interpolate(obj_id, context.jd, context.zodiac, context.ayanamsa)
+
+    def object_fast(self, obj_id, jd):
+        return self._interpolate(obj_id, jd, const.ZODIAC_TROPICAL,
+                                 const.AYANANMSA_FAGAN_BRADLEY)
+
+    def houses(self, context):
+        return self.base.houses(context)
+
+    def houses_multi(self, context, hsys_list):
+        return self.base.houses_multi(context, hsys_list)
+
+    def fixed_star(self, obj_id, context):
+        return self.base.fixed_star(obj_id, context)
+
+    def next_transit(self, obj_id, jd, lat, lon, flag):
+        return self.base.next_transit(obj_id, jd, lat, lon, flag)
+
+
+# === Registry === #
+
+BACKENDS = {
+    const.EPHEM_SWISS: SwissBackend(),
+    const.EPHEM_MOSHIER: MoshierBackend(),
+    const.EPHEM_TABLES: TableBackend(),
+}
+
+# Name of the backend used when the context does not select one
+_DEFAULT = const.EPHEM_SWISS
+
+
+def register(name: str, backend: EphemerisBackend):
+    """ Registers a backend, which is selected by name in the chart contexts. """
+    BACKENDS[name] = backend
+
+
+def set_default(name: str):
+    """ Sets the backend used when the context does not select one. """
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown ephemeris backend '{name}'.")
+    global _DEFAULT
+    _DEFAULT = name
+
+
+def get_name(context: ChartContext = None) -> str:
+    """ Returns the name of the backend of a context, or of the default backend. """
+    name = context.ephemeris if context is not None else None
+    return name if name is not None else _DEFAULT
+
+
+def get(context: ChartContext = None) -> EphemerisBackend:
+    """ Returns the backend of a context, or the default backend. """
+    name = get_name(context)
+    try:
+        return BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown ephemeris backend '{name}'.") from None
@@ -1,7 +1,7 @@
 """
 Functions for retrieving astronomical and astrological data from an ephemeris.
     
-It is the middle layer between the Swiss Ephemeris and user software.
+It is the middle layer between the ephemeris backends and user software.
 
 """
 
@@ -15,7 +15,7 @@ from pyastra.core import angle
 from pyastra.core.objects import GenericObject, House, FixedStar, Object
 from pyastra.core.lists import HouseList, GenericList
 from pyastra.context import ChartContext
-from . import swe, tools
+from . import backends, tools
 
 if TYPE_CHECKING:
     from pyastra.core.chart import Chart
@@ -23,8 +23,9 @@ if TYPE_CHECKING:
 
 def create_object(obj_id: str, context: ChartContext, chart: Chart = None) -> Object:
     """Returns an object for a specific date and location."""
+    backend = backends.get(context)
     if obj_id == const.SOUTH_NODE:
-        obj_lon, _, _, _ = swe.swe_object(const.NORTH_NODE, context=context)
+        obj_lon, _, _, _ = backend.object(const.NORTH_NODE, context)
         return Object(id=obj_id, lon=angle.norm(obj_lon + 180), chart=chart)
 
     if obj_id == const.PARS_FORTUNA:
@@ -32,12 +33,12 @@ def create_object(obj_id: str, context: ChartContext, chart: Chart = None) -> Ob
         return Object(id=obj_id, lon=obj_lon, chart=chart)
 
     if obj_id == const.SYZYGY:
-        syzygy_jd = tools.syzygy_jd(context.jd)
+        syzygy_jd = tools.syzygy_jd(context.jd, backend)
         syzygy_context = dataclasses.replace(context, jd=syzygy_jd)
-        obj_lon, obj_lat, lon_speed, lat_speed = swe.swe_object(const.MOON, context=syzygy_context)
+        obj_lon, obj_lat, lon_speed, lat_speed = backend.object(const.MOON, syzygy_context)
 
     else:
-        obj_lon, obj_lat, lon_speed, lat_speed = swe.swe_object(obj_id, context=context)
+        obj_lon, obj_lat, lon_speed, lat_speed = backend.object(obj_id, context)
 
     return Object(
         id = obj_id,
@@ -51,8 +52,12 @@ def create_object(obj_id: str, context: ChartContext, chart: Chart = None) -> Ob
 
 def create_houses_and_angles(context: ChartContext, chart: Chart = None) -> tuple:
     """Returns a tuple with lists of houses and angles."""
-    cusps, ascmc = swe.swe_houses(context=context)
+    cusps, ascmc = backends.get(context).houses(context)
+    return build_houses_and_angles(cusps, ascmc, chart)
 
+
+def build_houses_and_angles(cusps: tuple, ascmc: tuple, chart: Chart = None) -> tuple:
+    """Returns a tuple with lists of houses and angles given the cusps and (asc, mc)."""
     # Append the first cusp to the end to simplify size calculation in the loop
     cusps += (cusps[0],)
     houses = [
@@ -76,7 +81,7 @@ def create_houses_and_angles(context: ChartContext, chart: Chart = None) -> tupl
 
 def create_fixed_star(obj_id: str, context: ChartContext, chart: Chart = None) -> FixedStar:
     """Returns a fixed star."""
-    mag, lon, lat = swe.swe_fixed_star(obj_id, context)
+    mag, lon, lat = backends.get(context).fixed_star(obj_id, context)
     return FixedStar(
         id = obj_id,
         mag = mag,
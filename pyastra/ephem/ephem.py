@@ -11,13 +11,13 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from pyastra import const
+from pyastra import const, profiling
 from pyastra.context import ChartContext
 from pyastra.core.datetime import Datetime
 from pyastra.core.geopos import GeoPos
 from pyastra.core.objects import Object, FixedStar
 from pyastra.core.lists import GenericList, ObjectList, HouseList, FixedStarList
-from . import builder, swe, tools
+from . import backends, builder, swe, tools
 
 if TYPE_CHECKING:
     from pyastra.core.chart import Chart
@@ -88,13 +88,13 @@ def prev_solar_return(lon: float, context: ChartContext) -> Datetime:
 
 def next_sunrise(date: Datetime, pos: GeoPos) -> Datetime:
     """Returns the date of the next sunrise relative to 'date'."""
-    jd = swe.swe_next_transit(const.SUN, date.jd, pos.lat, pos.lon, swe.CALC_RISE)
+    jd = backends.get().next_transit(const.SUN, date.jd, pos.lat, pos.lon, swe.CALC_RISE)
     return Datetime.from_jd(jd, date.utcoffset)
 
 
 def next_sunset(date: Datetime, pos: GeoPos) -> Datetime:
     """Returns the date of the next sunset relative to 'date'."""
-    jd = swe.swe_next_transit(const.SUN, date.jd, pos.lat, pos.lon, swe.CALC_SET)
+    jd = backends.get().next_transit(const.SUN, date.jd, pos.lat, pos.lon, swe.CALC_SET)
     return Datetime.from_jd(jd, date.utcoffset)
 
 
@@ -112,6 +112,7 @@ def prev_sunset(date: Datetime, pos: GeoPos) -> Datetime:
 
 # === Station === #
 
+@profiling.traced(profiling.OPERATION_STATION)
 def find_next_station(obj_id: str, date: Datetime) -> tuple | None:
     """
     Finds the approximate date and type of the next planetary station.
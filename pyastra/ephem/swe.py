@@ -6,6 +6,7 @@ Implements a simple interface with the C Swiss Ephemeris using the pyswisseph li
 # pylint: disable=c-extension-no-member
 
 import threading
+import time
 from contextlib import contextmanager
 
 import swisseph
@@ -58,25 +59,147 @@ SWE_AYANAMSAS = {
     const.AYANANMSA_GALCENTER_0SAG: swisseph.SIDM_GALCENT_0SAG
 }
 
+# Map eclipse types (ordered by precedence)
+SWE_ECLIPSE_TYPES = [
+    (swisseph.ECL_ANNULAR_TOTAL, const.ECLIPSE_HYBRID),
+    (swisseph.ECL_TOTAL, const.ECLIPSE_TOTAL),
+    (swisseph.ECL_ANNULAR, const.ECLIPSE_ANNULAR),
+    (swisseph.ECL_PARTIAL, const.ECLIPSE_PARTIAL),
+    (swisseph.ECL_PENUMBRAL, const.ECLIPSE_PENUMBRAL),
+]
+
+# Version of the Swiss Ephemeris
+SWE_VERSION = swisseph.version
+
 # Flags
 CALC_RISE = swisseph.CALC_RISE
 CALC_SET = swisseph.CALC_SET
+FLG_SWIEPH = swisseph.FLG_SWIEPH
+FLG_MOSEPH = swisseph.FLG_MOSEPH
+FLG_SPEED = swisseph.FLG_SPEED
+
+# Default ephemeris flags: use the Swiss Ephemeris files and compute the speeds
+SWE_FLAGS = FLG_SWIEPH | FLG_SPEED
 
 # Thread lock
 SWE_LOCK = threading.Lock()
 
+# Path of the swe files. Swisseph keeps its state per thread, so the path is also set on the
+# first call of each thread.
+_PATH = None
+_THREAD = threading.local()
+
+
+# === Instrumentation === #
+
+# The original module and lock, restored when the instrumentation is removed
+_SWISSEPH = swisseph
+_SWE_LOCK = SWE_LOCK
+
+# Position of the body argument of the traced functions
+TRACED_BODY_ARGS = {
+    'calc_ut': 1,
+    'houses_ex': 3,
+    'houses_armc': 3,
+    'fixstar2_ut': 0,
+    'fixstar2_mag': 0,
+    'rise_trans': 1,
+}
+
+# Body names indexed by swisseph body and house system IDs
+_BODY_NAMES = {value: key for key, value in SWE_OBJECTS.items()}
+_BODY_NAMES.update({value: key for key, value in SWE_HOUSESYS.items()})
+
+
+class _TracedLock:
+    """ Wraps the swisseph lock to record the time waiting for it. """
+
+    def __init__(self, lock, recorder):
+        self.lock = lock
+        self.recorder = recorder
+
+    def acquire(self, *args):
+        start = time.perf_counter()
+        res = self.lock.acquire(*args)
+        self.recorder.record_lock_wait(time.perf_counter() - start)
+        return res
+
+    def release(self):
+        self.lock.release()
+
+    def __enter__(self):
+        return self.acquire()
+
+    def __exit__(self, *args):
+        self.release()
+
+
+class _TracedSwisseph:
+    """ Wraps the swisseph module to record the calls and the time spent in each function. """
+
+    def __init__(self, module, recorder):
+        self.module = module
+        self.recorder = recorder
+        self.functions = {}
+
+    def _wrap(self, name, func):
+        """ Returns a function which records the calls to a swisseph function. """
+        recorder = self.recorder
+        body_arg = TRACED_BODY_ARGS.get(name)
+
+        def traced(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                body = None
+                if body_arg is not None and len(args) > body_arg:
+                    body = args[body_arg]
+                    body = _BODY_NAMES.get(body, body)
+                recorder.record_call(name, body, elapsed)
+
+        return traced
+
+    def __getattr__(self, name):
+        if name not in self.functions:
+            value = getattr(self.module, name)
+            if not callable(value):
+                return value
+            self.functions[name] = self._wrap(name, value)
+        return self.functions[name]
+
+
+def instrument(recorder):
+    """
+    Installs (or removes, if recorder is None) the instrumentation of the swisseph calls.
+
+    The recorder must implement record_call(function, body, elapsed) and
+    record_lock_wait(elapsed). When the instrumentation is not installed, the module uses
+    swisseph and its lock directly, so there is no overhead.
+
+    """
+    global swisseph, SWE_LOCK
+    if recorder is None:
+        swisseph = _SWISSEPH
+        SWE_LOCK = _SWE_LOCK
+    else:
+        swisseph = _TracedSwisseph(_SWISSEPH, recorder)
+        SWE_LOCK = _TracedLock(_SWE_LOCK, recorder)
+
 
 @contextmanager
-def swe_context(context: ChartContext):
+def swe_context(context: ChartContext, flags: int = SWE_FLAGS):
     """
     Context manager to safely set and reset swisseph's global state.
     It acquires a lock, sets the topographic and sidereal modes based on the chart context,
     yields control, and then reliably cleans up.
+    The ephemeris flags (by default, the Swiss Ephemeris with speeds) are yielded with the
+    topocentric and sidereal flags of the context.
     """
     SWE_LOCK.acquire()
     try:
-        # Get the speed and use the Swiss Ephemeris
-        flags = swisseph.FLG_SPEED | swisseph.FLG_SWIEPH
+        _set_thread_path()
 
         # Consider topocentric positions
         if context.alt > 0.0:
@@ -102,35 +225,45 @@ def swe_context(context: ChartContext):
 
 def set_path(path: str):
     """ Sets the path for the swe files. """
-    swisseph.set_ephe_path(path)
+    global _PATH
+    _PATH = path
+    _set_thread_path()
 
 
-def swe_object(obj_id: str, context: ChartContext) -> tuple:
+def _set_thread_path():
+    """ Sets the path for the swe files in the current thread, if not set. """
+    if getattr(_THREAD, 'path', None) != _PATH:
+        swisseph.set_ephe_path(_PATH)
+        _THREAD.path = _PATH
+
+
+def swe_object(obj_id: str, context: ChartContext, flags: int = SWE_FLAGS) -> tuple:
     """
     Get raw positional data of an object from the ephemeris.
 
     Returns: tuple with (lon, lat, lon_speed, lat_speed).
     """
-    with swe_context(context) as flags:
+    with swe_context(context, flags) as flags:
         swe_obj = SWE_OBJECTS[obj_id]
         swe_list, _ = swisseph.calc_ut(context.jd, swe_obj, flags)
 
     return swe_list[0], swe_list[1], swe_list[3], swe_list[4]
 
 
-def swe_object_fast(obj_id: str, jd: float) -> tuple:
+def swe_object_fast(obj_id: str, jd: float, flags: int = SWE_FLAGS) -> tuple:
     """
     Get raw positional data of an object from the ephemeris, ignoring any context such as
     zodiac type, ayanamsa, etc.
 
     Returns: tuple with (lon, lat, lon_speed, lat_speed).
     """
+    _set_thread_path()
     swe_obj = SWE_OBJECTS[obj_id]
-    swe_list, _ = swisseph.calc_ut(jd, swe_obj, swisseph.FLG_SPEED)
+    swe_list, _ = swisseph.calc_ut(jd, swe_obj, flags)
     return swe_list[0], swe_list[1], swe_list[3], swe_list[4]
 
 
-def swe_houses(context: ChartContext) -> tuple:
+def swe_houses(context: ChartContext, flags: int = SWE_FLAGS) -> tuple:
     """
     Get the list of houses cusps and angles from the ephemeris.
 
@@ -139,7 +272,7 @@ def swe_houses(context: ChartContext) -> tuple:
     as defined in swehouse.c.
     Returns: tuple with (1) the house cusps and (2) the angles as (asc, mc).
     """
-    with swe_context(context) as flags:
+    with swe_context(context, flags) as flags:
         hsys = SWE_HOUSESYS[context.hsys]
         cusps, ascmc = swisseph.houses_ex(context.jd, context.lat, context.lon, hsys, flags)
         angles = (ascmc[0], ascmc[1])
@@ -147,27 +280,130 @@ def swe_houses(context: ChartContext) -> tuple:
     return cusps, angles
 
 
-def swe_fixed_star(obj_id: str, context: ChartContext) -> tuple:
+def swe_houses_armc(context: ChartContext, hsys_list: list, flags: int = SWE_FLAGS) -> dict:
+    """
+    Get the house cusps and angles of several house systems in the tropical zodiac.
+
+    The ARMC and the obliquity of the ecliptic are computed once and shared by all systems.
+    Returns: dict of house system IDs to tuples with (1) the house cusps and (2) the angles.
+    """
+    with swe_context(context, flags):
+        gst, eps = _sidtime(context.jd, flags)
+        armc = (gst + context.lon) % 360
+        res = {}
+        for hsys in hsys_list:
+            cusps, ascmc = swisseph.houses_armc(armc, context.lat, eps, SWE_HOUSESYS[hsys])
+            res[hsys] = (cusps, (ascmc[0], ascmc[1]))
+
+    return res
+
+
+def _sidtime(jd: float, flags: int) -> tuple:
+    """ Returns the Greenwich sidereal time in degrees and the true obliquity of the ecliptic. """
+    eps = swisseph.calc_ut(jd, swisseph.ECL_NUT, flags)[0][0]
+    return swisseph.sidtime(jd) * 15, eps
+
+
+def swe_sidtime(jd: float, flags: int = SWE_FLAGS) -> tuple:
+    """
+    Get the sidereal time and obliquity of the ecliptic at a julian date.
+
+    Returns: tuple with (Greenwich sidereal time in degrees, true obliquity of the ecliptic).
+    """
+    with SWE_LOCK:
+        _set_thread_path()
+        return _sidtime(jd, flags)
+
+
+def swe_houses_armcs(armcs: list, lats: list, eps: float, hsys: str) -> list:
+    """
+    Get the house cusps and angles of a house system in the tropical zodiac for lists of ARMCs
+    and latitudes, given the obliquity of the ecliptic.
+
+    Returns: list with tuples with (1) the house cusps and (2) the angles as (asc, mc).
+    """
+    swe_hsys = SWE_HOUSESYS[hsys]
+    res = []
+    with SWE_LOCK:
+        for armc, lat in zip(armcs, lats):
+            cusps, ascmc = swisseph.houses_armc(armc, lat, eps, swe_hsys)
+            res.append((cusps, (ascmc[0], ascmc[1])))
+    return res
+
+
+def swe_fixed_star(obj_id: str, context: ChartContext, flags: int = SWE_FLAGS) -> tuple:
     """
     Get a fixed star from the ephemeris.
 
     Caution: the swisseph.fixstar2_mag function is slow because it parses 'fixstars.cat' every time.
     Returns: tuple with (mag, lon, lat).
     """
-    with swe_context(context) as flags:
+    with swe_context(context, flags) as flags:
         swe_list, _, _ = swisseph.fixstar2_ut(obj_id, context.jd, flags)
         mag = swisseph.fixstar2_mag(obj_id)
 
     return mag[0], swe_list[0], swe_list[1]
 
 
-def swe_next_transit(obj_id: str, jd: float, lat: float, lon: float, flag: int) -> float:
+def swe_next_transit(obj_id: str, jd: float, lat: float, lon: float, flag: int,
+                     flags: int = FLG_SWIEPH) -> float:
     """
     Get the julian date of the next transit of an object.
 
     Transit can be CALC_RISE, CALC_SET, or CALC_MTRANSIT (for meridian)
     Returns a float with the julian date.
     """
+    _set_thread_path()
     swe_obj = SWE_OBJECTS[obj_id]
-    trans = swisseph.rise_trans(jd, swe_obj, flag, (lon, lat, 0))
+    trans = swisseph.rise_trans(jd, swe_obj, flag, (lon, lat, 0), flags=flags)
     return trans[1][0]
+
+
+def _eclipse_type(flags: int) -> str:
+    """ Returns the eclipse type given the swisseph eclipse flags. """
+    for swe_flag, ecl_type in SWE_ECLIPSE_TYPES:
+        if flags & swe_flag:
+            return ecl_type
+    return const.ECLIPSE_PARTIAL
+
+
+def swe_next_solar_eclipse(jd: float, backwards: bool = False) -> tuple:
+    """
+    Get the next (or previous) global solar eclipse relative to a julian date.
+
+    The magnitude is the NASA eclipse magnitude at the point of greatest eclipse.
+    Returns: tuple with (jd of maximum eclipse, eclipse type, magnitude).
+    """
+    _set_thread_path()
+    flags, tret = swisseph.sol_eclipse_when_glob(jd, swisseph.FLG_SWIEPH, 0, backwards)
+    _, _, attr = swisseph.sol_eclipse_where(tret[0], swisseph.FLG_SWIEPH)
+    return tret[0], _eclipse_type(flags), attr[8]
+
+
+def swe_next_lunar_eclipse(jd: float, backwards: bool = False) -> tuple:
+    """
+    Get the next (or previous) lunar eclipse relative to a julian date.
+
+    The magnitude is the umbral magnitude, or the penumbral magnitude for penumbral eclipses.
+    Returns: tuple with (jd of maximum eclipse, eclipse type, magnitude).
+    """
+    _set_thread_path()
+    flags, tret = swisseph.lun_eclipse_when(jd, swisseph.FLG_SWIEPH, 0, backwards)
+    _, attr = swisseph.lun_eclipse_how(tret[0], (0, 0, 0), swisseph.FLG_SWIEPH)
+    magnitude = attr[0] if attr[0] > 0 else attr[1]
+    return tret[0], _eclipse_type(flags), magnitude
+
+
+def swe_ayanamsa(jd: float, ayanamsa: str) -> float:
+    """
+    Get the value of an ayanamsa at a julian date.
+    Sidereal longitudes are the tropical longitudes minus the ayanamsa.
+    """
+    with SWE_LOCK:
+        try:
+            _set_thread_path()
+            swisseph.set_sid_mode(SWE_AYANAMSAS[ayanamsa])
+            _, aya = swisseph.get_ayanamsa_ex_ut(jd, swisseph.FLG_SWIEPH)
+            return aya
+        finally:
+            swisseph.set_sid_mode(0)
@@ -8,7 +8,7 @@ from pyastra import const, utils
 from pyastra.core import angle
 from pyastra.context import ChartContext
 
-from . import swe
+from . import backends
 
 # One arc-second error for iterative algorithms
 MAX_ERROR = 0.0003
@@ -19,8 +19,9 @@ def is_diurnal(context: ChartContext) -> bool:
     Returns if the sun is above the horizon for a given date and location.
     It computes the result using the sun's and MC's Right Ascension and Declination values.
     """
-    sun_lon, sun_lat, _, _ = swe.swe_object(const.SUN, context=context)
-    _, angles = swe.swe_houses(context=context)
+    backend = backends.get(context)
+    sun_lon, sun_lat, _, _ = backend.object(const.SUN, context)
+    _, angles = backend.houses(context)
     mc_lon = angles[1]
     sun_ra, sun_decl = utils.eq_coords(sun_lon, sun_lat)
     mc_ra, _ = utils.eq_coords(mc_lon, 0.0)
@@ -32,9 +33,10 @@ def pars_fortuna_lon(context: ChartContext) -> float:
     Returns the ecliptic longitude of Pars Fortuna.
     It computes the longitude using the respective diurnal and nocturnal formulas.
     """
-    sun_lon, _, _, _ = swe.swe_object(const.SUN, context=context)
-    moon_lon, _, _, _ = swe.swe_object(const.MOON, context=context)
-    asc_lon = swe.swe_houses(context)[1][0]
+    backend = backends.get(context)
+    sun_lon, _, _, _ = backend.object(const.SUN, context)
+    moon_lon, _, _, _ = backend.object(const.MOON, context)
+    asc_lon = backend.houses(context)[1][0]
 
     if is_diurnal(context):
         return angle.norm(asc_lon + moon_lon - sun_lon)
@@ -43,21 +45,23 @@ def pars_fortuna_lon(context: ChartContext) -> float:
 
 # === Iterative algorithms === #
 
-def syzygy_jd(jd: float) -> float:
+def syzygy_jd(jd: float, backend: backends.EphemerisBackend = None) -> float:
     """
     Finds the previous new moon or full moon and returns the julian date of that event.
     The syzygy is the location of the pre-natal moon (new moon or full moon).
+    Uses the given ephemeris backend, or the default one.
     """
-    sun_lon, _, _, _ = swe.swe_object_fast(const.SUN, jd)
-    moon_lon, _, _, _ = swe.swe_object_fast(const.MOON, jd)
+    backend = backend if backend else backends.get()
+    sun_lon, _, _, _ = backend.object_fast(const.SUN, jd)
+    moon_lon, _, _, _ = backend.object_fast(const.MOON, jd)
     dist = angle.distance(sun_lon, moon_lon)
 
     # Offset represents the Syzygy type, where zero is conjunction and 180 is opposition.
     offset = 180 if (dist >= 180) else 0
     while abs(dist) > MAX_ERROR:
         jd = jd - dist / 13.1833  # Moon mean daily motion
-        sun_lon, _, _, _ = swe.swe_object_fast(const.SUN, jd)
-        moon_lon, _, _, _ = swe.swe_object_fast(const.MOON, jd)
+        sun_lon, _, _, _ = backend.object_fast(const.SUN, jd)
+        moon_lon, _, _, _ = backend.object_fast(const.MOON, jd)
         dist = angle.closest_distance(sun_lon - offset, moon_lon)
     return jd
 
@@ -67,7 +71,8 @@ def solar_return_jd(lon: float, context: ChartContext, forward: bool=True) -> fl
     Finds the julian date before or after 'jd' when the sun is at longitude given by 'lon'.
     It searches forward by default.
     """
-    sun_lon, _, _, _ = swe.swe_object(const.SUN, context=context)
+    backend = backends.get(context)
+    sun_lon, _, _, _ = backend.object(const.SUN, context)
     if forward:
         dist = angle.distance(sun_lon, lon)
     else:
@@ -76,7 +81,7 @@ def solar_return_jd(lon: float, context: ChartContext, forward: bool=True) -> fl
     while abs(dist) > MAX_ERROR:
         jd = context.jd + dist / 0.9833  # Sun mean daily motion
         context = dataclasses.replace(context, jd = jd)
-        sun_lon, _, _, _ = swe.swe_object(const.SUN, context=context)
+        sun_lon, _, _, _ = backend.object(const.SUN, context)
         dist = angle.closest_distance(sun_lon, lon)
     return context.jd
 
@@ -89,10 +94,11 @@ def find_next_station(obj_id: str, jd: float) -> tuple | None:
     Returns a tuple containing the julian date and the type of station (direct to retrograde or
     vice versa).
     """
-    _, _, initial_speed, _ = swe.swe_object_fast(obj_id, jd)
+    backend = backends.get()
+    _, _, initial_speed, _ = backend.object_fast(obj_id, jd)
     for i in range(1, 2000):
         next_jd = jd + i / 2
-        _, _, next_lon_speed, _ = swe.swe_object_fast(obj_id, next_jd)
+        _, _, next_lon_speed, _ = backend.object_fast(obj_id, next_jd)
         if initial_speed * next_lon_speed <= 0:
             if initial_speed > 0:
                 station_type = const.STATION_TO_RETROGRADE
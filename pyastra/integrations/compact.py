@@ -0,0 +1,274 @@
+"""
+This module provides a token-compact encoding of a chart for LLM prompts.
+
+The textual descriptions of the llm module repeat the same English sentences for every planet,
+house and aspect. The compact encoding writes each section as a table, with one row per line and
+fields separated by '|', using abbreviations explained in a legend. The legend is sent only once
+(for instance in the system prompt), so each chart only costs its rows.
+
+The encoding has the same information as the textual descriptions. The number of primary
+directions can be capped, keeping the ones with smaller arcs.
+
+"""
+
+import math
+
+from pyastra import const
+from pyastra.core import angle
+from pyastra.tools.receptions import DEBILITIES
+
+from .rendering import (
+    SECTION_PLANETS,
+    SECTION_HOUSES,
+    SECTION_ESSENTIAL_DIGNITIES,
+    SECTION_ACCIDENTAL_DIGNITIES,
+    SECTION_RECEPTIONS,
+    SECTION_ASPECTS,
+    SECTION_PRIMARY_DIRECTIONS,
+    CHART_SECTIONS,
+)
+from .schemas import SchemaBuilder
+
+# All sections of the compact encoding
+ALL_SECTIONS = CHART_SECTIONS + [SECTION_PRIMARY_DIRECTIONS]
+
+# Columns of each section
+SECTION_COLUMNS = {
+    SECTION_PLANETS: 'object|position|house',
+    SECTION_HOUSES: 'house|position|ruler',
+    SECTION_ESSENTIAL_DIGNITIES: 'object|dignities|score',
+    SECTION_ACCIDENTAL_DIGNITIES: 'object|score|factor:score,...',
+    SECTION_RECEPTIONS: 'object|dispositor|object:dignity/dignity,...',
+    SECTION_ASPECTS: 'active|aspect|passive|movement|orb',
+    SECTION_PRIMARY_DIRECTIONS: 'arc|promissor|significator|type',
+}
+
+# Abbreviations
+OBJECT_ABBREVIATIONS = {
+    const.SUN: 'Su',
+    const.MOON: 'Mo',
+    const.MERCURY: 'Me',
+    const.VENUS: 'Ve',
+    const.MARS: 'Ma',
+    const.JUPITER: 'Ju',
+    const.SATURN: 'Sa',
+    const.URANUS: 'Ur',
+    const.NEPTUNE: 'Ne',
+    const.PLUTO: 'Pl',
+    const.CHIRON: 'Ch',
+    const.NORTH_NODE: 'NN',
+    const.SOUTH_NODE: 'SN',
+    const.SYZYGY: 'Sy',
+    const.PARS_FORTUNA: 'PF',
+}
+
+SIGN_ABBREVIATIONS = {sign: sign[:3] for sign in const.LIST_SIGNS}
+
+MOVEMENT_ABBREVIATIONS = {
+    const.APPLICATIVE: 'A',
+    const.SEPARATIVE: 'S',
+    const.EXACT: 'X',
+}
+
+DIRECTION_TYPE_ABBREVIATIONS = {
+    const.PD_TYPE_ZODIACAL: 'Z',
+    const.PD_TYPE_MUNDANE: 'M',
+}
+
+# Average number of characters per token used to estimate token counts
+CHARS_PER_TOKEN = 4
+
+
+# === Legend === #
+
+def _legend_items(abbreviations) -> str:
+    """ Returns the items of an abbreviation table as text. """
+    return ', '.join(f'{abbr}={name}' for name, abbr in abbreviations.items())
+
+
+def legend(sections=ALL_SECTIONS) -> str:
+    """
+    Returns the legend of the compact encoding for the given sections.
+    It only needs to be sent once, before any compact chart.
+
+    """
+    lines = [
+        "Compact chart encoding. Each section starts with its [name] and has one row per line, "
+        "with fields separated by '|'.\n",
+    ]
+    lines.extend(f"[{section}] {SECTION_COLUMNS[section]}\n" for section in sections)
+    lines.append("Positions and orbs are degrees:minutes:seconds, positions within the sign.\n")
+    lines.append(f"Objects: {_legend_items(OBJECT_ABBREVIATIONS)}. Angles use their names.\n")
+    lines.append(f"Signs: {_legend_items(SIGN_ABBREVIATIONS)}.\n")
+    lines.append("Houses: H1 to H12.\n")
+    if SECTION_ASPECTS in sections or SECTION_PRIMARY_DIRECTIONS in sections:
+        aspect_names = ', '.join(f'{asp}={name}' for asp, name in const.ASPECT_NAMES.items())
+        lines.append(f"Aspects (in degrees): {aspect_names}.\n")
+    if SECTION_ASPECTS in sections:
+        lines.append(f"Movements: {_legend_items(MOVEMENT_ABBREVIATIONS)}.\n")
+    if SECTION_RECEPTIONS in sections:
+        lines.append("Receptions: 'X:a/b' is a mutual reception where the object receives X by "
+                     "a and X receives the object by b. Dispositor chains follow the dispositor "
+                     "column.\n")
+    if SECTION_PRIMARY_DIRECTIONS in sections:
+        lines.append(
+            "Direction points: 'X' body of X, 'X/a' aspect a of X, 'X/aD' dexter and 'X/aS' "
+            "sinister aspect a of X, 'X/A' antiscia and 'X/C' contra-antiscia of X, "
+            "'T:X/s' terms of X in sign s.\n"
+        )
+        lines.append(f"Direction types: {_legend_items(DIRECTION_TYPE_ABBREVIATIONS)}.\n")
+    return "".join(lines)
+
+
+# === Encoding === #
+
+def _obj(obj_id) -> str:
+    """ Returns the abbreviation of an object ID. """
+    return OBJECT_ABBREVIATIONS.get(obj_id, obj_id)
+
+
+def _house(house) -> str:
+    """ Returns the abbreviation of a house. """
+    return f'H{house.num()}'
+
+
+def _angle(value) -> str:
+    """ Returns an angle as degrees:minutes:seconds. """
+    return angle.to_string(value).lstrip('+')
+
+
+def _position(obj) -> str:
+    """ Returns the position of an object or house in its sign. """
+    return f'{_angle(obj.signlon)} {SIGN_ABBREVIATIONS[obj.sign]}'
+
+
+def _direction_point(point) -> str:
+    """ Returns the abbreviation of a primary direction point. """
+    obj_id = _obj(point.obj_id)
+    if point.point_type == const.PD_POINT_TYPE_TERM:
+        return f'T:{obj_id}/{SIGN_ABBREVIATIONS[point.term_sign]}'
+    if point.point_type == const.PD_POINT_TYPE_DEXTER_ASPECT:
+        return f'{obj_id}/{point.aspect}D'
+    if point.point_type == const.PD_POINT_TYPE_SINISTER_ASPECT:
+        return f'{obj_id}/{point.aspect}S'
+    if point.point_type == const.PD_POINT_TYPE_ANTISCIA:
+        return f'{obj_id}/A'
+    if point.point_type == const.PD_POINT_TYPE_CONTRA_ANTISCIA:
+        return f'{obj_id}/C'
+    if point.aspect != 0:
+        return f'{obj_id}/{point.aspect}'
+    return obj_id
+
+
+def top_directions(chart, max_directions=None, **filters) -> list:
+    """
+    Returns the primary directions of a chart filtered as in PDTable.filter_by, keeping at most
+    'max_directions' directions ranked by arc.
+
+    """
+    directions = chart.primary_directions().filter_by(**filters)
+    return directions if max_directions is None else directions[:max_directions]
+
+
+def encode_section(chart, section, builder=None, max_directions=None, **pd_filters) -> str:
+    """
+    Returns a section of a chart in compact format.
+    Receives an optional SchemaBuilder to share dignities and aspects between sections.
+
+    """
+    builder = builder if builder else SchemaBuilder(chart, const.MAJOR_ASPECTS)
+    rows = []
+
+    if section == SECTION_PLANETS:
+        for obj in chart.objects:
+            rows.append(f'{_obj(obj.id)}|{_position(obj)}|{_house(builder.house(obj))}')
+
+    elif section == SECTION_HOUSES:
+        for house in chart.houses:
+            rows.append(f'{_house(house)}|{_position(house)}|{_obj(house.ruler)}')
+
+    elif section == SECTION_ESSENTIAL_DIGNITIES:
+        for obj in chart.objects:
+            info = builder.essential_dignities(obj)
+            rows.append(f'{_obj(obj.id)}|{",".join(info.get_dignities())}|{info.score}')
+
+    elif section == SECTION_ACCIDENTAL_DIGNITIES:
+        for obj in chart.objects:
+            dig, score = builder.accidental_dignities(obj)
+            if score is None:
+                continue
+            factors = ','.join(f'{key}:{value}' for key, value in dig.score_properties.items()
+                               if value != 0)
+            rows.append(f'{_obj(obj.id)}|{score}|{factors}')
+
+    elif section == SECTION_RECEPTIONS:
+        # Each mutual reception is listed once, by its first planet
+        receptions = builder.receptions
+        for i, id_a in enumerate(receptions.planets):
+            mutual = ','.join(f'{_obj(id_b)}:{dign_a}/{dign_b}'
+                              for id_b in receptions.planets[i + 1:]
+                              for dign_a, dign_b in receptions.mutual_receptions(id_a, id_b)
+                              if dign_a not in DEBILITIES and dign_b not in DEBILITIES)
+            rows.append(f'{_obj(id_a)}|{_obj(receptions.dispositor(id_a))}|{mutual}')
+
+    elif section == SECTION_ASPECTS:
+        # Each aspect is listed once, by its active object
+        for obj in chart.objects:
+            for aspect in builder.aspects(obj):
+                movement = MOVEMENT_ABBREVIATIONS.get(aspect.active.movement,
+                                                      aspect.active.movement)
+                rows.append(f'{_obj(aspect.active.id)}|{aspect.type}|{_obj(aspect.passive.id)}|'
+                            f'{movement}|{_angle(aspect.orb)}')
+
+    elif section == SECTION_PRIMARY_DIRECTIONS:
+        for direction in top_directions(chart, max_directions, **pd_filters):
+            rows.append(f'{direction.arc:.4f}|{_direction_point(direction.promissor)}|'
+                        f'{_direction_point(direction.significator)}|'
+                        f'{DIRECTION_TYPE_ABBREVIATIONS[direction.direction_type]}')
+
+    else:
+        raise ValueError(f"'{section}' is not a valid section.")
+
+    return f"[{section}]\n" + "".join(f"{row}\n" for row in rows)
+
+
+def stream(chart, sections=CHART_SECTIONS, max_directions=None, **pd_filters):
+    """ Generates the (section, text) pairs of a chart in compact format. """
+    builder = SchemaBuilder(chart, const.MAJOR_ASPECTS)
+    for section in sections:
+        yield section, encode_section(chart, section, builder, max_directions, **pd_filters)
+
+
+def encode_chart(chart, sections=CHART_SECTIONS, with_legend=False, max_directions=None,
+                 **pd_filters) -> str:
+    """
+    Returns a chart in compact format, optionally preceded by the legend.
+    Receives optional filters and a maximum number of primary directions.
+
+    """
+    text = ''.join(text for _, text in stream(chart, sections, max_directions, **pd_filters))
+    return legend(sections) + text if with_legend else text
+
+
+# === Measurement === #
+
+def estimate_tokens(text) -> int:
+    """ Returns an estimate of the number of tokens of a text. """
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def measure(sections) -> dict:
+    """
+    Returns the size of each section given an iterable of (section, text) pairs, such as the
+    ones generated by stream() or ChartRenderer.stream(). Each value is a dict with the number
+    of characters and the estimated number of tokens, and the 'total' key has the totals.
+
+    """
+    res = {}
+    for section, text in sections:
+        res[section] = {'chars': len(text), 'tokens': estimate_tokens(text)}
+    res['total'] = {
+        'chars': sum(values['chars'] for values in res.values()),
+        'tokens': sum(values['tokens'] for values in res.values()),
+    }
+    return res
@@ -8,6 +8,7 @@ import json
 
 from pyastra import const
 from pyastra.core import aspects, angle
+from pyastra.tools.receptions import DEBILITIES
 
 from . import schemas
 
@@ -120,96 +121,120 @@ if debilitated, more difficult.
 
 def describe_planets(chart):
     """ Returns the chart objects as text. """
-    text = ""
+    lines = []
     for obj in chart.objects:
         house = chart.houses.get_object_house(obj)
-        text += f"{obj.id} is at {angle.to_string(obj.signlon)} of {obj.sign} in {house.id}.\n"
+        lines.append(f"{obj.id} is at {angle.to_string(obj.signlon)} of {obj.sign} in {house.id}.\n")
 
-    return text
+    return "".join(lines)
 
 
 def describe_houses(chart):
     """ Returns the chart houses as text. """
-    text = ""
+    lines = []
     for house in chart.houses:
-        text += f"{house.id} is at {angle.to_string(house.signlon)} of {house.sign} "
-
         # House ruler
-        ruler_id = house.ruler
-        ruler = chart.get(ruler_id)
-        text += f"and is ruled by {ruler.id}.\n"
+        ruler = chart.get(house.ruler)
+        lines.append(f"{house.id} is at {angle.to_string(house.signlon)} of {house.sign} "
+                     f"and is ruled by {ruler.id}.\n")
 
-    return text
+    return "".join(lines)
 
 
 def describe_essential_dignities(chart):
     """ Return the essential dignities of the chart objects as text. """
-    text = ""
+    lines = []
     for obj in chart.objects:
         info = obj.essential_dignities()
         dignities = info.get_dignities()
         if dignities:
-            text += f"{obj.id} has the following essential dignities: "
-            text += ', '.join(dignities) + ", "
+            line = f"{obj.id} has the following essential dignities: {', '.join(dignities)}, "
         else:
-            text += f"{obj.id} has no essential dignities, "
-        text += f"with a total essential dignity score of {info.score}. \n"
+            line = f"{obj.id} has no essential dignities, "
+        lines.append(f"{line}with a total essential dignity score of {info.score}. \n")
 
-    return text
+    return "".join(lines)
 
 
 def describe_accidental_dignities(chart):
     """ Returns the accidental dignities of the chart objects as text. """
-    text = ""
+    lines = []
     for obj in chart.objects:
         dig = obj.accidental_dignities()
         try:
-            dig.score()
-            rows = []
-            for key, value in dig.score_properties.items():
-                if value != 0:
-                    rows.append((key, value))
-            text += f"{obj.id} has the following list of accidental dignities, with their scores: "
-            for (d, score) in rows:
-                text += f"{d} ({score}), "
-            text += f"with a total accidental dignity score of {dig.score()}.\n"
+            score = dig.score()
         except ValueError:
-            pass
+            continue
+        rows = "".join(f"{key} ({value}), " for key, value in dig.score_properties.items()
+                       if value != 0)
+        lines.append(f"{obj.id} has the following list of accidental dignities, with their "
+                     f"scores: {rows}with a total accidental dignity score of {score}.\n")
 
-    return text
+    return "".join(lines)
 
 
 def describe_aspects(chart, asp_list=const.MAJOR_ASPECTS):
     """ Returns the aspects of the chart as text. """
-    lines = []
-    for obj1 in chart.objects:
-        for obj2 in chart.objects:
-            # Ignore same object
-            if obj1 == obj2:
-                continue
-
-            aspect = aspects.get_aspect(obj1, obj2, asp_list)
-            if not aspect or aspect.type == const.NO_ASPECT:
+    objs = list(chart.objects)
+    rows = []
+
+    # The aspect between two objects does not depend on their order, so each pair is computed once
+    for i, obj1 in enumerate(objs):
+        for obj2 in objs[i + 1:]:
+            aspect = aspects.aspect_record(obj1, obj2, asp_list)
+            if aspect is None:
                 continue
 
             string = (f"{aspect.active.id} is on a {aspect.active.movement} "
                       f"{const.ASPECT_NAMES[aspect.type]} to {aspect.passive.id} with a orb of "
                       f"{angle.to_string(aspect.orb)}.")
-            lines.append(string)
+            key = (const.LIST_OBJECTS.index(aspect.active.id),
+                   const.LIST_OBJECTS.index(aspect.passive.id))
+            rows.append((key, string))
 
-    # Return
-    return "\n".join(sorted(set(lines), key=lambda s: const.LIST_OBJECTS.index(s.split(" ")[0])))
+    # Return sorted by active and passive objects
+    return "\n".join(string for _, string in sorted(rows))
+
+
+def describe_receptions(chart, receptions=None):
+    """
+    Returns the mutual receptions and dispositors of the chart planets as text.
+    Receives an optional ReceptionMatrix, which defaults to the one shared by the chart.
+
+    """
+    receptions = receptions if receptions else chart.receptions()
+    lines = []
+    for (dign_a, dign_b), pairs in receptions.receptions_by_type().items():
+        # Exile and fall are debilities and not receptions
+        if dign_a in DEBILITIES or dign_b in DEBILITIES:
+            continue
+        for id_a, id_b in pairs:
+            lines.append(f"{id_a} receives {id_b} by {dign_a} and {id_b} receives {id_a} by "
+                         f"{dign_b} (mutual reception).\n")
+
+    for obj_id in receptions.planets:
+        chain = receptions.dispositor_chain(obj_id)
+        lines.append(f"The dispositor chain of {obj_id} is {' > '.join(chain)}.\n")
+
+    final = receptions.final_dispositor()
+    if final:
+        lines.append(f"{final} is the final dispositor of the chart.\n")
+    else:
+        cycles = ', '.join(' > '.join(cycle) for cycle in receptions.dispositor_cycles())
+        lines.append(f"There is no final dispositor, the dispositor cycles are {cycles}.\n")
+    return "".join(lines)
 
 
 def describe_chart(chart):
     """ Returns the chart in textual representation. """
-
-    text = describe_planets(chart)
-    text += describe_houses(chart)
-    text += describe_essential_dignities(chart)
-    text += describe_accidental_dignities(chart)
-    text += describe_aspects(chart, const.MAJOR_ASPECTS)
-    return text
+    return "".join([
+        describe_planets(chart),
+        describe_houses(chart),
+        describe_essential_dignities(chart),
+        describe_accidental_dignities(chart),
+        describe_receptions(chart),
+        describe_aspects(chart, const.MAJOR_ASPECTS),
+    ])
 
 
 def describe_chart_as_json(chart):
@@ -217,34 +242,51 @@ def describe_chart_as_json(chart):
     return json.dumps(schemas.chart_complete_schema(chart), indent=2)
 
 
-def describe_primary_directions(chart, **filters):
-    """ Returns the list of primary directions as text. """
-    table = chart.primary_directions()
+def describe_primary_directions(chart, max_directions=None, **filters):
+    """
+    Returns the list of primary directions as text.
+    Receives optional filters (see PDTable.filter_by) and a maximum number of directions, which
+    keeps the directions with smaller arcs.
+
+    """
+    directions = chart.primary_directions().filter_by(**filters)
+    if max_directions is not None:
+        directions = directions[:max_directions]
 
-    text = "The primary directions are a predictive technique used in traditional astrology.\n"
-    text += "The following list includes the arc of direction, direction and direction type "
-    text += "(Zodiacal or Mundane directions).\n"
-    for direction in table.filter_by(**filters):
-        text += str(direction) + "\n"
-    return text
+    lines = [
+        "The primary directions are a predictive technique used in traditional astrology.\n",
+        "The following list includes the arc of direction, direction and direction type ",
+        "(Zodiacal or Mundane directions).\n",
+    ]
+    lines.extend(f"{direction}\n" for direction in directions)
+    return "".join(lines)
 
 
-def describe_temperament(chart):
+def describe_temperament(chart, temperament=None):
     """ Returns the temperament as text. """
-    temperament = chart.temperament()
-    text = "Base factors: " + str(temperament.get_factors()) + "\n"
-    text += "Temperament Modifiers: " + str(temperament.get_modifiers()) + "\n"
-    text += "Total score: " + str(temperament.get_score())
-    return text
+    temperament = temperament if temperament else chart.temperament()
+    return (f"Base factors: {temperament.get_factors()}\n"
+            f"Temperament Modifiers: {temperament.get_modifiers()}\n"
+            f"Total score: {temperament.get_score()}")
 
 
-def describe_almutem(chart):
+def describe_almutem(chart, almutem=None):
     """ Returns the almutem as text. """
-    almutem = chart.almutem()
+    almutem = almutem if almutem else chart.almutem()
     return str(almutem) + "\n"
 
 
-def describe_behavior(chart):
+def describe_behavior(chart, behavior=None):
     """ Returns the behavior as text. """
-    behavior = chart.behavior()
+    behavior = behavior if behavior else chart.behavior()
     return str(behavior) + "\n"
+
+
+def describe_protocols(chart):
+    """ Returns the almutem, behavior and temperament as text, computed over shared facts. """
+    protocols = chart.protocols()
+    return "".join([
+        describe_almutem(chart, protocols['almutem']),
+        describe_behavior(chart, protocols['behavior']),
+        describe_temperament(chart, protocols['temperament']),
+    ])
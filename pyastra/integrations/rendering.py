@@ -0,0 +1,138 @@
+"""
+This module implements a rendering layer for the LLM chart descriptions.
+
+Prompts are usually regenerated on every conversation turn, although the chart does not change.
+The ChartRenderer caches each rendered section by a hash of the chart snapshot, and can stream
+the sections as a generator, so that the first sections can be sent to the model while the heavy
+ones (such as the primary directions) are still being computed.
+
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+
+from pyastra import const
+from . import llm
+
+# Sections
+SECTION_PLANETS = 'planets'
+SECTION_HOUSES = 'houses'
+SECTION_ESSENTIAL_DIGNITIES = 'essential_dignities'
+SECTION_ACCIDENTAL_DIGNITIES = 'accidental_dignities'
+SECTION_RECEPTIONS = 'receptions'
+SECTION_ASPECTS = 'aspects'
+SECTION_PROTOCOLS = 'protocols'
+SECTION_PRIMARY_DIRECTIONS = 'primary_directions'
+
+# Sections of llm.describe_chart
+CHART_SECTIONS = [
+    SECTION_PLANETS,
+    SECTION_HOUSES,
+    SECTION_ESSENTIAL_DIGNITIES,
+    SECTION_ACCIDENTAL_DIGNITIES,
+    SECTION_RECEPTIONS,
+    SECTION_ASPECTS,
+]
+
+# All sections, ordered from the lightest to the heaviest
+ALL_SECTIONS = CHART_SECTIONS + [SECTION_PROTOCOLS, SECTION_PRIMARY_DIRECTIONS]
+
+# Maximum number of cached sections
+CACHE_SIZE = 1024
+
+
+def chart_hash(chart) -> str:
+    """
+    Returns a hash of a chart snapshot, given by its context and the positions of its objects,
+    houses and angles. Charts with relocated objects (such as profections) have different hashes.
+
+    """
+    values = [repr(chart.context)]
+    for obj in chart.objects:
+        values.append(f'{obj.id}:{obj.lon!r}:{obj.lat!r}:{obj.lon_speed!r}')
+    for obj in list(chart.houses) + list(chart.angles):
+        values.append(f'{obj.id}:{obj.lon!r}')
+    return hashlib.sha1('|'.join(values).encode('utf-8')).hexdigest()
+
+
+# ------------------------- #
+#   ChartRenderer Class     #
+# ------------------------- #
+
+class ChartRenderer:
+    """
+    This class renders the textual sections of a chart for LLM prompts and caches them by chart
+    snapshot hash. The cache is bounded and discards the least recently used sections.
+
+    Receives optional filters for the primary directions section (see PDTable.filter_by).
+
+    """
+
+    def __init__(self, cache_size=CACHE_SIZE, **pd_filters):
+        self.cache_size = cache_size
+        self.pd_filters = pd_filters
+        self.cache = OrderedDict()
+        self.lock = threading.Lock()
+
+    def _render_section(self, chart, section):
+        """ Renders a section of a chart without caching. """
+        if section == SECTION_PLANETS:
+            return llm.describe_planets(chart)
+        if section == SECTION_HOUSES:
+            return llm.describe_houses(chart)
+        if section == SECTION_ESSENTIAL_DIGNITIES:
+            return llm.describe_essential_dignities(chart)
+        if section == SECTION_ACCIDENTAL_DIGNITIES:
+            return llm.describe_accidental_dignities(chart)
+        if section == SECTION_RECEPTIONS:
+            return llm.describe_receptions(chart)
+        if section == SECTION_ASPECTS:
+            return llm.describe_aspects(chart, const.MAJOR_ASPECTS)
+        if section == SECTION_PROTOCOLS:
+            return llm.describe_protocols(chart)
+        if section == SECTION_PRIMARY_DIRECTIONS:
+            return llm.describe_primary_directions(chart, **self.pd_filters)
+        raise ValueError(f"'{section}' is not a valid section.")
+
+    def section(self, chart, section, key=None) -> str:
+        """
+        Returns the text of a chart section, rendering it only if not cached.
+        Receives an optional chart hash to avoid hashing the chart for each section.
+
+        """
+        key = (key if key else chart_hash(chart), section)
+        with self.lock:
+            if key in self.cache:
+                self.cache.move_to_end(key)
+                return self.cache[key]
+
+        text = self._render_section(chart, section)
+        with self.lock:
+            self.cache[key] = text
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        return text
+
+    def stream(self, chart, sections=ALL_SECTIONS):
+        """
+        Generates the (section, text) pairs of a chart. Each section is rendered only when
+        requested, so the first sections are available before the heavy ones are computed.
+
+        """
+        key = chart_hash(chart)
+        for section in sections:
+            yield section, self.section(chart, section, key)
+
+    def render(self, chart, sections=CHART_SECTIONS) -> str:
+        """
+        Returns the text of a chart for the given sections.
+        By default, it returns the same text as llm.describe_chart.
+
+        """
+        return ''.join(text for _, text in self.stream(chart, sections))
+
+    def clear(self):
+        """ Clears the cache. """
+        with self.lock:
+            self.cache.clear()
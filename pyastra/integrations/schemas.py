@@ -1,117 +1,204 @@
 """
 This module generates python dictionaries with information from PyAstra objects.
 
+The SchemaBuilder class generates the complete chart schema scoring each planet only once, and
+the dump_charts function streams the schemas of a batch of charts to a file object.
+
 """
 
+import json
+
 from pyastra import const
 from pyastra.core import aspects
 from pyastra.dignities import essential, accidental
+from pyastra.tools.receptions import ReceptionMatrix
 
 
 def planet_snapshot_schema(obj):
     """ Returns a lighter planet schema to be embedded in other schemas. """
-    essential_info = obj.essential_dignities()
-    accidental_dignities = obj.accidental_dignities()
-    try:
-        accidental_dignities_score = accidental_dignities.score()
-    except ValueError:
-        accidental_dignities_score = 0
-    return {
-        'Planet': obj.id,
-        'Sign': obj.sign,
-        'House': obj.house().num(),
-        'Retrograde': obj.is_retrograde(),
-        'Combust': accidental_dignities.is_combust(),
-        'Essential Dignity Score': essential_info.score,
-        'Accidental Dignity Score': accidental_dignities_score,
-    }
+    return SchemaBuilder(obj.chart).planet_snapshot_schema(obj)
 
 
 def planet_complete_schema(obj, chart, asp_list=const.MAJOR_ASPECTS):
     """ Returns the complete schema for a planet. """
-    res = {
-        'Planet': obj.id,
-        'Position': {
+    return SchemaBuilder(chart, asp_list).planet_complete_schema(obj)
+
+
+def house_schema(house, chart):
+    """ Returns the schema of an house. """
+    return SchemaBuilder(chart).house_schema(house)
+
+
+def chart_complete_schema(chart, asp_list=const.MAJOR_ASPECTS):
+    """ Returns the complete schema for a chart. """
+    return SchemaBuilder(chart, asp_list).chart_schema()
+
+
+# ----------------------- #
+#   SchemaBuilder Class   #
+# ----------------------- #
+
+class SchemaBuilder:
+    """
+    This class builds the schemas of a chart, computing the houses, the essential and accidental
+    dignities of each object and the aspects between objects only once. The results are shared
+    by all the schemas where a planet is included (as a planet, house ruler or house tenant).
+
+    """
+
+    def __init__(self, chart, asp_list=const.MAJOR_ASPECTS):
+        self.chart = chart
+        self.asp_list = asp_list
+        self._houses = {}
+        self._essential = {}
+        self._accidental = {}
+        self._aspects = None
+        self._receptions = None
+
+    # === Shared results === #
+
+    @property
+    def receptions(self) -> ReceptionMatrix:
+        """ Returns the reception matrix of the chart. """
+        if self._receptions is None:
+            self._receptions = self.chart.receptions()
+        return self._receptions
+
+    def house(self, obj):
+        """ Returns the house of an object. """
+        if obj.id not in self._houses:
+            self._houses[obj.id] = obj.house()
+        return self._houses[obj.id]
+
+    def essential_dignities(self, obj):
+        """ Returns the essential dignities of an object. """
+        if obj.id not in self._essential:
+            self._essential[obj.id] = obj.essential_dignities()
+        return self._essential[obj.id]
+
+    def accidental_dignities(self, obj):
+        """
+        Returns a tuple with the accidental dignities of an object and its score, which is None
+        when the object cannot be scored.
+
+        """
+        if obj.id not in self._accidental:
+            dig = accidental.AccidentalDignity(obj, self.chart, self.receptions)
+            try:
+                score = dig.score()
+            except ValueError:
+                score = None
+            self._accidental[obj.id] = (dig, score)
+        return self._accidental[obj.id]
+
+    def aspects(self, obj) -> list:
+        """ Returns the aspects where an object is the active object. """
+        if self._aspects is None:
+            objs = list(self.chart.objects)
+            active_aspects = {obj.id: [] for obj in objs}
+
+            # Each pair of objects is computed once and assigned to its active object
+            for i, obj1 in enumerate(objs):
+                for j in range(i + 1, len(objs)):
+                    aspect = aspects.aspect_record(obj1, objs[j], self.asp_list)
+                    if aspect is None:
+                        continue
+                    passive_index = j if aspect.active.id == obj1.id else i
+                    active_aspects[aspect.active.id].append((passive_index, aspect))
+
+            self._aspects = {
+                obj_id: [aspect for _, aspect in sorted(values, key=lambda value: value[0])]
+                for obj_id, values in active_aspects.items()
+            }
+        return self._aspects[obj.id]
+
+    # === Schemas === #
+
+    def planet_snapshot_schema(self, obj):
+        """ Returns a lighter planet schema to be embedded in other schemas. """
+        dig, score = self.accidental_dignities(obj)
+        return {
+            'Planet': obj.id,
             'Sign': obj.sign,
-            'Longitude in sign': obj.signlon,
-            'Longitude in zodiac': obj.lon,
-            'Speed': obj.lon_speed,
-            'House': obj.house().num(),
-            'Movement': obj.movement(),
+            'House': self.house(obj).num(),
+            'Retrograde': obj.is_retrograde(),
+            'Combust': dig.is_combust(),
+            'Essential Dignity Score': self.essential_dignities(obj).score,
+            'Accidental Dignity Score': score if score is not None else 0,
         }
-    }
-    # Essential dignities
-    info = obj.essential_dignities()
-    dignities = info.get_dignities()
-    res['Essential Dignities'] = {
-        'Total Score': info.score,
-        'Factors': dignities
-    }
-    # Accidental dignities
-    dig = obj.accidental_dignities()
-    try:
-        res['Accidental Dignities'] = {
-            'Total Score': dig.score(),
-            'Factors': []
+
+    def planet_complete_schema(self, obj):
+        """ Returns the complete schema for a planet. """
+        info = self.essential_dignities(obj)
+        res = {
+            'Planet': obj.id,
+            'Position': {
+                'Sign': obj.sign,
+                'Longitude in sign': obj.signlon,
+                'Longitude in zodiac': obj.lon,
+                'Speed': obj.lon_speed,
+                'House': self.house(obj).num(),
+                'Movement': obj.movement(),
+            },
+            'Essential Dignities': {
+                'Total Score': info.score,
+                'Factors': info.get_dignities()
+            }
         }
-        for key, value in dig.score_properties.items():
-            if value != 0:
-                res['Accidental Dignities']['Factors'].append({
+        dig, score = self.accidental_dignities(obj)
+        if score is not None:
+            res['Accidental Dignities'] = {
+                'Total Score': score,
+                'Factors': [{
                     'Type': key,
                     'Score': value,
                     'Description': accidental.SCORE_TABLE_DESCRIPTION[key]
-                })
-    except ValueError:
-        pass
-    # Aspects
-    res['Aspects'] = []
-    for obj2 in chart.objects:
-        # Ignore same object
-        if obj == obj2:
-            continue
-
-        aspect = obj.get_aspect(obj2, asp_list)
-        if not aspect or aspect.type == const.NO_ASPECT:
-            continue
-
-        if aspect.active.id == obj.id:
-            res['Aspects'].append({
-                'Type': const.ASPECT_NAMES[aspect.type],
-                'Movement': aspect.active.movement,
-                'Passive': aspect.passive.id,
-                'Orb': aspect.orb,
-            })
-
-    return res
+                } for key, value in dig.score_properties.items() if value != 0]
+            }
+        res['Aspects'] = [{
+            'Type': const.ASPECT_NAMES[aspect.type],
+            'Movement': aspect.active.movement,
+            'Passive': aspect.passive.id,
+            'Orb': aspect.orb,
+        } for aspect in self.aspects(obj)]
+        return res
 
+    def house_schema(self, house):
+        """ Returns the schema of an house, with its ruler and tenants. """
+        ruler = self.chart.get(house.sign.ruler)
+        return {
+            'House': house.num(),
+            'House Condition': house.condition,
+            'Position': {
+                'Sign': house.sign,
+                'Longitude in sign': house.signlon,
+                'Longitude in zodiac': house.lon,
+            },
+            'Ruler': self.planet_snapshot_schema(ruler),
+            'Tenants': [self.planet_snapshot_schema(obj) for obj in self.chart.objects
+                        if house.has_object(obj)],
+        }
 
-def house_schema(house, chart):
-    """ Returns the schema of an house. """
-    res = {
-        'House': house.num(),
-        'House Condition': house.condition,
-        'Position': {
-            'Sign': house.sign,
-            'Longitude in sign': house.signlon,
-            'Longitude in zodiac': house.lon,
+    def chart_schema(self):
+        """ Returns the complete schema for the chart. """
+        return {
+            'Planets': [self.planet_complete_schema(obj) for obj in self.chart.objects],
+            'Houses': [self.house_schema(house) for house in self.chart.houses],
         }
-    }
-    # House Ruler
-    ruler_id = house.sign.ruler
-    ruler = chart.get(ruler_id)
-    res['Ruler'] = planet_snapshot_schema(ruler)
-    # House tenants
-    res['Tenants'] = []
-    for obj in chart.objects:
-        if house.has_object(obj):
-            res['Tenants'].append(planet_snapshot_schema(obj))
 
-    return res
 
+# === Batches === #
 
-def chart_complete_schema(chart, asp_list=const.MAJOR_ASPECTS):
-    """ Returns the complete schema for a chart. """
-    return {
-        'Planets': [planet_complete_schema(obj, chart, asp_list) for obj in chart.objects],
-        'Houses': [house_schema(house, chart) for house in chart.houses],
-    }
+def dump_charts(charts, fp, asp_list=const.MAJOR_ASPECTS, indent=None):
+    """
+    Writes the complete schemas of a batch of charts to a file object as a JSON list.
+    Charts are serialized one at a time, so 'charts' can be a generator and memory is bounded
+    by the size of a single chart schema.
+
+    """
+    fp.write('[')
+    for i, chart in enumerate(charts):
+        if i > 0:
+            fp.write(',')
+        json.dump(chart_complete_schema(chart, asp_list), fp, indent=indent)
+    fp.write(']')
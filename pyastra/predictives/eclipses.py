@@ -0,0 +1,259 @@
+"""
+This module provides an index of solar and lunar eclipses.
+
+Searching eclipses with the Swiss Ephemeris is slow, so the EclipseIndex computes all eclipses
+within a range of dates once and keeps them sorted by julian date. Queries such as the prenatal
+eclipse or the next eclipse are then simple bisections on the index, which can also be saved to
+and loaded from disk.
+
+Eclipse longitudes are stored in the tropical zodiac and converted to sidereal zodiacs on demand.
+
+"""
+
+import bisect
+import json
+import os
+from dataclasses import dataclass, asdict
+
+from pyastra import const
+from pyastra.core import angle
+from pyastra.core.datetime import Datetime
+from pyastra.ephem import swe
+
+# The range of dates supported by the bundled ephemeris files
+INDEX_START_JD = Datetime('1201/01/01').jd
+INDEX_END_JD = Datetime('2999/12/31').jd
+
+# Version of the index file format
+INDEX_VERSION = 1
+
+# Default objects and orb used when scanning eclipses over natal points
+SCAN_IDS = const.LIST_SEVEN_PLANETS + [const.ASC, const.MC]
+SCAN_ORB = 3.0
+
+
+@dataclass(frozen=True)
+class Eclipse:
+    """
+    An immutable data class representing an eclipse at its maximum.
+    The longitude is the tropical ecliptic longitude of the eclipsed light.
+
+    """
+
+    jd: float
+    kind: str       # Solar or lunar eclipse
+    type: str       # Total, annular, hybrid, partial or penumbral
+    lon: float
+    magnitude: float
+
+    @property
+    def date(self) -> Datetime:
+        """ Returns the date of this eclipse in UTC. """
+        return Datetime.from_jd(self.jd, 0)
+
+
+# === Eclipse search === #
+
+def _eclipse(kind, jd, backwards=False) -> Eclipse:
+    """ Returns the next (or previous) eclipse of a kind relative to a julian date. """
+    if kind == const.ECLIPSE_SOLAR:
+        ecl_jd, ecl_type, magnitude = swe.swe_next_solar_eclipse(jd, backwards)
+        lon, _, _, _ = swe.swe_object_fast(const.SUN, ecl_jd)
+    else:
+        ecl_jd, ecl_type, magnitude = swe.swe_next_lunar_eclipse(jd, backwards)
+        lon, _, _, _ = swe.swe_object_fast(const.MOON, ecl_jd)
+    return Eclipse(ecl_jd, kind, ecl_type, lon, magnitude)
+
+
+def search(kind, jd_start, jd_end) -> list[Eclipse]:
+    """ Returns all eclipses of a kind between two julian dates. """
+    res = []
+    jd = jd_start
+    while True:
+        eclipse = _eclipse(kind, jd)
+        if eclipse.jd > jd_end:
+            return res
+        res.append(eclipse)
+        # Eclipses of the same kind are at least one lunation apart
+        jd = eclipse.jd + 20
+
+
+# ---------------------- #
+#   EclipseIndex Class   #
+# ---------------------- #
+
+class EclipseIndex:
+    """
+    This class represents a sorted index of solar and lunar eclipses.
+
+    The eclipses are kept sorted by julian date, together with per-kind lists, so that all
+    time-based queries are bisections.
+
+    """
+
+    def __init__(self, eclipses):
+        self.eclipses = sorted(eclipses, key=lambda eclipse: eclipse.jd)
+        self.jds = [eclipse.jd for eclipse in self.eclipses]
+        self.by_kind = {}
+        for kind in [const.ECLIPSE_SOLAR, const.ECLIPSE_LUNAR]:
+            eclipses = [eclipse for eclipse in self.eclipses if eclipse.kind == kind]
+            self.by_kind[kind] = (eclipses, [eclipse.jd for eclipse in eclipses])
+        self._sidereal_lons = {}
+
+    @classmethod
+    def build(cls, jd_start=INDEX_START_JD, jd_end=INDEX_END_JD):
+        """ Builds the index of all solar and lunar eclipses between two julian dates. """
+        eclipses = search(const.ECLIPSE_SOLAR, jd_start, jd_end)
+        eclipses += search(const.ECLIPSE_LUNAR, jd_start, jd_end)
+        return cls(eclipses)
+
+    @classmethod
+    def load(cls, path):
+        """ Loads an index from a file saved with EclipseIndex.save(). """
+        with open(path, 'r', encoding='utf-8') as file:
+            data = json.load(file)
+        if data.get('version') != INDEX_VERSION:
+            raise ValueError(f"Unsupported eclipse index version in '{path}'.")
+        return cls([Eclipse(**values) for values in data['eclipses']])
+
+    def save(self, path):
+        """ Saves this index to a file. """
+        data = {
+            'version': INDEX_VERSION,
+            'eclipses': [asdict(eclipse) for eclipse in self.eclipses]
+        }
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            json.dump(data, file)
+        os.replace(tmp_path, path)
+
+    def __len__(self):
+        return len(self.eclipses)
+
+    def __iter__(self):
+        return iter(self.eclipses)
+
+    # === Time queries === #
+
+    def _lists(self, kind):
+        """ Returns the eclipses and julian dates for a kind of eclipse (or all). """
+        if kind is None:
+            return self.eclipses, self.jds
+        return self.by_kind[kind]
+
+    def prev(self, jd, kind=None) -> Eclipse | None:
+        """ Returns the last eclipse before a julian date. """
+        eclipses, jds = self._lists(kind)
+        index = bisect.bisect_left(jds, jd)
+        return eclipses[index - 1] if index > 0 else None
+
+    def next(self, jd, kind=None) -> Eclipse | None:
+        """ Returns the first eclipse after a julian date. """
+        eclipses, jds = self._lists(kind)
+        index = bisect.bisect_right(jds, jd)
+        return eclipses[index] if index < len(eclipses) else None
+
+    def between(self, jd_start, jd_end, kind=None) -> list[Eclipse]:
+        """ Returns the eclipses between two julian dates. """
+        eclipses, jds = self._lists(kind)
+        start = bisect.bisect_left(jds, jd_start)
+        end = bisect.bisect_right(jds, jd_end)
+        return eclipses[start:end]
+
+    def prenatal(self, chart, kind=None) -> Eclipse | None:
+        """ Returns the prenatal eclipse of a chart. """
+        return self.prev(chart.date.jd, kind)
+
+    # === Longitudes === #
+
+    def longitudes(self, zodiac=const.ZODIAC_TROPICAL, ayanamsa=None) -> list[float]:
+        """
+        Returns the longitudes of all eclipses in a zodiac.
+        Sidereal longitudes are computed once per ayanamsa and cached.
+
+        """
+        if zodiac != const.ZODIAC_SIDEREAL:
+            return [eclipse.lon for eclipse in self.eclipses]
+        if ayanamsa not in self._sidereal_lons:
+            self._sidereal_lons[ayanamsa] = [
+                angle.norm(eclipse.lon - swe.swe_ayanamsa(eclipse.jd, ayanamsa))
+                for eclipse in self.eclipses
+            ]
+        return self._sidereal_lons[ayanamsa]
+
+    # === Natal point scans === #
+
+    def _lon_index(self, jd_start, jd_end, zodiac, ayanamsa):
+        """ Returns the eclipses between two julian dates as a list sorted by longitude. """
+        start = bisect.bisect_left(self.jds, jd_start)
+        end = bisect.bisect_right(self.jds, jd_end)
+        lons = self.longitudes(zodiac, ayanamsa)[start:end]
+        return sorted(zip(lons, self.eclipses[start:end]), key=lambda pair: pair[0])
+
+    @staticmethod
+    def _in_orb(lon_index, lons, lon, orb):
+        """ Returns the (eclipse, distance) pairs of a longitude index within orb of 'lon'. """
+        res = []
+        ranges = [(lon - orb, lon + orb)]
+        if lon - orb < 0:
+            ranges.append((lon - orb + 360, 360))
+        if lon + orb >= 360:
+            ranges.append((0, lon + orb - 360))
+        for low, high in ranges:
+            start = bisect.bisect_left(lons, low)
+            end = bisect.bisect_right(lons, high)
+            for ecl_lon, eclipse in lon_index[start:end]:
+                res.append((eclipse, angle.closest_distance(lon, ecl_lon)))
+        return res
+
+    def scan(self, charts, jd_start=INDEX_START_JD, jd_end=INDEX_END_JD, ids=SCAN_IDS,
+             orb=SCAN_ORB) -> list[list]:
+        """
+        Returns, for each chart, the eclipses within orb of the chart's natal points between two
+        julian dates.
+
+        The eclipses in the period are sorted by longitude once per zodiac, so each natal point
+        only costs two bisections. Each chart result is a list of (eclipse, obj_id, distance)
+        tuples sorted by julian date.
+
+        """
+        lon_indexes = {}
+        res = []
+        for chart in charts:
+            key = (chart.context.zodiac, chart.context.ayanamsa)
+            if key not in lon_indexes:
+                lon_index = self._lon_index(jd_start, jd_end, *key)
+                lon_indexes[key] = (lon_index, [lon for lon, _ in lon_index])
+            lon_index, lons = lon_indexes[key]
+
+            hits = []
+            for obj_id in ids:
+                obj = chart.get(obj_id)
+                for eclipse, dist in self._in_orb(lon_index, lons, obj.lon, orb):
+                    hits.append((eclipse, obj_id, dist))
+            res.append(sorted(hits, key=lambda hit: hit[0].jd))
+        return res
+
+
+# === Default index === #
+
+_INDEX = None
+
+
+def get_index(path=None) -> EclipseIndex:
+    """
+    Returns the default eclipse index for the supported range of dates.
+
+    The index is built only once per process. If a path is given, the index is loaded from that
+    file if it exists, or built and saved to it otherwise. An index which already exists is
+    saved to the path if the file does not exist.
+
+    """
+    global _INDEX
+    if _INDEX is None and path and os.path.exists(path):
+        _INDEX = EclipseIndex.load(path)
+    elif _INDEX is None:
+        _INDEX = EclipseIndex.build()
+    if path and not os.path.exists(path):
+        _INDEX.save(path)
+    return _INDEX
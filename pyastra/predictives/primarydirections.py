@@ -12,7 +12,8 @@ Default assumptions:
 from pyastra.core import angle
 from pyastra import utils
 from pyastra import const
-from pyastra.dignities import tables
+from pyastra import profiling
+from pyastra.dignities import essential, tables
 
 
 # === Base functions === #
@@ -171,7 +172,7 @@ class PrimaryDirections:
 
     def _build_terms(self):
         """ Builds a data structure indexing the terms longitude by sign and object. """
-        term_lons = tables.term_lons(tables.EGYPTIAN_TERMS)
+        term_lons = tables.term_lons(essential.chart_config(self.chart).terms_table)
         res = {}
         for (obj_id, sign, lon) in term_lons:
             try:
@@ -331,6 +332,7 @@ class PrimaryDirections:
 class PDTable:
     """ Represents the Primary Directions table for a chart. """
 
+    @profiling.traced(profiling.OPERATION_PRIMARY_DIRECTIONS)
     def __init__(self, chart, asp_list=const.MAJOR_ASPECTS):
         pd = PrimaryDirections(chart)
         self.table = pd.get_list(asp_list)
@@ -0,0 +1,227 @@
+"""
+This module provides an opt-in tracing of the Swiss Ephemeris calls.
+
+While a trace is active, every swisseph call is counted per function and per body (object or
+house system), together with the time spent in the call and the time waiting for the swisseph
+lock. Calls are attributed to the innermost active operation, such as the chart build, the
+primary directions or the accidental dignities:
+
+    with profiling.trace() as t:
+        chart = Chart(date, pos)
+        chart.primary_directions()
+    print(t.summary())
+
+Traces record the calls of all threads. When no trace is active the ephemeris is not
+instrumented and operations only check a flag.
+
+"""
+
+import contextvars
+import functools
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+# Operation used for calls made outside any operation
+NO_OPERATION = None
+
+# Operations of the library
+OPERATION_CHART = 'chart'
+OPERATION_FIXED_STARS = 'fixed_stars'
+OPERATION_SOLAR_RETURN = 'solar_return'
+OPERATION_PRIMARY_DIRECTIONS = 'primary_directions'
+OPERATION_ACCIDENTAL_DIGNITIES = 'accidental_dignities'
+OPERATION_STATION = 'station'
+OPERATION_PLANETARY_HOURS = 'planetary_hours'
+
+# Current operation of each thread or asyncio task
+_OPERATION = contextvars.ContextVar('operation', default=NO_OPERATION)
+
+# Active traces and lock for installing the instrumentation
+_TRACES = []
+_TRACES_LOCK = threading.Lock()
+
+
+# ----------------- #
+#   Trace Class     #
+# ----------------- #
+
+class Trace:
+    """
+    This class holds the statistics of the swisseph calls recorded during a trace.
+
+    Receives an optional callback, called as on_call(function, body, elapsed, operation) for
+    each recorded call.
+
+    """
+
+    def __init__(self, on_call=None):
+        self.on_call = on_call
+        self.calls = Counter()          # Calls by function
+        self.bodies = Counter()         # Calls by (function, body)
+        self.call_time = Counter()      # Time in the C calls by function
+        self.lock_wait = 0.0
+        self.lock_acquires = 0
+        self.operations = {}            # Statistics by operation
+        self.lock = threading.Lock()
+
+    def _operation(self, operation) -> dict:
+        """ Returns the statistics of an operation. """
+        if operation not in self.operations:
+            self.operations[operation] = {
+                'count': 0,
+                'time': 0.0,
+                'calls': Counter(),
+                'call_time': 0.0,
+                'lock_wait': 0.0,
+            }
+        return self.operations[operation]
+
+    def record_call(self, function, body, elapsed, operation):
+        """ Records a swisseph call. """
+        with self.lock:
+            self.calls[function] += 1
+            self.bodies[(function, body)] += 1
+            self.call_time[function] += elapsed
+            stats = self._operation(operation)
+            stats['calls'][function] += 1
+            stats['call_time'] += elapsed
+        if self.on_call:
+            self.on_call(function, body, elapsed, operation)
+
+    def record_lock_wait(self, elapsed, operation):
+        """ Records the time waiting for the swisseph lock. """
+        with self.lock:
+            self.lock_wait += elapsed
+            self.lock_acquires += 1
+            self._operation(operation)['lock_wait'] += elapsed
+
+    def record_operation(self, operation, elapsed):
+        """ Records the execution of an operation. """
+        with self.lock:
+            stats = self._operation(operation)
+            stats['count'] += 1
+            stats['time'] += elapsed
+
+    @property
+    def total_calls(self) -> int:
+        """ Returns the total number of swisseph calls. """
+        return sum(self.calls.values())
+
+    @property
+    def total_call_time(self) -> float:
+        """ Returns the total time spent in the swisseph calls. """
+        return sum(self.call_time.values())
+
+    def as_dict(self) -> dict:
+        """ Returns the statistics as a JSON serializable dict. """
+        bodies = {}
+        for (function, body), count in self.bodies.items():
+            bodies.setdefault(function, {})[str(body)] = count
+        return {
+            'calls': dict(self.calls),
+            'bodies': bodies,
+            'call_time': dict(self.call_time),
+            'lock_wait': self.lock_wait,
+            'lock_acquires': self.lock_acquires,
+            'operations': {
+                str(operation): dict(stats, calls=dict(stats['calls']))
+                for operation, stats in self.operations.items()
+            },
+        }
+
+    def summary(self) -> str:
+        """ Returns a textual summary of the statistics. """
+        lines = [f'{self.total_calls} swisseph calls in {self.total_call_time * 1000:.3f} ms, '
+                 f'{self.lock_wait * 1000:.3f} ms waiting for the lock\n']
+        for function, count in self.calls.most_common():
+            lines.append(f'  {function}: {count} calls, '
+                         f'{self.call_time[function] * 1000:.3f} ms\n')
+        for operation, stats in self.operations.items():
+            lines.append(f'  [{operation}] {stats["count"]} runs, '
+                         f'{sum(stats["calls"].values())} calls, '
+                         f'{stats["call_time"] * 1000:.3f} ms in calls\n')
+        return ''.join(lines)
+
+
+# === Recorder === #
+
+class _Recorder:
+    """ Dispatches the instrumentation events to the active traces. """
+
+    @staticmethod
+    def record_call(function, body, elapsed):
+        operation = _OPERATION.get()
+        for trace_ in list(_TRACES):
+            trace_.record_call(function, body, elapsed, operation)
+
+    @staticmethod
+    def record_lock_wait(elapsed):
+        operation = _OPERATION.get()
+        for trace_ in list(_TRACES):
+            trace_.record_lock_wait(elapsed, operation)
+
+
+_RECORDER = _Recorder()
+
+
+@contextmanager
+def trace(on_call=None):
+    """
+    Context manager which traces the swisseph calls and yields the Trace object.
+    Receives an optional callback called for each swisseph call.
+
+    """
+    # Imported here, so that importing this module does not load the ephemeris
+    from pyastra.ephem import swe
+
+    trace_ = Trace(on_call)
+    with _TRACES_LOCK:
+        _TRACES.append(trace_)
+        if len(_TRACES) == 1:
+            swe.instrument(_RECORDER)
+    try:
+        yield trace_
+    finally:
+        with _TRACES_LOCK:
+            _TRACES.remove(trace_)
+            if not _TRACES:
+                swe.instrument(None)
+
+
+def is_tracing() -> bool:
+    """ Returns true if a trace is active. """
+    return bool(_TRACES)
+
+
+# === Operations === #
+
+@contextmanager
+def operation(name):
+    """ Context manager which attributes the swisseph calls to an operation. """
+    if not _TRACES:
+        yield
+        return
+    token = _OPERATION.set(name)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        _OPERATION.reset(token)
+        for trace_ in list(_TRACES):
+            trace_.record_operation(name, elapsed)
+
+
+def traced(name):
+    """ Decorator which attributes the swisseph calls of a function to an operation. """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _TRACES:
+                return func(*args, **kwargs)
+            with operation(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -7,6 +7,7 @@ The Almutem protocol returns the Planet which scores higher in some hylegic poin
 from pyastra import const
 from pyastra.tools import planetarytime
 from pyastra.dignities import essential
+from pyastra.protocols.facts import ChartFacts
 
 # House scores
 HOUSE_SCORES = {
@@ -50,8 +51,13 @@ def new_row():
     return row
 
 
-def compute(chart):
-    """ Computes the Almutem table. """
+def compute(chart, facts=None):
+    """
+    Computes the Almutem table.
+    Receives an optional ChartFacts object to share intermediate facts with other protocols.
+
+    """
+    facts = facts if facts else ChartFacts(chart)
     almutems = {}
 
     # Hylegic points
@@ -62,9 +68,10 @@ def compute(chart):
         chart.get_object(const.PARS_FORTUNA),
         chart.get_object(const.SYZYGY)
     ]
+    config = essential.chart_config(chart)
     for hyleg in hylegic:
         row = new_row()
-        dig_info = essential.get_info(hyleg.sign, hyleg.signlon)
+        dig_info = essential.get_info(hyleg.sign, hyleg.signlon, config)
 
         # Add the scores of each planet where hyleg has dignities
         for dignity in DIGNITY_LIST:
@@ -79,8 +86,7 @@ def compute(chart):
     # House positions
     row = new_row()
     for obj_id in OBJECT_LIST:
-        obj = chart.get_object(obj_id)
-        house = chart.houses.get_object_house(obj)
+        house = facts.houses[obj_id]
         score = HOUSE_SCORES[house.id]
         row[obj_id]['string'] = f'+{score}'
         row[obj_id]['score'] = score
@@ -0,0 +1,186 @@
+"""
+This module implements the evaluation of traditional protocols over batches of charts.
+
+The single chart protocols build nested dicts and strings for every chart. For research cohorts,
+the batch evaluators work over a ChartBatch (or a list of charts) and return integer scores,
+using precomputed dignity tables and cached sunrises and sunsets. The textual tables of the
+single chart protocols are available as an optional view.
+
+"""
+
+from pyastra import const
+from pyastra.core.batch import ChartBatch, house_index
+from pyastra.dignities import essential
+from pyastra.protocols import almutem
+from pyastra.tools import planetarytime
+
+# Hylegic points of the almutem
+HYLEGIC_POINTS = [
+    const.SUN,
+    const.MOON,
+    const.ASC,
+    const.PARS_FORTUNA,
+    const.SYZYGY
+]
+
+# Rows of the almutem table
+ALMUTEM_HOUSES = 'Houses'
+ALMUTEM_RULERS = 'Rulers'
+ALMUTEM_ROWS = HYLEGIC_POINTS + [ALMUTEM_HOUSES, ALMUTEM_RULERS]
+
+# Scores of the planetary time rulers
+DAY_RULER_SCORE = 7
+HOUR_RULER_SCORE = 6
+
+# Index of each planet in the score rows
+PLANET_INDEX = {obj_id: i for (i, obj_id) in enumerate(almutem.OBJECT_LIST)}
+
+# House scores by house index
+HOUSE_SCORES = [almutem.HOUSE_SCORES[house_id] for house_id in const.LIST_HOUSES]
+
+
+def almutem_score_table(config=None) -> list[tuple]:
+    """
+    Returns, for each degree of the zodiac, a tuple with the almutem scores of the seven planets.
+    It considers the terms and faces of a DignityConfig, or the current defaults.
+
+    """
+    res = []
+    for info in essential.get_info_table(config):
+        row = [0] * len(almutem.OBJECT_LIST)
+        for dignity in almutem.DIGNITY_LIST:
+            obj_id = info[dignity]
+            if obj_id:
+                row[PLANET_INDEX[obj_id]] += essential.SCORES[dignity]
+        res.append(tuple(row))
+    return res
+
+
+def _shared_config(config) -> essential.DignityConfig:
+    """ Returns the shared DignityConfig of a configuration, or the default one for None. """
+    if config is None:
+        return essential.DEFAULT_CONFIG
+    return essential.get_config(config.terms, config.faces)
+
+
+# ---------------------- #
+#   AlmutemBatch Class   #
+# ---------------------- #
+
+class AlmutemBatch:
+    """
+    This class represents the almutem scores of a batch of charts.
+
+    The scores of each chart are a list of rows (one per ALMUTEM_ROWS) with the integer scores of
+    the seven planets (ordered as in almutem.OBJECT_LIST).
+
+    """
+
+    def __init__(self, scores, degrees, configs=None):
+        self.scores = scores
+        self.degrees = degrees
+        self.configs = configs if configs is not None else [None] * len(scores)
+
+    def __len__(self):
+        return len(self.scores)
+
+    def totals(self) -> list[list[int]]:
+        """ Returns the total score of each planet for each chart. """
+        return [[sum(column) for column in zip(*rows)] for rows in self.scores]
+
+    def almutems(self) -> list[str]:
+        """ Returns the almutem (planet with higher total score) of each chart. """
+        res = []
+        for totals in self.totals():
+            index = max(range(len(totals)), key=lambda i: totals[i])
+            res.append(almutem.OBJECT_LIST[index])
+        return res
+
+    def as_table(self, index) -> dict:
+        """
+        Returns the almutem table of a chart in the batch, in the same format as
+        almutem.compute(), including the score strings.
+
+        """
+        info_table = essential.get_info_table(self.configs[index])
+        rows = self.scores[index]
+        table = {}
+
+        for row_id, scores in zip(ALMUTEM_ROWS, rows):
+            row = almutem.new_row()
+            for obj_id, score in zip(almutem.OBJECT_LIST, scores):
+                row[obj_id]['score'] = score
+            table[row_id] = row
+
+        # Score strings of hylegic points follow the order of the dignities
+        for row_id, degree in zip(HYLEGIC_POINTS, self.degrees[index]):
+            info = info_table[degree]
+            for dignity in almutem.DIGNITY_LIST:
+                obj_id = info[dignity]
+                if obj_id:
+                    table[row_id][obj_id]['string'] += f'+{essential.SCORES[dignity]}'
+
+        for row_id in [ALMUTEM_HOUSES, ALMUTEM_RULERS]:
+            for values in table[row_id].values():
+                if values['score']:
+                    values['string'] = f'+{values["score"]}'
+
+        scores = almutem.new_row()
+        for row in table.values():
+            for obj_id, values in row.items():
+                scores[obj_id]['string'] += values['string']
+                scores[obj_id]['score'] += values['score']
+        table['Score'] = scores
+
+        return table
+
+
+def almutem_scores(charts, cache=None, config=None) -> AlmutemBatch:
+    """
+    Computes the almutem scores for a batch of charts, given as a ChartBatch or a list of charts.
+    Receives an optional SunTransitCache to share sunrises and sunsets between calls.
+
+    Each chart uses the terms and faces variants of its context, unless an optional
+    DignityConfig overrides them for the whole batch.
+
+    """
+    batch = ChartBatch.from_any(charts)
+    cache = cache if cache else planetarytime.SunTransitCache()
+    configs = [_shared_config(config if config else chart_config)
+               for chart_config in batch.dignities]
+
+    # One score table for each distinct configuration
+    score_tables = {}
+    for chart_config in configs:
+        if chart_config not in score_tables:
+            score_tables[chart_config] = almutem_score_table(chart_config)
+    n_planets = len(almutem.OBJECT_LIST)
+    scores = []
+    degrees = []
+
+    for i in range(len(batch)):
+        score_table = score_tables[configs[i]]
+
+        # Hylegic points
+        hyleg_degrees = [int(batch.lons[obj_id][i]) for obj_id in HYLEGIC_POINTS]
+        rows = [list(score_table[degree]) for degree in hyleg_degrees]
+
+        # House positions
+        cusps = batch.cusps[i]
+        rows.append([
+            HOUSE_SCORES[house_index(cusps, batch.lons[obj_id][i])]
+            for obj_id in almutem.OBJECT_LIST
+        ])
+
+        # Planetary time (the hour ruler takes precedence as in almutem.compute)
+        row = [0] * n_planets
+        ruler, hour_ruler = planetarytime.hour_rulers(
+            batch.jd[i], batch.lat[i], batch.lon[i], batch.utc_offset[i], cache)
+        row[PLANET_INDEX[ruler]] = DAY_RULER_SCORE
+        row[PLANET_INDEX[hour_ruler]] = HOUR_RULER_SCORE
+        rows.append(row)
+
+        scores.append(rows)
+        degrees.append(hyleg_degrees)
+
+    return AlmutemBatch(scores, degrees, configs)
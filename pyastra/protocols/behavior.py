@@ -4,8 +4,7 @@ This module implements the Behavior Traditional Protocol.
 """
 
 from pyastra import const
-from pyastra.core import aspects
-from pyastra.dignities import essential
+from pyastra.protocols.facts import ChartFacts
 
 
 def _merge(list_a, list_b):
@@ -17,42 +16,41 @@ def _merge(list_a, list_b):
     return list(set_)
 
 
-def compute(chart):
-    """ Computes the behavior. """
+def compute(chart, facts=None):
+    """
+    Computes the behavior.
+    Receives an optional ChartFacts object to share intermediate facts with other protocols.
+
+    """
+    facts = facts if facts else ChartFacts(chart)
     factors = []
 
     # Planets in House1 or Conjunct Asc
-    house1 = chart.get_house(const.HOUSE1)
-    planets_house1 = chart.objects.get_objects_in_house(house1)
-    asc = chart.get_angle(const.ASC)
-    planets_conj_asc = chart.objects.get_objects_aspecting(asc, [0])
+    planets_house1 = facts.objects_in_house(const.HOUSE1)
+    planets_conj_asc = facts.objects_aspecting(const.ASC, [0])
 
     _set = _merge(planets_house1, planets_conj_asc)
     factors.append(['Planets in House1 or Conj Asc', _set])
 
     # Planets conjunct Moon or Mercury
-    moon = chart.get(const.MOON)
-    mercury = chart.get(const.MERCURY)
-    planets_conj_moon = chart.objects.get_objects_aspecting(moon, [0])
-    planets_conj_mercury = chart.objects.get_objects_aspecting(mercury, [0])
+    planets_conj_moon = facts.objects_aspecting(const.MOON, [0])
+    planets_conj_mercury = facts.objects_aspecting(const.MERCURY, [0])
 
     _set = _merge(planets_conj_moon, planets_conj_mercury)
     factors.append(['Planets Conj Moon or Mercury', _set])
 
     # Asc ruler if aspected by disposer
-    asc_ruler_id = essential.ruler(asc.sign)
-    asc_ruler = chart.get_object(asc_ruler_id)
-    disposer_id = essential.ruler(asc_ruler.sign)
-    disposer = chart.get_object(disposer_id)
+    asc_ruler = facts.asc_ruler
+    disposer_id = facts.rulers[asc_ruler.id]
 
     _set = []
-    if aspects.is_aspecting(disposer, asc_ruler, const.MAJOR_ASPECTS):
+    if facts.is_aspecting(disposer_id, asc_ruler.id, const.MAJOR_ASPECTS):
         _set = [asc_ruler.id]
     factors.append(['Asc Ruler if aspected by its disposer', _set])
 
     # Planets aspecting Moon or Mercury
-    asp_moon = chart.objects.get_objects_aspecting(moon, [60, 90, 120, 180])
-    asp_mercury = chart.objects.get_objects_aspecting(mercury, [60, 90, 120, 180])
+    asp_moon = facts.objects_aspecting(const.MOON, [60, 90, 120, 180])
+    asp_mercury = facts.objects_aspecting(const.MERCURY, [60, 90, 120, 180])
 
     _set = _merge(asp_moon, asp_mercury)
     factors.append(['Planets Asp Moon or Mercury', _set])
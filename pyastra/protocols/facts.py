@@ -0,0 +1,99 @@
+"""
+This module implements the ChartFacts class, which holds the intermediate facts of a chart that
+are shared by the traditional protocols (almutem, behavior and temperament).
+
+All facts are computed on first access and only once, so a ChartFacts object can be shared by
+several protocols to avoid re-deriving the same facts for each one.
+
+"""
+
+from functools import cached_property
+
+from pyastra import const
+from pyastra.core import aspects
+from pyastra.dignities import essential
+
+
+# ------------------- #
+#   ChartFacts Class  #
+# ------------------- #
+
+class ChartFacts:
+    """ This class represents the shared intermediate facts of a chart. """
+
+    def __init__(self, chart):
+        self.chart = chart
+        self._aspect_grid = {}
+
+    # === Sect and moon phase === #
+
+    @cached_property
+    def is_diurnal(self) -> bool:
+        """ Returns true if the chart is diurnal. """
+        return self.chart.is_diurnal()
+
+    @cached_property
+    def moon_phase(self) -> str:
+        """ Returns the phase of the moon. """
+        return self.chart.get_moon_phase()
+
+    # === Houses and rulers === #
+
+    @cached_property
+    def houses(self) -> dict:
+        """ Returns a dict with the house of each chart object, indexed by object ID. """
+        return {obj.id: self.chart.houses.get_object_house(obj) for obj in self.chart.objects}
+
+    @cached_property
+    def rulers(self) -> dict:
+        """
+        Returns a dict with the ruler (dispositor) of each chart object and angle, indexed by
+        object ID.
+
+        """
+        points = list(self.chart.objects) + list(self.chart.angles)
+        return {obj.id: essential.ruler(obj.sign) for obj in points}
+
+    @cached_property
+    def asc_ruler(self):
+        """ Returns the ruler of the Asc. """
+        return self.chart.get_object(self.rulers[const.ASC])
+
+    def objects_in_house(self, house_id) -> list:
+        """ Returns the chart objects in a house. """
+        return [obj for obj in self.chart.objects if self.houses[obj.id].id == house_id]
+
+    # === Aspects === #
+
+    def aspect_orbs(self, id1, id2) -> dict:
+        """
+        Returns the valid aspect types between two objects and their orbs.
+        Each pair is computed only once for all aspect types.
+
+        """
+        key = (id1, id2)
+        if key not in self._aspect_grid:
+            obj1 = self.chart.get(id1)
+            obj2 = self.chart.get(id2)
+            self._aspect_grid[key] = aspects.aspect_orbs(obj1, obj2, const.ALL_ASPECTS)
+        return self._aspect_grid[key]
+
+    def aspect_type(self, id1, id2, asp_list) -> int:
+        """ Returns the aspect type between objects as in aspects.aspect_type(). """
+        orbs = self.aspect_orbs(id1, id2)
+        for asp_type in asp_list:
+            if asp_type in orbs:
+                return asp_type
+        return const.NO_ASPECT
+
+    def is_aspecting(self, id1, id2, asp_list) -> bool:
+        """ Returns if an object aspects another within orb as in aspects.is_aspecting(). """
+        asp_type = self.aspect_type(id1, id2, asp_list)
+        if asp_type == const.NO_ASPECT:
+            return False
+        return self.aspect_orbs(id1, id2)[asp_type] < self.chart.get(id1).orb()
+
+    def objects_aspecting(self, point_id, asp_list) -> list:
+        """ Returns the chart planets aspecting a point as in ObjectList.get_objects_aspecting(). """
+        return [obj for obj in self.chart.objects
+                if obj.is_planet() and self.is_aspecting(obj.id, point_id, asp_list)]
@@ -0,0 +1,26 @@
+"""
+This module implements a pipeline to compute all the traditional protocols of a chart.
+
+The almutem, behavior and temperament protocols share many intermediate facts, such as the Asc
+ruler, the aspects to the Moon and Mercury and the houses of the planets. The pipeline computes
+these facts once in a ChartFacts object which is consumed by all protocols.
+
+"""
+
+from pyastra.protocols import almutem, behavior
+from pyastra.protocols.facts import ChartFacts
+from pyastra.protocols.temperament import Temperament
+
+
+def compute(chart, facts=None) -> dict:
+    """
+    Returns a dict with the almutem, behavior and temperament of a chart, computed over shared
+    chart facts.
+
+    """
+    facts = facts if facts else ChartFacts(chart)
+    return {
+        'almutem': almutem.compute(chart, facts),
+        'behavior': behavior.compute(chart, facts),
+        'temperament': Temperament(chart, facts),
+    }
@@ -8,8 +8,7 @@ and other things which affects the Asc, the Moon and the Sun Season.
 
 from pyastra import const
 from pyastra import definitions
-from pyastra.core import aspects
-from pyastra.dignities import essential
+from pyastra.protocols.facts import ChartFacts
 
 # Temperament factors
 ASC_SIGN = 'Asc Sign'
@@ -33,7 +32,7 @@ MOD_MOON = 'Moon'
 
 # === Computation of factors === #
 
-def single_factor(factors, chart, factor, obj, aspect=None):
+def single_factor(factors, facts, factor, obj, aspect=None):
     """" Single factor for the table. """
     obj_id = obj if isinstance(obj, str) else obj.id
     res = {
@@ -55,7 +54,7 @@ def single_factor(factors, chart, factor, obj, aspect=None):
 
     # For Moon return phase and phase element
     elif obj_id == const.MOON:
-        phase = chart.get_moon_phase()
+        phase = facts.moon_phase
         res['phase'] = phase
         res['element'] = definitions.base.MOONPHASE_ELEMENTS[phase]
 
@@ -74,9 +73,9 @@ def single_factor(factors, chart, factor, obj, aspect=None):
     return res
 
 
-def modifier_factor(factor, factor_obj, other_obj, asp_list):
+def modifier_factor(facts, factor, factor_obj, other_obj, asp_list):
     """ Computes a factor for a modifier. """
-    asp = aspects.aspect_type(factor_obj, other_obj, asp_list)
+    asp = facts.aspect_type(factor_obj.id, other_obj.id, asp_list)
     if asp != const.NO_ASPECT:
         return {
             'factor': factor,
@@ -89,78 +88,77 @@ def modifier_factor(factor, factor_obj, other_obj, asp_list):
 
 # === Temperament factors and modifiers === #
 
-def get_factors(chart):
+def get_factors(chart, facts=None):
     """ Returns the factors for the temperament. """
+    facts = facts if facts else ChartFacts(chart)
     factors = []
 
     # Asc sign
     asc = chart.get_angle(const.ASC)
-    single_factor(factors, chart, ASC_SIGN, asc.sign)
+    single_factor(factors, facts, ASC_SIGN, asc.sign)
 
     # Asc ruler
-    asc_ruler_id = essential.ruler(asc.sign)
-    asc_ruler = chart.get_object(asc_ruler_id)
-    single_factor(factors, chart, ASC_RULER, asc_ruler)
-    single_factor(factors, chart, ASC_RULER_SIGN, asc_ruler.sign)
+    asc_ruler = facts.asc_ruler
+    single_factor(factors, facts, ASC_RULER, asc_ruler)
+    single_factor(factors, facts, ASC_RULER_SIGN, asc_ruler.sign)
 
     # Planets in House 1
-    house1 = chart.get_house(const.HOUSE1)
-    planets_house1 = chart.objects.get_objects_in_house(house1)
+    planets_house1 = facts.objects_in_house(const.HOUSE1)
     for obj in planets_house1:
-        single_factor(factors, chart, HOUSE1_PLANETS_IN, obj)
+        single_factor(factors, facts, HOUSE1_PLANETS_IN, obj)
 
     # Planets conjunct Asc
-    planets_conj_asc = chart.objects.get_objects_aspecting(asc, [0])
+    planets_conj_asc = facts.objects_aspecting(const.ASC, [0])
     for obj in planets_conj_asc:
         # Ignore planets already in house 1
         if obj not in planets_house1:
-            single_factor(factors, chart, ASC_PLANETS_CONJ, obj)
+            single_factor(factors, facts, ASC_PLANETS_CONJ, obj)
 
     # Planets aspecting Asc cusp
     asp_list = [60, 90, 120, 180]
-    planets_asp_asc = chart.objects.get_objects_aspecting(asc, asp_list)
+    planets_asp_asc = facts.objects_aspecting(const.ASC, asp_list)
     for obj in planets_asp_asc:
-        aspect = aspects.aspect_type(obj, asc, asp_list)
-        single_factor(factors, chart, ASC_PLANETS_ASP, obj, aspect)
+        aspect = facts.aspect_type(obj.id, const.ASC, asp_list)
+        single_factor(factors, facts, ASC_PLANETS_ASP, obj, aspect)
 
     # Moon sign and phase
     moon = chart.get_object(const.MOON)
-    single_factor(factors, chart, MOON_SIGN, moon.sign)
-    single_factor(factors, chart, MOON_PHASE, moon)
+    single_factor(factors, facts, MOON_SIGN, moon.sign)
+    single_factor(factors, facts, MOON_PHASE, moon)
 
     # Moon dispositor
-    moon_ruler_id = essential.ruler(moon.sign)
+    moon_ruler_id = facts.rulers[const.MOON]
     moon_ruler = chart.get_object(moon_ruler_id)
-    moon_factor = single_factor(factors, chart, MOON_DISPOSITOR_SIGN, moon_ruler.sign)
+    moon_factor = single_factor(factors, facts, MOON_DISPOSITOR_SIGN, moon_ruler.sign)
     moon_factor['planetID'] = moon_ruler_id  # Append moon dispositor ID
 
     # Planets conjunct Moon
-    planets_conj_moon = chart.objects.get_objects_aspecting(moon, [0])
+    planets_conj_moon = facts.objects_aspecting(const.MOON, [0])
     for obj in planets_conj_moon:
-        single_factor(factors, chart, MOON_PLANETS_CONJ, obj)
+        single_factor(factors, facts, MOON_PLANETS_CONJ, obj)
 
     # Planets aspecting Moon
     asp_list = [60, 90, 120, 180]
-    planets_asp_moon = chart.objects.get_objects_aspecting(moon, asp_list)
+    planets_asp_moon = facts.objects_aspecting(const.MOON, asp_list)
     for obj in planets_asp_moon:
-        aspect = aspects.aspect_type(obj, moon, asp_list)
-        single_factor(factors, chart, MOON_PLANETS_ASP, obj, aspect)
+        aspect = facts.aspect_type(obj.id, const.MOON, asp_list)
+        single_factor(factors, facts, MOON_PLANETS_ASP, obj, aspect)
 
     # Sun season
     sun = chart.get_object(const.SUN)
-    single_factor(factors, chart, SUN_SEASON, sun)
+    single_factor(factors, facts, SUN_SEASON, sun)
 
     return factors
 
 
-def get_modifiers(chart):
+def get_modifiers(chart, facts=None):
     """ Returns the factors of the temperament modifiers. """
+    facts = facts if facts else ChartFacts(chart)
     modifiers = []
 
     # Factors which can be affected
     asc = chart.get_angle(const.ASC)
-    asc_ruler_id = essential.ruler(asc.sign)
-    asc_ruler = chart.get_object(asc_ruler_id)
+    asc_ruler = facts.asc_ruler
     moon = chart.get_object(const.MOON)
     factors = [
         [MOD_ASC, asc],
@@ -181,7 +179,7 @@ def get_modifiers(chart):
     # Do calculations of afflictions
     for affecting_obj, affecting_asps in affect:
         for factor, affected_obj in factors:
-            modf = modifier_factor(factor, affected_obj, affecting_obj, affecting_asps)
+            modf = modifier_factor(facts, factor, affected_obj, affecting_obj, affecting_asps)
             if modf:
                 modifiers.append(modf)
 
@@ -227,18 +225,26 @@ def scores(factors):
 # --------------------- #
 
 class Temperament:
-    """ This class represents the calculation of the temperament of a chart. """
+    """
+    This class represents the calculation of the temperament of a chart.
+    Receives an optional ChartFacts object to share intermediate facts with other protocols.
 
-    def __init__(self, chart):
+    """
+
+    def __init__(self, chart, facts=None):
         self.chart = chart
+        self.facts = facts if facts else ChartFacts(chart)
+        self._factors = None
 
     def get_factors(self):
         """ Returns the list of temperament factors. """
-        return get_factors(self.chart)
+        if self._factors is None:
+            self._factors = get_factors(self.chart, self.facts)
+        return self._factors
 
     def get_modifiers(self):
         """ Returns the list of temperament modifiers. """
-        return get_modifiers(self.chart)
+        return get_modifiers(self.chart, self.facts)
 
     def get_score(self):
         """ Returns the temperament and qualitiy scores. """
@@ -0,0 +1,205 @@
+"""
+This module implements a persistent store of charts in a SQLite database.
+
+Charts are stored by a stable hash of their ChartContext, list of object IDs and the versions
+of the library, of the storage format and of the Swiss Ephemeris. Only the positions of the
+objects, houses and angles are stored, so loading a chart costs one indexed read instead of
+the ephemeris calls:
+
+    store = ChartStore('charts.db')
+    chart = Chart(date, pos, store=store)
+
+SQLite handles concurrent access from several processes. Each thread uses its own connection
+and the store can be sent to other processes (for instance in aio runners), where it opens
+its own connections.
+
+"""
+
+import dataclasses
+import hashlib
+import importlib.metadata
+import json
+import sqlite3
+import threading
+import time
+
+from pyastra import const
+from pyastra.core.chart import Chart
+from pyastra.core.lists import GenericList, HouseList, ObjectList
+from pyastra.core.objects import GenericObject, House, Object
+from pyastra.ephem import backends, swe
+
+# Version of the storage format
+FORMAT_VERSION = 1
+
+# Default maximum number of stored charts
+MAX_ENTRIES = 100000
+
+# Number of writes between evictions
+EVICT_INTERVAL = 100
+
+
+def _library_version() -> str:
+    """ Returns the version of the installed library. """
+    try:
+        return importlib.metadata.version('pyastra')
+    except importlib.metadata.PackageNotFoundError:
+        return 'unknown'
+
+
+# Versions which invalidate the stored charts
+VERSION = f'{FORMAT_VERSION}/{_library_version()}/{swe.SWE_VERSION}'
+
+
+# === Serialization === #
+
+def chart_key(context, ids) -> str:
+    """ Returns the stable hash of a chart context and list of object IDs. """
+    # The ephemeris backend is resolved, so that charts of different default backends differ
+    values = dict(dataclasses.asdict(context), ephemeris=backends.get_name(context))
+    data = json.dumps([values, list(ids), VERSION], sort_keys=True)
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
+def dumps(chart) -> str:
+    """ Returns the positions of the objects, houses and angles of a chart as JSON. """
+    return json.dumps({
+        'objects': [[obj.id, obj.lon, obj.lat, obj.lon_speed, obj.lat_speed]
+                    for obj in chart.objects],
+        'houses': [[house.id, house.lon, house.lat, house.size] for house in chart.houses],
+        'angles': [[obj.id, obj.lon, obj.lat] for obj in chart.angles],
+    }, separators=(',', ':'))
+
+
+def loads(data, chart=None) -> tuple:
+    """ Returns the (objects, houses, angles) lists of a chart from its JSON positions. """
+    values = json.loads(data)
+    objects = ObjectList([
+        Object(id=obj_id, lon=lon, lat=lat, lon_speed=lon_speed, lat_speed=lat_speed,
+               chart=chart)
+        for (obj_id, lon, lat, lon_speed, lat_speed) in values['objects']
+    ])
+    houses = HouseList([
+        House(id=obj_id, lon=lon, lat=lat, size=size, chart=chart)
+        for (obj_id, lon, lat, size) in values['houses']
+    ])
+    angles = GenericList([
+        GenericObject(id=obj_id, lon=lon, lat=lat, chart=chart)
+        for (obj_id, lon, lat) in values['angles']
+    ])
+    return objects, houses, angles
+
+
+# -------------------- #
+#   ChartStore Class   #
+# -------------------- #
+
+class ChartStore:
+    """
+    This class represents a persistent store of charts in a SQLite database.
+    Receives the path of the database and the maximum number of charts kept, evicting the
+    oldest ones.
+
+    """
+
+    def __init__(self, path, max_entries=MAX_ENTRIES, timeout=30.0):
+        self.path = path
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self._local = threading.local()
+        self._writes = 0
+
+    def __getstate__(self):
+        return {'path': self.path, 'max_entries': self.max_entries, 'timeout': self.timeout}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def _connection(self) -> sqlite3.Connection:
+        """ Returns the connection of the current thread. """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('CREATE TABLE IF NOT EXISTS charts ('
+                         'key TEXT PRIMARY KEY, data TEXT NOT NULL, created REAL NOT NULL)')
+            conn.execute('CREATE INDEX IF NOT EXISTS charts_created ON charts (created)')
+            self._local.conn = conn
+        return conn
+
+    def __len__(self):
+        return self._connection().execute('SELECT COUNT(*) FROM charts').fetchone()[0]
+
+    def __contains__(self, key):
+        row = self._connection().execute('SELECT 1 FROM charts WHERE key = ?', (key,))
+        return row.fetchone() is not None
+
+    # === Reads and writes === #
+
+    def get(self, context, ids=const.LIST_OBJECTS_TRADITIONAL, chart=None) -> tuple | None:
+        """
+        Returns the (objects, houses, angles) lists of a stored chart, belonging to 'chart',
+        or None if the chart is not stored.
+
+        """
+        row = self._connection().execute('SELECT data FROM charts WHERE key = ?',
+                                         (chart_key(context, ids),)).fetchone()
+        return loads(row[0], chart) if row else None
+
+    def save(self, chart, ids=None):
+        """ Stores a chart, given the list of object IDs it was built with. """
+        ids = ids if ids is not None else [obj.id for obj in chart.objects]
+        self.save_many([(chart, ids)])
+
+    def save_many(self, charts):
+        """ Stores a list of (chart, ids) pairs in a single transaction. """
+        rows = [(chart_key(chart.context, ids), dumps(chart), time.time())
+                for (chart, ids) in charts]
+        conn = self._connection()
+        with conn:
+            conn.execute('BEGIN IMMEDIATE')
+            conn.executemany('INSERT OR REPLACE INTO charts VALUES (?, ?, ?)', rows)
+        self._writes += len(rows)
+        if self._writes >= EVICT_INTERVAL:
+            self.evict()
+
+    def preload(self, contexts, ids=const.LIST_OBJECTS_TRADITIONAL) -> int:
+        """
+        Computes and stores the charts of a list of contexts which are not stored yet.
+        Returns the number of computed charts.
+
+        """
+        ids = list(ids)
+        missing = [context for context in dict.fromkeys(contexts)
+                   if chart_key(context, ids) not in self]
+        self.save_many([(Chart.from_context(context, ids), ids) for context in missing])
+        return len(missing)
+
+    # === Maintenance === #
+
+    def evict(self) -> int:
+        """ Removes the oldest charts above the maximum number. Returns the removed charts. """
+        self._writes = 0
+        conn = self._connection()
+        with conn:
+            conn.execute('BEGIN IMMEDIATE')
+            excess = len(self) - self.max_entries
+            if excess <= 0:
+                return 0
+            conn.execute('DELETE FROM charts WHERE key IN '
+                         '(SELECT key FROM charts ORDER BY created LIMIT ?)', (excess,))
+        return excess
+
+    def clear(self):
+        """ Removes all charts. """
+        conn = self._connection()
+        with conn:
+            conn.execute('DELETE FROM charts')
+
+    def close(self):
+        """ Closes the connection of the current thread. """
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
@@ -1,9 +1,14 @@
 """
 This module provides useful functions for computing Arabic Parts.
+
+The PartsEvaluator compiles the formulas into a plan ordered by dependencies (for instance,
+Pars Jupiter depends on Pars Spirit), so that all parts of a chart are computed in one pass with
+the sect of the chart resolved only once. User-defined parts are compiled into the same plan.
   
 """
 
 from pyastra import const
+from pyastra.core import angle
 from pyastra.core.objects.generic import GenericObject
 from pyastra.dignities import essential
 
@@ -157,3 +162,137 @@ def get_part(obj_id, chart):
     obj.type = const.OBJ_ARABIC_PART
     obj.relocate(part_lon(obj_id, chart))
     return obj
+
+
+# --------------------------- #
+#   PartsEvaluator Class      #
+# --------------------------- #
+
+RULER_PREFIX = '$R'
+
+
+def _source_part(source, formulas) -> str | None:
+    """ Returns the arabic part referenced by a formula source, or None if not a part. """
+    if source.startswith(RULER_PREFIX):
+        source = source[len(RULER_PREFIX):]
+    return source if source in formulas else None
+
+
+def compile_plan(formulas=FORMULAS, parts=None) -> list[str]:
+    """
+    Returns the list of arabic parts ordered by their dependencies, so that each part comes after
+    the parts used in its formulas. If a list of parts is given, the plan only includes those
+    parts and their dependencies.
+
+    """
+    plan = []
+    state = {}  # 1 while visiting and 2 when done
+
+    def visit(part_id):
+        if state.get(part_id) == 2:
+            return
+        if state.get(part_id) == 1:
+            raise ValueError(f"Arabic part '{part_id}' has a circular dependency.")
+        if part_id not in formulas:
+            raise ValueError(f"'{part_id}' is not a known arabic part.")
+        state[part_id] = 1
+        for abc in formulas[part_id]:
+            for source in abc:
+                dependency = _source_part(source, formulas)
+                if dependency:
+                    visit(dependency)
+        state[part_id] = 2
+        plan.append(part_id)
+
+    for part_id in (parts if parts is not None else formulas):
+        visit(part_id)
+    return plan
+
+
+class PartsEvaluator:
+    """
+    This class computes arabic parts using a compiled plan.
+
+    It receives optional user-defined formulas, in the same format as FORMULAS, which can use
+    other parts (including user-defined) in their sources.
+
+    """
+
+    def __init__(self, formulas=None):
+        self.formulas = dict(FORMULAS)
+        self.formulas.update(formulas if formulas else {})
+        self._plans = {}
+
+    def add_part(self, part_id, diurnal, nocturnal=None):
+        """
+        Adds a user-defined part given its diurnal and (optional) nocturnal formulas as lists
+        of [A, B, C] sources, meaning "Distance of A to B projected from C".
+
+        """
+        self.formulas[part_id] = [list(diurnal), list(nocturnal if nocturnal else diurnal)]
+        self._plans = {}
+
+    def plan(self, parts=None) -> list[str]:
+        """ Returns the compiled plan for a list of parts (or all parts). """
+        key = tuple(parts) if parts is not None else None
+        if key not in self._plans:
+            self._plans[key] = compile_plan(self.formulas, parts)
+        return self._plans[key]
+
+    def _source_lon(self, source, chart, values):
+        """ Returns the longitude of a formula source, caching it in 'values'. """
+        if source in values:
+            return values[source]
+        if source.startswith(RULER_PREFIX):
+            obj_id = source[len(RULER_PREFIX):]
+            if obj_id in self.formulas:
+                sign = const.LIST_SIGNS[int(angle.norm(values[obj_id]) / 30)]
+            else:
+                sign = chart.get(obj_id).sign
+            lon = chart.get_object(essential.ruler(sign)).lon
+        else:
+            lon = chart.get(source).lon
+        values[source] = lon
+        return lon
+
+    def evaluate(self, chart, parts=None) -> dict:
+        """
+        Returns a dict with the longitudes of the arabic parts of a chart, given a list of parts
+        (or all parts). The sect, objects and rulers are resolved only once.
+
+        """
+        index = 0 if chart.is_diurnal() else 1
+        values = {}
+        for part_id in self.plan(parts):
+            a, b, c = self.formulas[part_id][index]
+            values[part_id] = (self._source_lon(c, chart, values) +
+                               self._source_lon(b, chart, values) -
+                               self._source_lon(a, chart, values))
+
+        part_ids = parts if parts is not None else self.formulas
+        return {part_id: angle.norm(values[part_id]) for part_id in part_ids}
+
+    def evaluate_batch(self, charts, parts=None) -> dict:
+        """
+        Returns a dict with the longitudes of the arabic parts for a batch of charts, in
+        columnar format (one list of longitudes per part).
+
+        """
+        part_ids = list(parts if parts is not None else self.formulas)
+        res = {part_id: [] for part_id in part_ids}
+        for chart in charts:
+            values = self.evaluate(chart, part_ids)
+            for part_id in part_ids:
+                res[part_id].append(values[part_id])
+        return res
+
+    def get_parts(self, chart, parts=None) -> list[GenericObject]:
+        """ Returns the arabic parts of a chart as objects. """
+        res = []
+        for part_id, lon in self.evaluate(chart, parts).items():
+            obj = GenericObject()
+            obj.id = part_id
+            obj.type = const.OBJ_ARABIC_PART
+            obj.relocate(lon)
+            res.append(obj)
+        return res
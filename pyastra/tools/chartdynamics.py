@@ -24,7 +24,7 @@ class ChartDynamics:
     def in_dignities(self, id_a, id_b):
         """ Returns the dignities of A which belong to B. """
         obj_a = self.chart.get(id_a)
-        info = essential.get_info(obj_a.sign, obj_a.signlon)
+        info = essential.get_info(obj_a.sign, obj_a.signlon, essential.chart_config(self.chart))
         # Should we ignore exile and fall?
         return [dign for (dign, obj_id) in info.items() if obj_id == id_b]
 
@@ -98,7 +98,9 @@ class ChartDynamics:
         valid = self.valid_aspects(obj_id, asp_list)
         for elem in valid:
             obj_b = self.chart.get_object(elem['id'])
-            asp = aspects.get_aspect(obj_a, obj_b, asp_list)
+            asp = aspects.aspect_record(obj_a, obj_b, asp_list)
+            if asp is None:
+                continue
             role = asp.get_role(obj_a.id)
             if role['in_orb']:
                 movement = role['movement']
@@ -6,8 +6,11 @@ and hour rulers, including the start and ending datetimes of each hour ruler.
   
 """
 
-from pyastra import const
-from pyastra.ephem import ephem
+import bisect
+import math
+
+from pyastra import const, profiling
+from pyastra.ephem import backends, ephem, swe
 from pyastra.core.datetime import Datetime
 
 # Planetary rulers starting at Sunday
@@ -55,6 +58,7 @@ def nth_ruler(n, dow):
     return ROUND_LIST[index]
 
 
+@profiling.traced(profiling.OPERATION_PLANETARY_HOURS)
 def hour_table(date, pos):
     """
     Creates the planetary hour table for a date and position.
@@ -94,6 +98,64 @@ def get_hour_table(date, pos):
     return HourTable(table, date)
 
 
+# ------------------------- #
+#   SunTransitCache Class   #
+# ------------------------- #
+
+class SunTransitCache:
+    """
+    This class caches the sunrises and sunsets of each location, so that planetary times for many
+    dates of the same days and locations only need the ephemeris once.
+
+    Each cached entry is a day given by (sunrise, sunset, next sunrise).
+
+    """
+
+    def __init__(self):
+        self.days = {}
+
+    def _compute_day(self, jd, lat, lon):
+        """ Computes the day (sunrise, sunset, next sunrise) containing a julian date. """
+        backend = backends.get()
+        next_rise = backend.next_transit(const.SUN, jd, lat, lon, swe.CALC_RISE)
+        rise = backend.next_transit(const.SUN, next_rise - 1.1, lat, lon, swe.CALC_RISE)
+        sunset = backend.next_transit(const.SUN, rise, lat, lon, swe.CALC_SET)
+        return rise, sunset, next_rise
+
+    def get_day(self, jd, lat, lon) -> tuple:
+        """ Returns the day (sunrise, sunset, next sunrise) containing a julian date. """
+        rises, days = self.days.setdefault((lat, lon), ([], []))
+        index = bisect.bisect_right(rises, jd)
+        if index > 0 and jd <= days[index - 1][2]:
+            return days[index - 1]
+
+        day = self._compute_day(jd, lat, lon)
+        index = bisect.bisect_left(rises, day[0])
+        rises.insert(index, day[0])
+        days.insert(index, day)
+        return day
+
+
+def hour_rulers(jd, lat, lon, utc_offset=0.0, cache=None) -> tuple:
+    """
+    Returns the current day or night ruler and the hour ruler for a julian date and location,
+    without building the complete HourTable.
+    
+    The utc_offset (in hours) sets the local day of the week of the sunrise.
+
+    """
+    cache = cache if cache else SunTransitCache()
+    rise, sunset, next_rise = cache.get_day(jd, lat, lon)
+    dow = Datetime.from_jd(rise, utc_offset).date.dayofweek()
+
+    if jd <= sunset:
+        index = min(math.floor(12 * (jd - rise) / (sunset - rise)), 11)
+        return nth_ruler(0, dow), nth_ruler(index, dow)
+
+    index = min(math.floor(12 * (jd - sunset) / (next_rise - sunset)), 11)
+    return nth_ruler(12, dow), nth_ruler(index + 12, dow)
+
+
 # ------------------- #
 #   HourTable Class   #
 # ------------------- #
@@ -0,0 +1,151 @@
+"""
+This module implements the ReceptionMatrix class, which holds the receptions and dispositors
+between the seven planets of a chart.
+
+The matrix is computed once per chart: the essential dignities of each planet's position and the
+major aspects between each pair of planets. Mutual receptions and the dispositor graph (chains,
+final dispositor and cycles) are derived from it, so they can be shared by the accidental
+dignities, the protocols and the LLM descriptions.
+
+"""
+
+from pyastra import const
+from pyastra.core import aspects
+from pyastra.dignities import essential
+
+# Dignities considered for ruler and exaltation mutual receptions
+RE_DIGNITIES = ['ruler', 'exalt']
+
+# Essential debilities, which are included in the matrix but are not receptions
+DEBILITIES = ['exile', 'fall']
+
+
+# ------------------------- #
+#   ReceptionMatrix Class   #
+# ------------------------- #
+
+class ReceptionMatrix:
+    """
+    This class represents the 7x7 reception matrix of the seven planets of a chart.
+
+    - dignities[a][b]: the dignities of A's position which belong to B (B disposits A);
+    - aspects[a][b]: true if A aspects B within A's orb, considering the major aspects.
+
+    """
+
+    def __init__(self, chart, planets=const.LIST_SEVEN_PLANETS):
+        self.planets = list(planets)
+        self.dignities = {}
+        self.aspects = {obj_id: {} for obj_id in self.planets}
+
+        objs = [chart.get_object(obj_id) for obj_id in self.planets]
+        config = essential.chart_config(chart)
+
+        # Dignities held by each planet on each position
+        for obj in objs:
+            info = essential.get_info(obj.sign, obj.signlon, config)
+            self.dignities[obj.id] = {
+                obj_id: [dign for (dign, owner) in info.items() if owner == obj_id]
+                for obj_id in self.planets
+            }
+
+        # The aspect type and orb does not depend on the order of the objects, only the orb
+        # of the aspecting object, so each pair is computed once
+        for i, obj_a in enumerate(objs):
+            self.aspects[obj_a.id][obj_a.id] = False
+            for obj_b in objs[i + 1:]:
+                orbs = aspects.aspect_orbs(obj_a, obj_b, const.MAJOR_ASPECTS)
+                orb = next((orbs[asp] for asp in const.MAJOR_ASPECTS if asp in orbs), None)
+                self.aspects[obj_a.id][obj_b.id] = orb is not None and orb < obj_a.orb()
+                self.aspects[obj_b.id][obj_a.id] = orb is not None and orb < obj_b.orb()
+
+    # === Receptions === #
+
+    def in_dignities(self, id_a, id_b) -> list:
+        """ Returns the dignities of A which belong to B. """
+        return self.dignities[id_a][id_b]
+
+    def receives(self, id_a, id_b) -> list:
+        """
+        Returns the dignities where A receives B.
+        A receives B when (1) B aspects A and (2) B is in dignities of A.
+
+        """
+        return self.dignities[id_b][id_a] if self.aspects[id_b][id_a] else []
+
+    def mutual_receptions(self, id_a, id_b) -> list:
+        """ Returns all pairs of dignities in mutual reception. """
+        ab = self.receives(id_a, id_b)
+        ba = self.receives(id_b, id_a)
+        return [(a, b) for a in ab for b in ba]
+
+    def re_mutual_receptions(self, id_a, id_b) -> list:
+        """ Returns ruler and exaltation mutual receptions. """
+        return [(a, b) for (a, b) in self.mutual_receptions(id_a, id_b)
+                if a in RE_DIGNITIES and b in RE_DIGNITIES]
+
+    def receptions_by_type(self) -> dict:
+        """
+        Returns the mutual receptions between all pairs of planets indexed by the pair of
+        dignities, as lists of (A, B) pairs of planets.
+
+        """
+        res = {}
+        for i, id_a in enumerate(self.planets):
+            for id_b in self.planets[i + 1:]:
+                for pair in self.mutual_receptions(id_a, id_b):
+                    res.setdefault(pair, []).append((id_a, id_b))
+        return res
+
+    # === Dispositors === #
+
+    def dispositor(self, obj_id) -> str:
+        """ Returns the dispositor (ruler of the sign) of a planet. """
+        return next(owner for owner in self.planets
+                    if 'ruler' in self.dignities[obj_id][owner])
+
+    def dispositors(self) -> dict:
+        """ Returns the dispositor of each planet, indexed by planet ID. """
+        return {obj_id: self.dispositor(obj_id) for obj_id in self.planets}
+
+    def dispositor_chain(self, obj_id) -> list:
+        """
+        Returns the chain of dispositors of a planet, starting with the planet and ending when a
+        dispositor is repeated (a planet in its own sign or a cycle).
+
+        """
+        chain = [obj_id]
+        dispositor = self.dispositor(obj_id)
+        while dispositor not in chain:
+            chain.append(dispositor)
+            dispositor = self.dispositor(dispositor)
+        return chain
+
+    def dispositor_cycles(self) -> list:
+        """
+        Returns the cycles of the dispositor graph, where every chain ends. A planet in its own
+        sign is a cycle with one planet and mutual receptions by sign are cycles with two.
+
+        """
+        cycles = []
+        seen = set()
+        for obj_id in self.planets:
+            chain = self.dispositor_chain(obj_id)
+            start = chain.index(self.dispositor(chain[-1]))
+            cycle = chain[start:]
+            if cycle[0] in seen:
+                continue
+            seen.update(cycle)
+            cycles.append(cycle)
+        return cycles
+
+    def final_dispositor(self) -> str | None:
+        """
+        Returns the final dispositor of the chart, the planet in its own sign where all chains
+        end, or None if there is no such planet.
+
+        """
+        cycles = self.dispositor_cycles()
+        if len(cycles) == 1 and len(cycles[0]) == 1:
+            return cycles[0][0]
+        return None
@@ -40,18 +40,37 @@ def is_above_horizon(ra, decl, mc_ra, lat):
     return dist <= d_arc / 2.0 + 0.0003  # 1 arc-second
 
 
+# === Angles === #
+
+def mc_lon(armc, eps):
+    """ Returns the ecliptic longitude of the MC given the ARMC and the obliquity. """
+    _armc = math.radians(armc)
+    _eps = math.radians(eps)
+    mc = math.atan2(math.sin(_armc), math.cos(_armc) * math.cos(_eps))
+    return angle.norm(math.degrees(mc))
+
+
+def asc_lon(armc, lat, eps):
+    """ Returns the ecliptic longitude of the Asc given the ARMC, latitude and obliquity. """
+    _armc = math.radians(armc)
+    _eps = math.radians(eps)
+    asc = math.atan2(math.cos(_armc), -(math.sin(_armc) * math.cos(_eps) +
+                                        math.tan(math.radians(lat)) * math.sin(_eps)))
+    return angle.norm(math.degrees(asc))
+
+
 # === Coordinate systems === #
 
-def eq_coords(lon, lat):
+def eq_coords(lon, lat, eps=23.44):
     """
-    Converts from ecliptical to equatorial coordinates.
+    Converts from ecliptical to equatorial coordinates, given the obliquity of the ecliptic.
     This algorithm is described in book 'Primary Directions', pp. 147-150.
     
     """
     # Convert to radians
     _lambda = math.radians(lon)
     _beta = math.radians(lat)
-    _epson = math.radians(23.44)  # The earth's inclination
+    _epson = math.radians(eps)  # The earth's inclination
 
     # Declination in radians
     decl = math.asin(math.sin(_epson) * math.sin(_lambda) * math.cos(_beta) + \
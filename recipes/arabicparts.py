@@ -18,3 +18,8 @@ chart = Chart(date, pos)
 # Retrieve the Pars Spirit
 parsSpirit = arabicparts.get_part(arabicparts.PARS_SPIRIT, chart)
 print(parsSpirit)    # <Pars Spirit Sagittarius +03:52:01>
+
+# Compute all arabic parts at once
+evaluator = arabicparts.PartsEvaluator()
+for part in evaluator.get_parts(chart):
+    print(part)
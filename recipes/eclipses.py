@@ -0,0 +1,28 @@
+"""
+Author: João Ventura <joaojonesventura@gmail.com>
+This recipe shows sample code for handling the eclipse index.
+
+"""
+
+from pyastra import const
+from pyastra.core.chart import Chart
+from pyastra.core.datetime import Datetime
+from pyastra.core.geopos import GeoPos
+from pyastra.predictives.eclipses import EclipseIndex
+
+
+# Build a chart for a date and location
+date = Datetime('2015/03/13', '17:00', '+00:00')
+pos = GeoPos('38n32', '8w54')
+chart = Chart(date, pos)
+
+# Build an index of eclipses for a few years (use eclipses.get_index() for the full range)
+index = EclipseIndex.build(Datetime('2010/01/01').jd, Datetime('2030/01/01').jd)
+
+# Prenatal eclipses
+print(index.prenatal(chart))                        # Partial solar eclipse of 2014/10/23
+print(index.prenatal(chart, const.ECLIPSE_LUNAR))   # Total lunar eclipse of 2014/10/08
+
+# Eclipses within 3 degrees of the natal planets and angles
+for eclipse, obj_id, dist in index.scan([chart])[0]:
+    print(eclipse.date, eclipse.kind, obj_id, dist)
@@ -0,0 +1,111 @@
+import unittest
+
+from pyastra import const
+from pyastra.context import ChartContext
+from pyastra.core import angle
+from pyastra.core.chart import Chart
+from pyastra.ephem import backends, swe
+from tests.fixtures.common import date, pos
+
+
+class BackendTest(unittest.TestCase):
+
+    def setUp(self):
+        self.swiss = backends.get()
+        self.jds = [date.jd + i * 37.3 for i in range(-20, 20)]
+
+    def assertSamePositions(self, backend, places, zodiac=const.ZODIAC_TROPICAL):
+        for jd in self.jds:
+            context = ChartContext(jd=jd, lat=pos.lat, lon=pos.lon, zodiac=zodiac)
+            for obj_id in const.LIST_SEVEN_PLANETS + [const.NORTH_NODE]:
+                expected = self.swiss.object(obj_id, context)
+                res = backend.object(obj_id, context)
+                self.assertAlmostEqual(angle.closest_distance(expected[0], res[0]), 0, places)
+                self.assertAlmostEqual(expected[1], res[1], places)
+
+    def test_default(self):
+        """The default backend must be the Swiss Ephemeris."""
+        self.assertIsInstance(self.swiss, backends.SwissBackend)
+        self.assertIs(backends.get(ChartContext(jd=date.jd, lat=0, lon=0)), self.swiss)
+
+    def test_moshier(self):
+        """Moshier positions must match the Swiss Ephemeris."""
+        moshier = backends.get(ChartContext(jd=date.jd, lat=0, lon=0,
+                                            ephemeris=const.EPHEM_MOSHIER))
+        self.assertIsInstance(moshier, backends.MoshierBackend)
+        self.assertSamePositions(moshier, 2)
+        self.assertSamePositions(moshier, 2, const.ZODIAC_SIDEREAL)
+
+    def test_tables(self):
+        """Interpolated positions and speeds must match the Swiss Ephemeris."""
+        tables = backends.TableBackend(step=1.0)
+        self.assertSamePositions(tables, 3)
+        self.assertSamePositions(tables, 3, const.ZODIAC_SIDEREAL)
+        expected = self.swiss.object_fast(const.MOON, date.jd)
+        res = tables.object_fast(const.MOON, date.jd)
+        self.assertAlmostEqual(expected[2], res[2], 3)
+
+    def test_precompute(self):
+        """Precomputed tables must not call the base backend."""
+        tables = backends.TableBackend(step=0.5)
+        tables.precompute([const.SUN], date.jd - 1, date.jd + 1)
+        info = tables._entry.cache_info()
+        tables.object_fast(const.SUN, date.jd + 0.7)
+        self.assertEqual(tables._entry.cache_info().misses, info.misses)
+        tables.clear()
+        self.assertEqual(tables._entry.cache_info().currsize, 0)
+
+    def test_no_speed(self):
+        """Backends must skip the speeds when asked."""
+        backend = backends.SwissBackend(speed=False)
+        lon, _, lon_speed, _ = backend.object_fast(const.MOON, date.jd)
+        self.assertEqual(lon_speed, 0)
+        self.assertEqual(lon, self.swiss.object_fast(const.MOON, date.jd)[0])
+        self.assertRaises(ValueError, backends.TableBackend, backend)
+
+    def test_transits(self):
+        """Transits must match the Swiss Ephemeris."""
+        moshier = backends.MoshierBackend()
+        expected = self.swiss.next_transit(const.SUN, date.jd, pos.lat, pos.lon, swe.CALC_RISE)
+        res = moshier.next_transit(const.SUN, date.jd, pos.lat, pos.lon, swe.CALC_RISE)
+        self.assertAlmostEqual(expected, res, 4)
+
+    def test_chart(self):
+        """Charts must use the backend of their context."""
+        backends.register('Test Tables', backends.TableBackend(step=0.25))
+        try:
+            chart = Chart(date, pos, ephemeris='Test Tables')
+            expected = Chart(date, pos)
+            for obj_id in const.LIST_OBJECTS_TRADITIONAL:
+                self.assertAlmostEqual(chart.get(obj_id).lon, expected.get(obj_id).lon, 3)
+            self.assertEqual(chart.houses.get(const.HOUSE1).lon,
+                             expected.houses.get(const.HOUSE1).lon)
+            self.assertEqual(chart.solar_return(2020).context.ephemeris, 'Test Tables')
+        finally:
+            del backends.BACKENDS['Test Tables']
+        self.assertRaises(ValueError, Chart, date, pos, ephemeris='Unknown')
+
+    def test_abstract(self):
+        """Incomplete backends must fail when instantiated."""
+
+        class PositionsOnly(backends.EphemerisBackend):
+            def object(self, obj_id, context):
+                return backends.get().object(obj_id, context)
+
+        self.assertRaises(TypeError, PositionsOnly)
+        self.assertRaises(TypeError, backends.EphemerisBackend)
+
+    def test_set_default(self):
+        """The default backend must be used by contexts without backend."""
+        context = ChartContext(jd=date.jd, lat=pos.lat, lon=pos.lon)
+        backends.set_default(const.EPHEM_MOSHIER)
+        try:
+            self.assertIsInstance(backends.get(context), backends.MoshierBackend)
+            self.assertEqual(backends.get_name(context), const.EPHEM_MOSHIER)
+        finally:
+            backends.set_default(const.EPHEM_SWISS)
+        self.assertRaises(ValueError, backends.set_default, 'Unknown')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+import unittest
+
+from pyastra import const
+from pyastra.core.chart import Chart
+from pyastra.integrations import compact, llm, rendering
+from pyastra.integrations.rendering import ChartRenderer
+
+from tests.fixtures.common import date, pos
+
+
+class CompactTests(unittest.TestCase):
+
+    def setUp(self):
+        self.chart = Chart(date, pos)
+
+    def test_rows(self):
+        """Sections must have one row per object, house and aspect."""
+        sections = dict(compact.stream(self.chart))
+        self.assertEqual(sections[rendering.SECTION_PLANETS].count('\n'),
+                         len(list(self.chart.objects)) + 1)
+        self.assertEqual(sections[rendering.SECTION_HOUSES].count('\n'), 13)
+        self.assertIn('Ma|ruler|5\n', sections[rendering.SECTION_ESSENTIAL_DIGNITIES])
+        verbose = llm.describe_aspects(self.chart).split('\n')
+        self.assertEqual(sections[rendering.SECTION_ASPECTS].count('\n'), len(verbose) + 1)
+
+    def test_max_directions(self):
+        """Directions must be capped keeping the smaller arcs."""
+        directions = compact.top_directions(self.chart, 5,
+                                            direction_type=const.PD_TYPE_ZODIACAL)
+        self.assertEqual(len(directions), 5)
+        expected = self.chart.primary_directions().filter_by(
+            direction_type=const.PD_TYPE_ZODIACAL)[:5]
+        self.assertListEqual([str(d) for d in directions], [str(d) for d in expected])
+        text = llm.describe_primary_directions(self.chart, max_directions=5)
+        self.assertEqual(text.count('\n'), 7)
+
+    def test_measure(self):
+        """Compact sections must be smaller than the textual sections."""
+        verbose = compact.measure(ChartRenderer().stream(self.chart, rendering.CHART_SECTIONS))
+        size = compact.measure(compact.stream(self.chart))
+        for section in rendering.CHART_SECTIONS + ['total']:
+            self.assertLess(size[section]['chars'], verbose[section]['chars'])
+        self.assertEqual(size['total']['tokens'],
+                         sum(size[section]['tokens'] for section in rendering.CHART_SECTIONS))
@@ -0,0 +1,41 @@
+import unittest
+
+from pyastra import const
+from pyastra.core.chart import Chart
+from pyastra.core.datetime import Datetime
+from pyastra.integrations import llm, rendering
+from pyastra.integrations.rendering import ChartRenderer
+
+from tests.fixtures.common import date, pos
+
+
+class RenderingTests(unittest.TestCase):
+
+    def setUp(self):
+        self.chart = Chart(date, pos)
+        self.renderer = ChartRenderer(direction_type=const.PD_TYPE_ZODIACAL)
+
+    def test_render_chart(self):
+        """Default rendering must match the chart description."""
+        self.assertEqual(self.renderer.render(self.chart), llm.describe_chart(self.chart))
+
+    def test_cache(self):
+        """Sections must be rendered once per chart snapshot."""
+        self.renderer.render(self.chart)
+        self.assertEqual(len(self.renderer.cache), len(rendering.CHART_SECTIONS))
+        self.renderer.render(Chart(date, pos))
+        self.assertEqual(len(self.renderer.cache), len(rendering.CHART_SECTIONS))
+
+    def test_profection_hash(self):
+        """Relocated charts must have a different hash."""
+        profection = self.chart.profection(Datetime('2020/01/01', '00:00'))
+        self.assertNotEqual(rendering.chart_hash(self.chart), rendering.chart_hash(profection))
+
+    def test_stream(self):
+        """Sections must be generated lazily and in order."""
+        stream = self.renderer.stream(self.chart)
+        section, _ = next(stream)
+        self.assertEqual(section, rendering.SECTION_PLANETS)
+        self.assertEqual(len(self.renderer.cache), 1)
+        sections = [section] + [section for section, _ in stream]
+        self.assertListEqual(sections, rendering.ALL_SECTIONS)
@@ -0,0 +1,58 @@
+import io
+import json
+import unittest
+
+from pyastra import const
+from pyastra.core import aspects
+from pyastra.core.chart import Chart
+from pyastra.integrations import schemas
+from pyastra.integrations.schemas import SchemaBuilder
+
+from tests.fixtures.common import date, pos
+
+
+class SchemaTests(unittest.TestCase):
+
+    def setUp(self):
+        self.chart = Chart(date, pos)
+        self.builder = SchemaBuilder(self.chart)
+
+    def test_planet_schemas(self):
+        """Builder schemas must match the single object schemas."""
+        for obj in self.chart.objects:
+            self.assertEqual(self.builder.planet_snapshot_schema(obj),
+                             schemas.planet_snapshot_schema(obj))
+            self.assertEqual(self.builder.planet_complete_schema(obj),
+                             schemas.planet_complete_schema(obj, self.chart))
+
+    def test_aspects(self):
+        """Shared aspects must match the aspects of each active object."""
+        for obj in self.chart.objects:
+            expected = []
+            for obj2 in self.chart.objects:
+                aspect = aspects.aspect_record(obj, obj2, const.MAJOR_ASPECTS)
+                if obj != obj2 and aspect is not None and aspect.active.id == obj.id:
+                    expected.append((aspect.passive.id, aspect.type, aspect.orb))
+            self.assertListEqual([(aspect.passive.id, aspect.type, aspect.orb)
+                                  for aspect in self.builder.aspects(obj)], expected)
+
+    def test_house_schemas(self):
+        """House schemas must include the ruler and the tenants of the house."""
+        for house in self.chart.houses:
+            res = schemas.house_schema(house, self.chart)
+            self.assertEqual(res, self.builder.house_schema(house))
+            self.assertEqual(res['Ruler']['Planet'], house.sign.ruler)
+            self.assertListEqual([tenant['Planet'] for tenant in res['Tenants']],
+                                 [obj.id for obj in self.chart.objects if house.has_object(obj)])
+
+    def test_dump_charts(self):
+        """Streamed charts must be a valid JSON list of chart schemas."""
+        fp = io.StringIO()
+        schemas.dump_charts((self.chart for _ in range(3)), fp)
+        data = json.loads(fp.getvalue())
+        self.assertEqual(len(data), 3)
+        self.assertEqual(data[0], json.loads(json.dumps(self.builder.chart_schema())))
+
+        fp = io.StringIO()
+        schemas.dump_charts([], fp)
+        self.assertEqual(json.loads(fp.getvalue()), [])
@@ -0,0 +1,66 @@
+import asyncio
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from pyastra import aio, const
+from pyastra.core.chart import Chart
+
+from tests.fixtures.common import date, pos
+
+
+class AioTest(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.runner = aio.Runner(ThreadPoolExecutor(2), max_concurrency=2)
+
+    async def asyncTearDown(self):
+        self.runner.shutdown()
+        self.runner.executor.shutdown()
+
+    async def test_chart(self):
+        """Async charts must match sync charts."""
+        chart = await aio.achart(date, pos, runner=self.runner, hsys=const.HOUSES_PLACIDUS)
+        expected = Chart(date, pos, hsys=const.HOUSES_PLACIDUS)
+        self.assertEqual(chart.get(const.SUN).lon, expected.get(const.SUN).lon)
+        self.assertEqual(chart.get(const.HOUSE2).lon, expected.get(const.HOUSE2).lon)
+
+        sr_chart = await aio.asolar_return(chart, 2025, runner=self.runner)
+        self.assertEqual(sr_chart.date.jd, expected.solar_return(2025).date.jd)
+
+        table = await aio.aprimary_directions(chart, runner=self.runner)
+        self.assertEqual([str(d) for d in table.all()],
+                         [str(d) for d in expected.primary_directions().all()])
+
+    async def test_concurrency(self):
+        """The number of concurrent computations must be bounded."""
+        running = []
+        peak = []
+
+        def work():
+            running.append(1)
+            peak.append(len(running))
+            time.sleep(0.01)
+            running.pop()
+
+        await asyncio.gather(*[self.runner.run(work) for _ in range(10)])
+        self.assertEqual(max(peak), 2)
+
+    async def test_timeout(self):
+        """Calls must time out, including the time waiting for a slot."""
+        with self.assertRaises(asyncio.TimeoutError):
+            await self.runner.run(time.sleep, 0.2, timeout=0.05)
+        with self.assertRaises(asyncio.TimeoutError):
+            await asyncio.gather(*[self.runner.run(time.sleep, 0.1, timeout=0.15)
+                                   for _ in range(4)])
+
+    async def test_process_pool(self):
+        """Charts must be computed on process pools."""
+        async with aio.Runner(max_concurrency=1) as runner:
+            chart = await aio.achart(date, pos, runner=runner)
+            self.assertEqual(chart.get(const.SUN).lon, Chart(date, pos).get(const.SUN).lon)
+            self.assertIs(chart.get(const.SUN).chart, chart)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+
+from pyastra import const
+from pyastra.core.chart import Chart
+from pyastra.core.datetime import Datetime
+from pyastra.core.geopos import GeoPos
+from pyastra.dignities import essential
+from pyastra.tools import arabicparts
+from pyastra.tools.arabicparts import PartsEvaluator
+
+from tests.fixtures.common import date, pos
+
+
+class ArabicPartsTests(unittest.TestCase):
+
+    def setUp(self):
+        self.charts = [
+            Chart(date, pos),
+            Chart(Datetime('1980/07/21', '04:30', '+01:00'), GeoPos('51n30', '0w07')),
+        ]
+        self.evaluator = PartsEvaluator()
+
+    def test_plan(self):
+        """Parts must come after their dependencies."""
+        plan = self.evaluator.plan()
+        self.assertEqual(len(plan), len(arabicparts.FORMULAS))
+        self.assertLess(plan.index(arabicparts.PARS_SPIRIT), plan.index(arabicparts.PARS_JUPITER))
+        self.assertLess(plan.index(const.PARS_FORTUNA), plan.index(arabicparts.PARS_SATURN))
+        self.assertListEqual(self.evaluator.plan([arabicparts.PARS_VENUS]),
+                             [arabicparts.PARS_SPIRIT, arabicparts.PARS_VENUS])
+
+    def test_evaluate(self):
+        """All parts must match the single part computation."""
+        for chart in self.charts:
+            values = self.evaluator.evaluate(chart)
+            for part_id in arabicparts.FORMULAS:
+                self.assertAlmostEqual(values[part_id], arabicparts.get_part(part_id, chart).lon)
+
+    def test_batch(self):
+        """Batch results must be one column per part."""
+        res = self.evaluator.evaluate_batch(self.charts, [arabicparts.PARS_SPIRIT])
+        self.assertListEqual(list(res), [arabicparts.PARS_SPIRIT])
+        self.assertListEqual(res[arabicparts.PARS_SPIRIT],
+                             [arabicparts.get_part(arabicparts.PARS_SPIRIT, chart).lon
+                              for chart in self.charts])
+
+    def test_user_parts(self):
+        """User-defined parts must be compiled with their dependencies."""
+        self.evaluator.add_part('Lot of Test', ['$R' + arabicparts.PARS_SPIRIT,
+                                                arabicparts.PARS_SPIRIT, const.ASC])
+        chart = self.charts[0]
+        values = self.evaluator.evaluate(chart)
+        spirit = arabicparts.get_part(arabicparts.PARS_SPIRIT, chart)
+        ruler = chart.get_object(essential.ruler(spirit.sign))
+        expected = (chart.get(const.ASC).lon + spirit.lon - ruler.lon) % 360
+        self.assertAlmostEqual(values['Lot of Test'], expected)
+
+        self.evaluator.add_part('Lot A', ['Lot B', const.SUN, const.ASC])
+        self.evaluator.add_part('Lot B', ['Lot A', const.SUN, const.ASC])
+        with self.assertRaises(ValueError):
+            self.evaluator.evaluate(chart)
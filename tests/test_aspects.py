@@ -243,3 +243,43 @@ class AspectTest(ChartTests):
 
     def test_saturn_aspects_pars_fortuna(self):
         self._test_aspect(self.saturn, self.pars_fortuna)
+
+
+class AspectRecordTest(ChartTests):
+
+    def test_records(self):
+        """Records must have the same properties as the aspects."""
+        objs = [self.sun, self.moon, self.mercury, self.venus, self.mars, self.jupiter,
+                self.saturn, self.north_node, self.syzygy, self.pars_fortuna]
+        for obj1 in objs:
+            for obj2 in objs:
+                record = aspects.aspect_record(obj1, obj2, const.MAJOR_ASPECTS)
+                asp = aspects.get_aspect(obj1, obj2, const.MAJOR_ASPECTS)
+                if record is None:
+                    self.assertFalse(asp.exists())
+                    continue
+                self.assertEqual(asp.record, record)
+                self.assertEqual((asp.type, asp.orb, asp.direction, asp.condition),
+                                 (record.type, record.orb, record.direction, record.condition))
+                self.assertEqual(asp.movement(), record.movement())
+                self.assertEqual(str(asp), str(record))
+
+    def test_immutable(self):
+        """Records must be immutable."""
+        asp = aspects.get_aspect(self.sun, self.moon, const.MAJOR_ASPECTS)
+        self.assertRaises(AttributeError, setattr, asp.record, 'orb', 0)
+        self.assertRaises(AttributeError, setattr, asp.active, 'in_orb', False)
+
+    def test_from_dict(self):
+        """Aspects must be built from a dictionary of properties."""
+        asp = aspects.Aspect({
+            'asp_type': 90,
+            'asp_orb': 0.5,
+            'direction': const.DEXTER,
+            'condition': const.ASSOCIATE,
+            'active': {'id': const.MARS, 'in_orb': True, 'movement': const.SEPARATIVE},
+            'passive': {'id': const.SUN, 'in_orb': False, 'movement': const.NO_MOVEMENT},
+        })
+        self.assertEqual(asp.movement(), const.EXACT)
+        self.assertEqual(asp.get_role(const.MARS)['role'], 'active')
+        self.assertFalse(asp.in_orb(const.SUN))
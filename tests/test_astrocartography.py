@@ -0,0 +1,81 @@
+import unittest
+from unittest import mock
+
+from pyastra import const, utils
+from pyastra.core import angle
+from pyastra.core.astrocartography import AstroMap
+from pyastra.core.chart import Chart
+from pyastra.core.geopos import GeoPos
+
+from tests.fixtures.common import date
+
+
+class AstrocartographyTest(unittest.TestCase):
+
+    def setUp(self):
+        self.astromap = AstroMap.build(date)
+        self.lines = self.astromap.lines(step=5.0)
+
+    def test_sun_lines(self):
+        """Charts on the lines of the Sun must have the Sun on the angle."""
+        for angle_id, polylines in self.lines[const.SUN].items():
+            for polyline in polylines:
+                for lat, lon in polyline[1:-1:4]:
+                    chart = Chart(date, GeoPos(lat, lon))
+                    dist = angle.closest_distance(chart.get(angle_id).lon,
+                                                  chart.get(const.SUN).lon)
+                    self.assertAlmostEqual(dist, 0, 2)
+
+    def test_meridian_lines(self):
+        """Charts on the MC lines must have the right ascension of the object on the MC."""
+        for obj_id in self.astromap:
+            lat, lon = self.lines[obj_id][const.MC][0][0]
+            chart = Chart(date, GeoPos(lat, lon))
+            mc_ra, _ = utils.eq_coords(chart.get(const.MC).lon, 0)
+            ra, _ = self.astromap.coords[obj_id]
+            self.assertAlmostEqual(angle.closest_distance(mc_ra, ra), 0, 2)
+
+    def test_circumpolar(self):
+        """Asc and Desc lines must end at the circumpolar limit, on the meridian lines."""
+        moon = self.lines[const.MOON]
+        limit = abs(self.astromap.limit(const.MOON))
+        for angle_id in [const.ASC, const.DESC]:
+            lats = [lat for polyline in moon[angle_id] for lat, _ in polyline]
+            self.assertAlmostEqual(max(lats), limit)
+            self.assertAlmostEqual(min(lats), -limit)
+        self.assertEqual(self.astromap.longitudes(const.MOON, const.ASC, [89.0]), [None])
+
+    def test_antimeridian(self):
+        """Polylines must not jump across the antimeridian."""
+        for obj_lines in self.lines.values():
+            for polylines in obj_lines.values():
+                for polyline in polylines:
+                    for (_, lon0), (_, lon1) in zip(polyline, polyline[1:]):
+                        self.assertLessEqual(abs(lon1 - lon0), 180)
+                        self.assertLessEqual(abs(lon1), 180)
+
+    def test_parans(self):
+        """Parans must be at the crossings of both lines."""
+        parans = self.astromap.parans()
+        self.assertTrue(parans)
+        self.assertEqual(parans, sorted(parans, key=lambda paran: paran.lat))
+        for paran in parans:
+            lon1 = self.astromap.longitudes(paran.id1, paran.angle1, [paran.lat])[0]
+            lon2 = self.astromap.longitudes(paran.id2, paran.angle2, [paran.lat])[0]
+            self.assertAlmostEqual(angle.closest_distance(lon1, lon2), 0, 6)
+            self.assertAlmostEqual(lon1, paran.lon)
+
+    def test_crossings_grid(self):
+        """Crossings must be bisected between the latitudes of the grid."""
+        lats = [0.0, 1.0, 2.0, 3.0]
+        with mock.patch.object(self.astromap, '_bisect',
+                               side_effect=lambda *args: (args[4] + args[5]) / 2) as bisect:
+            parans = self.astromap._crossings(const.SUN, const.MC, const.MOON, const.ASC, lats,
+                                              [10.0] * 4, [9.0, 11.0, 9.0, 11.0])
+        self.assertListEqual([call.args[4:] for call in bisect.call_args_list],
+                             [(0.0, 1.0), (1.0, 2.0), (2.0, 3.0)])
+        self.assertListEqual([paran.lat for paran in parans], [0.5, 1.5, 2.5])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+
+from pyastra import const
+from pyastra.core.batch import ChartBatch
+from pyastra.core.chart import Chart
+from pyastra.core.datetime import Datetime
+from pyastra.core.geopos import GeoPos
+from pyastra.dignities import essential
+from pyastra.protocols import almutem, batch
+
+from tests.fixtures.common import date, pos
+
+
+class BatchTests(unittest.TestCase):
+
+    def setUp(self):
+        self.charts = [
+            Chart(date, pos),
+            Chart(Datetime('1980/07/21', '04:30', '+01:00'), GeoPos('51n30', '0w07')),
+            Chart(Datetime('2001/12/02', '22:10', '-05:00'), GeoPos('40n42', '74w00')),
+        ]
+        self.batch = ChartBatch.from_charts(self.charts)
+
+    def test_house_indexes(self):
+        """House indexes must match the chart houses."""
+        for obj_id in const.LIST_SEVEN_PLANETS:
+            for chart, index in zip(self.charts, self.batch.house_indexes(obj_id)):
+                house = chart.houses.get_object_house(chart.get(obj_id))
+                self.assertEqual(const.LIST_HOUSES[index], house.id)
+
+    def test_almutem_table(self):
+        """Batch almutem tables must match the single chart protocol."""
+        scores = batch.almutem_scores(self.batch)
+        for i, chart in enumerate(self.charts):
+            self.assertDictEqual(scores.as_table(i), almutem.compute(chart))
+
+    def test_almutem_variants(self):
+        """Batch almutem tables must use the terms and faces of each chart."""
+        charts = []
+        for chart in self.charts:
+            charts.append(chart)
+            charts.append(Chart(chart.date, chart.pos, terms=essential.LILLY_TERMS,
+                                faces=essential.TRIPLICITY_FACES))
+        for values in [charts, ChartBatch.from_charts(charts)]:
+            scores = batch.almutem_scores(values)
+            for i, chart in enumerate(charts):
+                self.assertDictEqual(scores.as_table(i), almutem.compute(chart))
+
+        # An explicit configuration overrides the charts
+        config = essential.get_config(essential.LILLY_TERMS, essential.TRIPLICITY_FACES)
+        scores = batch.almutem_scores(charts, config=config)
+        self.assertEqual(scores.scores[0], scores.scores[1])
+
+    def test_almutem_totals(self):
+        """Mercury scores 40 in the fixture chart."""
+        scores = batch.almutem_scores(self.charts)
+        index = almutem.OBJECT_LIST.index(const.MERCURY)
+        self.assertEqual(scores.totals()[0][index], 40)
+        self.assertEqual(scores.almutems()[0], const.MERCURY)
@@ -0,0 +1,60 @@
+import unittest
+
+from benchmarks import importtime, memory, runner
+
+
+class _Node:
+    """ A node which may reference itself. """
+
+    def __init__(self, cyclic=True):
+        self.data = list(range(100))
+        self.node = self if cyclic else None
+
+
+class BenchmarkTests(unittest.TestCase):
+
+    def setUp(self):
+        self.baseline = {'benchmarks': {'a.x': {'median': 1.0}, 'b.x': {'median': 1.0}}}
+        self.results = {'benchmarks': {'a.x': {'median': 1.3}, 'b.x': {'median': 1.1},
+                                       'c.x': {'median': 1.0}}}
+
+    def test_time_case(self):
+        """Timing must report per call statistics."""
+        res = runner.time_case(lambda: None, repeat=3, min_time=0.001)
+        self.assertEqual(res['repeat'], 3)
+        self.assertLessEqual(res['min'], res['median'])
+
+    def test_compare(self):
+        """Benchmarks slower than the threshold must be regressions."""
+        res = runner.compare(self.results, self.baseline, threshold=0.2)
+        self.assertTrue(res['a.x']['regression'])
+        self.assertFalse(res['b.x']['regression'])
+        self.assertNotIn('c.x', res)
+
+    def test_thresholds(self):
+        """Pattern thresholds must override the default threshold."""
+        res = runner.compare(self.results, self.baseline, threshold=0.2,
+                             thresholds={'a.*': 0.5, 'b.*': 0.05})
+        self.assertFalse(res['a.x']['regression'])
+        self.assertTrue(res['b.x']['regression'])
+
+    def test_memory(self):
+        """Memory retained by reference cycles must be detected."""
+        self.assertGreater(memory.allocated(lambda: list(range(100)), 10), 800)
+        res = memory.retained(_Node, 10)
+        self.assertEqual(res['cyclic'], 10)
+        self.assertGreater(res['bytes'], res['bytes_after_gc'])
+        res = memory.retained(lambda: _Node(cyclic=False), 10)
+        self.assertEqual(res['cyclic'], 0)
+
+    def test_import_time(self):
+        """Subsystems must load on first use."""
+        res = importtime.import_time('import pyastra')
+        self.assertGreater(res['time'], 0)
+        self.assertNotIn('pyastra.core.chart', res['modules'])
+        self.assertNotIn('pyastra.ephem.swe', res['modules'])
+        modules = importtime.import_time('from pyastra import Chart')['modules']
+        self.assertIn('pyastra.core.chart', modules)
+        for name in ['pyastra.protocols.almutem', 'pyastra.predictives.primarydirections',
+                     'pyastra.dignities.accidental', 'pyastra.dignities.essential']:
+            self.assertNotIn(name, modules)
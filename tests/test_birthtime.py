@@ -0,0 +1,83 @@
+import unittest
+
+from pyastra import const
+from pyastra.core import angle
+from pyastra.core.birthtime import HOUSE, SIGN, TimeEnvelope
+from pyastra.core.chart import Chart
+from pyastra.core.datetime import Datetime
+from pyastra.predictives import primarydirections
+
+from tests.fixtures.common import date, pos
+
+
+class TimeEnvelopeTest(unittest.TestCase):
+
+    def chart(self, jd, **kwargs):
+        return Chart(Datetime.from_jd(jd, date.utcoffset), pos, **kwargs)
+
+    def assertEnvelope(self, envelope, **kwargs):
+        for i in range(0, len(envelope), 30):
+            chart = self.chart(envelope.jd[i], **kwargs)
+            for obj_id, values in envelope.lons.items():
+                self.assertAlmostEqual(angle.closest_distance(chart.get(obj_id).lon, values[i]),
+                                       0, 3)
+            for house, cusp in zip(chart.houses, envelope.cusps[i]):
+                self.assertAlmostEqual(angle.closest_distance(house.lon, cusp), 0, 3)
+            self.assertEqual(envelope.diurnal[i], chart.is_diurnal())
+
+        self.assertTrue(envelope.changes)
+        for change in envelope.changes:
+            before = self.chart(change.jd - 3 / 86400, **kwargs)
+            after = self.chart(change.jd + 3 / 86400, **kwargs)
+            if change.kind == SIGN:
+                values = before.get(change.id).sign, after.get(change.id).sign
+            else:
+                values = (before.houses.get_object_house(before.get(change.id)).id,
+                          after.houses.get_object_house(after.get(change.id)).id)
+            self.assertEqual(values, (change.before, change.after))
+
+    def test_house_systems(self):
+        """Samples and changes must match the charts built at each time."""
+        for hsys in [const.HOUSES_ALCABITUS, const.HOUSES_PLACIDUS, const.HOUSES_EQUAL]:
+            envelope = TimeEnvelope.build(date, pos, minutes=60, hsys=hsys)
+            self.assertEqual(len(envelope), 121)
+            self.assertEnvelope(envelope, hsys=hsys)
+
+    def test_sidereal(self):
+        """Samples and changes of sidereal charts must match the charts built at each time."""
+        kwargs = {'hsys': const.HOUSES_WHOLE_SIGN, 'zodiac': const.ZODIAC_SIDEREAL}
+        self.assertEnvelope(TimeEnvelope.build(date, pos, minutes=60, **kwargs), **kwargs)
+
+    def test_stable(self):
+        """Features must be either stable or unstable."""
+        envelope = TimeEnvelope.build(date, pos, minutes=60)
+        stable, unstable = envelope.stable(), envelope.unstable()
+        self.assertEqual(set(stable) | set(unstable), set(envelope.features()))
+        self.assertFalse(set(stable) & set(unstable))
+        self.assertEqual(stable[(SIGN, const.SATURN)], envelope.features()[(SIGN, const.SATURN)][0])
+        self.assertIn((SIGN, const.ASC), unstable)
+        for feature, values in unstable.items():
+            self.assertEqual(envelope.features()[feature][0], values[0])
+            self.assertEqual(envelope.features()[feature][-1], values[-1])
+
+        # A short window around the chart has fewer changes
+        short = TimeEnvelope.build(date, pos, minutes=2)
+        self.assertLess(len(short.changes), len(envelope.changes))
+        self.assertIn((HOUSE, const.SATURN), short.stable())
+
+    def test_arcs(self):
+        """Arcs at the time of the chart must match the primary directions of the chart."""
+        chart = Chart(date, pos)
+        envelope = TimeEnvelope.from_chart(chart, minutes=10)
+        center = envelope.minutes.index(0)
+        for sig_id in [const.ASC, const.MC, const.MOON]:
+            arcs = envelope.arcs(const.SUN, sig_id)
+            expected = primarydirections.get_arc(chart.get(const.SUN), chart.get(sig_id),
+                                                 chart.get(const.MC), chart.pos)
+            self.assertAlmostEqual(arcs[center], expected, 6)
+        arcs = envelope.arcs(const.SUN, const.MC)
+        self.assertAlmostEqual(abs(arcs[-1] - arcs[0]), 20 * 360.9856 / 1440, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from pyastra import aio, const
+from pyastra.cache import ChartCache
+from pyastra.context import ChartContext
+
+from tests.fixtures.common import date, pos
+
+CONTEXT = ChartContext(jd=date.jd, lat=pos.lat, lon=pos.lon)
+
+
+class ChartCacheTest(unittest.TestCase):
+
+    def test_get(self):
+        """Charts must be computed once and cached."""
+        cache = ChartCache()
+        chart = cache.get(CONTEXT)
+        self.assertEqual(chart.context, CONTEXT)
+        self.assertIs(cache.get(CONTEXT), chart)
+        self.assertIsNot(cache.get(CONTEXT, [const.SUN]), chart)
+        self.assertEqual((cache.computations, cache.hits), (2, 1))
+
+    def test_threads(self):
+        """Concurrent threads must share one computation."""
+        cache = ChartCache()
+        barrier = threading.Barrier(8)
+
+        def get():
+            barrier.wait()
+            return cache.get(CONTEXT)
+
+        with ThreadPoolExecutor(8) as executor:
+            charts = list(executor.map(lambda _: get(), range(8)))
+        self.assertEqual(cache.computations, 1)
+        self.assertTrue(all(chart is charts[0] for chart in charts))
+
+    def test_ttl(self):
+        """Charts must expire."""
+        cache = ChartCache(ttl=0.01)
+        chart = cache.get(CONTEXT)
+        time.sleep(0.02)
+        self.assertIsNot(cache.get(CONTEXT), chart)
+        self.assertEqual(cache.computations, 2)
+
+    def test_max_size(self):
+        """The least recently used charts must be evicted."""
+        cache = ChartCache(max_size=2)
+        for hsys in [const.HOUSES_PLACIDUS, const.HOUSES_KOCH, const.HOUSES_EQUAL]:
+            cache.get(ChartContext(jd=date.jd, lat=pos.lat, lon=pos.lon, hsys=hsys))
+        self.assertEqual(len(cache), 2)
+
+    def test_error(self):
+        """Errors must be raised and not cached."""
+        cache = ChartCache()
+        context = ChartContext(jd=date.jd, lat=pos.lat, lon=pos.lon, hsys='Unknown')
+        self.assertRaises(KeyError, cache.get, context)
+        self.assertRaises(KeyError, cache.get, context)
+        self.assertEqual(cache.computations, 2)
+
+
+class AsyncChartCacheTest(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.runner = aio.Runner(ThreadPoolExecutor(2))
+
+    async def asyncTearDown(self):
+        self.runner.executor.shutdown()
+
+    async def test_aget(self):
+        """Concurrent tasks must share one computation."""
+        cache = ChartCache()
+        charts = await asyncio.gather(*[cache.aget(CONTEXT, runner=self.runner)
+                                        for _ in range(10)])
+        self.assertEqual((cache.computations, cache.coalesced), (1, 9))
+        self.assertTrue(all(chart is charts[0] for chart in charts))
+        self.assertIs(cache.get(CONTEXT), charts[0])
+
+    async def test_cancel(self):
+        """Cancelling a task must not cancel the computation of the others."""
+        cache = ChartCache()
+        first = asyncio.ensure_future(cache.aget(CONTEXT, runner=self.runner))
+        second = asyncio.ensure_future(cache.aget(CONTEXT, runner=self.runner))
+        await asyncio.sleep(0)
+        first.cancel()
+        chart = await second
+        self.assertEqual(chart.context, CONTEXT)
+        self.assertEqual(cache.computations, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
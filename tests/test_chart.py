@@ -1,8 +1,12 @@
+import gc
+import pickle
 import unittest
+import weakref
 from dataclasses import asdict
 
 from pyastra import const
 from pyastra.core.chart import Chart
+from pyastra.core.datetime import Datetime
 
 from tests.fixtures.common import date, pos
 
@@ -78,3 +82,53 @@ class SolarReturnTest(ChartTests):
         ids = [obj.id for obj in chart.objects]
         ids_sr = [obj.id for obj in sr_chart.objects]
         self.assertListEqual(ids, ids_sr)
+
+
+class WeakReferencesTest(unittest.TestCase):
+
+    def test_objects(self):
+        """Objects must work with weak references to the chart."""
+        chart = Chart(date, pos, weak_refs=True)
+        sun = chart.get(const.SUN)
+        self.assertIs(sun.chart, chart)
+        self.assertEqual(sun.house().id, const.HOUSE7)
+        self.assertTrue(sun.is_in_sect)
+        self.assertEqual(sun.accidental_dignities().score(), 1)
+        self.assertTrue(chart.solar_return(2025).weak_refs)
+
+    def test_freed(self):
+        """Charts must be freed without the garbage collector."""
+        gc.disable()
+        try:
+            chart = Chart(date, pos, weak_refs=True)
+            ref = weakref.ref(chart)
+            sun = chart.get(const.SUN)
+            del chart
+            self.assertIsNone(ref())
+            self.assertIsNone(sun.chart)
+        finally:
+            gc.enable()
+
+    def test_copy(self):
+        """Copied charts must reference the copy and outlive the source chart."""
+        chart = Chart(date, pos, weak_refs=True)
+        res = chart.copy()
+        del chart
+        gc.collect()
+        for obj in [res.get(const.SUN), res.get(const.HOUSE1), res.get(const.ASC)]:
+            self.assertIs(obj.chart, res)
+        self.assertEqual(res.get(const.SUN).house().id, const.HOUSE7)
+
+    def test_profection(self):
+        """Profected charts must work with weak references to the chart."""
+        chart = Chart(date, pos, weak_refs=True).profection(Datetime('2020/01/01', '00:00'))
+        sun = chart.get_object(const.SUN)
+        self.assertIs(sun.chart, chart)
+        self.assertIsNotNone(sun.house())
+        self.assertIsInstance(sun.accidental_dignities().score(), int)
+
+    def test_pickle(self):
+        """Pickled charts must keep the references to the chart."""
+        chart = pickle.loads(pickle.dumps(Chart(date, pos, weak_refs=True)))
+        self.assertIs(chart.get(const.SUN).chart, chart)
+        self.assertIs(chart.get(const.HOUSE1).chart, chart)
@@ -0,0 +1,70 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from pyastra import const
+from pyastra.core.chart import Chart
+from pyastra.core.datetime import Datetime
+from pyastra.predictives import eclipses
+from pyastra.predictives.eclipses import EclipseIndex
+
+from tests.fixtures.common import date, pos
+
+
+class EclipseIndexTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.index = EclipseIndex.build(Datetime('2014/01/01').jd, Datetime('2016/01/01').jd)
+        cls.chart = Chart(date, pos)
+
+    def test_sorted(self):
+        """Index must be sorted by julian date."""
+        self.assertListEqual(self.index.jds, sorted(self.index.jds))
+        self.assertEqual(len(self.index), 8)
+
+    def test_prenatal_eclipse(self):
+        """Prenatal eclipse is the partial solar eclipse of 2014/10/23."""
+        eclipse = self.index.prenatal(self.chart)
+        self.assertEqual(eclipse.kind, const.ECLIPSE_SOLAR)
+        self.assertEqual(eclipse.type, const.ECLIPSE_PARTIAL)
+        self.assertEqual(eclipse.date.date.to_string(), '2014/10/23')
+
+    def test_prenatal_lunar_eclipse(self):
+        """Prenatal lunar eclipse is the total lunar eclipse of 2014/10/08."""
+        eclipse = self.index.prenatal(self.chart, const.ECLIPSE_LUNAR)
+        self.assertEqual(eclipse.type, const.ECLIPSE_TOTAL)
+        self.assertEqual(eclipse.date.date.to_string(), '2014/10/08')
+
+    def test_next_eclipse(self):
+        """Next eclipse is the total solar eclipse of 2015/03/20 at the end of Pisces."""
+        eclipse = self.index.next(date.jd)
+        self.assertEqual(eclipse.type, const.ECLIPSE_TOTAL)
+        self.assertEqual(eclipse.date.date.to_string(), '2015/03/20')
+        self.assertAlmostEqual(eclipse.lon, 359.45, 1)
+
+    def test_scan(self):
+        """The solar eclipse of 2015/03/20 is within orb of the natal Sun."""
+        hits = self.index.scan([self.chart], ids=[const.SUN], orb=7.0)[0]
+        eclipse, obj_id, dist = hits[0]
+        self.assertEqual(obj_id, const.SUN)
+        self.assertEqual(eclipse.date.date.to_string(), '2015/03/20')
+        self.assertAlmostEqual(dist, eclipse.lon - self.chart.get(const.SUN).lon, 6)
+
+    def test_save_and_load(self):
+        """Saved indexes must load the same eclipses."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'eclipses.json')
+            self.index.save(path)
+            index = EclipseIndex.load(path)
+        self.assertListEqual(index.eclipses, self.index.eclipses)
+
+    def test_get_index_path(self):
+        """The default index must be saved to each new path."""
+        with tempfile.TemporaryDirectory() as tmp_dir, \
+                mock.patch.object(eclipses, '_INDEX', self.index):
+            for name in ['a.json', 'b.json']:
+                path = os.path.join(tmp_dir, name)
+                self.assertIs(eclipses.get_index(path), self.index)
+                self.assertListEqual(EclipseIndex.load(path).eclipses, self.index.eclipses)
@@ -0,0 +1,70 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from pyastra import const
+from pyastra.core.chart import Chart
+from pyastra.dignities import essential
+from pyastra.predictives.primarydirections import PrimaryDirections
+
+from tests.fixtures.common import date, pos
+
+LILLY = essential.get_config(essential.LILLY_TERMS, essential.TRIPLICITY_FACES)
+
+
+class DignityConfigTest(unittest.TestCase):
+
+    def test_info(self):
+        """Info must follow the terms and faces of the config."""
+        self.assertEqual(essential.term(const.ARIES, 13), const.MERCURY)
+        self.assertEqual(essential.term(const.ARIES, 13, LILLY), const.VENUS)
+        self.assertEqual(essential.face(const.ARIES, 15), const.SUN)
+        self.assertEqual(essential.face(const.ARIES, 15, LILLY), const.SUN)
+        self.assertEqual(essential.face(const.ARIES, 25, LILLY), const.JUPITER)
+        info = essential.get_info(const.ARIES, 13.5, LILLY)
+        self.assertEqual((info['term'], info['face']), (const.VENUS, const.SUN))
+
+    def test_info_table(self):
+        """Info must match the info computed without tables."""
+        for config in [None, LILLY]:
+            for sign in const.LIST_SIGNS:
+                for lon in [0, 5.5, 12.25, 29.999]:
+                    self.assertEqual(essential.get_info(sign, lon, config),
+                                     essential._compute_info(sign, lon, config))
+
+    def test_invalid(self):
+        """Invalid variants must raise."""
+        self.assertRaises(ValueError, essential.DignityConfig, 'Unknown Terms')
+        self.assertRaises(ValueError, Chart, date, pos, faces='Unknown Faces')
+
+    def test_chart(self):
+        """Charts must use the variants of their context."""
+        chart = Chart(date, pos, terms=essential.LILLY_TERMS,
+                      faces=essential.TRIPLICITY_FACES)
+        self.assertIs(chart.context.dignities, LILLY)
+        sun = chart.get_object(const.SUN)
+        info = sun.essential_dignities()
+        self.assertEqual(info.get_info(), essential.get_info(sun.sign, sun.signlon, LILLY))
+        self.assertIs(chart.solar_return(2020).context.dignities, LILLY)
+
+    def test_primary_directions_terms(self):
+        """Primary directions must use the terms of the chart."""
+        chart = Chart(date, pos, terms=essential.LILLY_TERMS)
+        self.assertEqual(PrimaryDirections(chart).terms[const.ARIES][const.MERCURY], 14)
+        chart = Chart(date, pos)
+        self.assertEqual(PrimaryDirections(chart).terms[const.ARIES][const.MERCURY], 12)
+
+    def test_concurrent(self):
+        """Different configs must be used concurrently."""
+        def terms(config):
+            return [essential.term(sign, lon, config)
+                    for sign in const.LIST_SIGNS for lon in range(30)]
+
+        expected = {config: terms(config) for config in [essential.DEFAULT_CONFIG, LILLY]}
+        with ThreadPoolExecutor(4) as executor:
+            configs = list(expected) * 20
+            for config, res in zip(configs, executor.map(terms, configs)):
+                self.assertEqual(res, expected[config])
+
+
+if __name__ == '__main__':
+    unittest.main()
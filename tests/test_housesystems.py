@@ -0,0 +1,66 @@
+import random
+import unittest
+
+from pyastra import const, profiling
+from pyastra.context import ChartContext
+from pyastra.core import batch
+from pyastra.core.chart import Chart
+from pyastra.core.housesystems import HouseSystemBundle, cusps, house_indexes
+from pyastra.ephem import swe
+
+from tests.fixtures.common import date, pos
+
+HOUSE_SYSTEMS = list(swe.SWE_HOUSESYS)
+
+
+class HouseSystemTest(unittest.TestCase):
+
+    def test_cusps(self):
+        """Cusps of several systems must match the cusps of each system."""
+        for zodiac in [const.ZODIAC_TROPICAL, const.ZODIAC_SIDEREAL]:
+            context = ChartContext(jd=date.jd, lat=pos.lat, lon=pos.lon, zodiac=zodiac)
+            res = cusps(context, HOUSE_SYSTEMS)
+            for hsys in HOUSE_SYSTEMS:
+                chart = Chart(date, pos, hsys=hsys, zodiac=zodiac)
+                self.assertEqual(list(res[hsys][0]), [house.lon for house in chart.houses])
+                self.assertEqual(res[hsys][1][0], chart.get(const.ASC).lon)
+
+    def test_single_evaluation(self):
+        """The sidereal time must be computed once for all systems."""
+        context = ChartContext(jd=date.jd, lat=pos.lat, lon=pos.lon)
+        with profiling.trace() as trace:
+            cusps(context, HOUSE_SYSTEMS)
+        self.assertEqual(trace.calls['sidtime'], 1)
+        self.assertEqual(trace.calls['houses_armc'], len(HOUSE_SYSTEMS))
+
+    def test_bundle(self):
+        """Bundle charts must match the charts of each system."""
+        chart = Chart(date, pos)
+        bundle = HouseSystemBundle.from_chart(chart, HOUSE_SYSTEMS)
+        self.assertIs(bundle[const.HOUSES_DEFAULT], chart)
+        self.assertEqual(len(bundle), len(HOUSE_SYSTEMS))
+        indexes = bundle.house_indexes()
+        for hsys in HOUSE_SYSTEMS:
+            expected = Chart(date, pos, hsys=hsys)
+            res = bundle[hsys]
+            self.assertEqual(res.context, expected.context)
+            for obj in list(expected.objects) + list(expected.houses) + list(expected.angles):
+                self.assertEqual(res.get(obj.id).as_dict().keys(), obj.as_dict().keys())
+                self.assertAlmostEqual(res.get(obj.id).lon, obj.lon, 9)
+                self.assertIs(res.get(obj.id).chart, res)
+            for obj in expected.objects:
+                house = expected.houses.get_object_house(obj)
+                self.assertEqual(const.LIST_HOUSES[indexes[hsys][obj.id]], house.id)
+
+    def test_house_indexes(self):
+        """House indexes must follow the house rules."""
+        rand = random.Random(1)
+        cusps_ = [(30 * i + rand.uniform(-10, 10)) % 360 for i in range(12)]
+        lons = [rand.uniform(0, 360) for _ in range(500)] + [(cusp - 5) % 360 for cusp in cusps_]
+        expected = [batch.house_index(cusps_, lon) for lon in lons]
+        self.assertEqual(batch.house_indexes(cusps_, lons), expected)
+        self.assertEqual(house_indexes({'A': cusps_}, lons), {'A': expected})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import pickle
+import unittest
+
+from pyastra import const
+from pyastra.core.chart import Chart
+from pyastra.core.objects import GenericObject, House, Object
+from pyastra.core.sign import Sign, SIGNS
+
+from tests.fixtures.common import date, pos
+
+
+class SignTest(unittest.TestCase):
+
+    def test_interned(self):
+        """Signs must be interned."""
+        self.assertIs(Sign(const.ARIES), Sign(const.ARIES))
+        self.assertIs(SIGNS[1], Sign(const.TAURUS))
+        self.assertEqual(SIGNS, tuple(const.LIST_SIGNS))
+        self.assertIs(pickle.loads(pickle.dumps(SIGNS[5])), SIGNS[5])
+
+    def test_invalid(self):
+        """Invalid sign names must raise."""
+        self.assertRaises(ValueError, Sign, 'Ophiuchus')
+        self.assertRaises(ValueError, Sign, None)
+
+
+class ObjectTest(unittest.TestCase):
+
+    def setUp(self):
+        self.chart = Chart(date, pos)
+
+    def test_slots(self):
+        """Objects must keep their declared attributes in slots."""
+        sun = self.chart.get(const.SUN)
+        self.assertEqual(vars(sun), {})
+        self.assertEqual(Object._FIELDS, ('id', 'type', 'lon', 'lat', '_chart',
+                                          'lon_speed', 'lat_speed'))
+
+    def test_extra_attributes(self):
+        """Objects must keep undeclared attributes."""
+        sun = self.chart.get(const.SUN).copy()
+        sun.label = 'Sol'
+        self.assertEqual(vars(sun), {'label': 'Sol'})
+        self.assertEqual(sun.copy().label, 'Sol')
+        self.assertEqual(sun.as_dict()['label'], 'Sol')
+        self.assertEqual(pickle.loads(pickle.dumps(sun)).label, 'Sol')
+        self.assertEqual(GenericObject(extra=1).extra, 1)
+        self.assertEqual(House.from_dict({'id': const.HOUSE2, 'extra': 1}).extra, 1)
+
+    def test_sign(self):
+        """Object sign must be the interned sign."""
+        obj = GenericObject(lon=95.0)
+        self.assertIs(obj.sign, Sign(const.CANCER))
+
+    def test_copy(self):
+        """Copies must have the same attributes and chart."""
+        for obj_id in [const.SUN, const.HOUSE1, const.ASC]:
+            obj = self.chart.get(obj_id)
+            copy = obj.copy()
+            self.assertIsNot(copy, obj)
+            self.assertIs(copy.chart, self.chart)
+            self.assertEqual(copy.as_dict(), obj.as_dict())
+
+    def test_from_dict(self):
+        """Objects must be built from a dictionary of properties."""
+        house = House.from_dict({'id': const.HOUSE2, 'lon': 40.0, 'size': 25.0,
+                                 'chart': self.chart})
+        self.assertEqual(house.type, const.OBJ_HOUSE)
+        self.assertEqual(house.size, 25.0)
+        self.assertIs(house.chart, self.chart)
+        self.assertEqual(House.from_dict(house.as_dict()).as_dict(), house.as_dict())
+
+    def test_pickle(self):
+        """Pickled objects must keep their attributes."""
+        sun = self.chart.get(const.SUN)
+        obj = pickle.loads(pickle.dumps(sun))
+        self.assertEqual(obj.lon_speed, sun.lon_speed)
+        self.assertEqual(obj.chart.date.jd, self.chart.date.jd)
+
+
+if __name__ == '__main__':
+    unittest.main()
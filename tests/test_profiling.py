@@ -0,0 +1,42 @@
+import unittest
+
+import swisseph
+
+from pyastra import const, profiling
+from pyastra.core.chart import Chart
+from pyastra.ephem import swe
+
+from tests.fixtures.common import date, pos
+
+
+class ProfilingTests(unittest.TestCase):
+
+    def test_trace(self):
+        """Traces must count the calls per function, body and operation."""
+        with profiling.trace() as trace:
+            Chart(date, pos)
+        self.assertEqual(trace.bodies[('calc_ut', const.MARS)], 1)
+        self.assertEqual(trace.bodies[('houses_ex', const.HOUSES_DEFAULT)], trace.calls['houses_ex'])
+        operation = trace.operations[profiling.OPERATION_CHART]
+        self.assertEqual(operation['count'], 1)
+        self.assertEqual(sum(operation['calls'].values()), trace.total_calls)
+        self.assertGreater(trace.lock_acquires, 0)
+
+    def test_operation(self):
+        """Calls must be attributed to the innermost operation."""
+        calls = []
+        with profiling.trace(on_call=lambda *args: calls.append(args)) as trace:
+            with profiling.operation('report'):
+                swe.swe_object_fast(const.SUN, date.jd)
+        self.assertEqual(calls[0][0], 'calc_ut')
+        self.assertEqual(calls[0][3], 'report')
+        self.assertEqual(trace.operations['report']['calls']['calc_ut'], 1)
+
+    def test_disabled(self):
+        """The instrumentation must be removed after the last trace."""
+        with profiling.trace():
+            with profiling.trace():
+                self.assertTrue(profiling.is_tracing())
+            self.assertIsNot(swe.swisseph, swisseph)
+        self.assertFalse(profiling.is_tracing())
+        self.assertIs(swe.swisseph, swisseph)
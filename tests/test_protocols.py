@@ -0,0 +1,38 @@
+import unittest
+
+from pyastra import const
+from pyastra.core.chart import Chart
+from pyastra.protocols import almutem, behavior, temperament
+from pyastra.protocols.facts import ChartFacts
+
+from tests.fixtures.common import date, pos
+
+
+class ProtocolTests(unittest.TestCase):
+
+    def setUp(self):
+        self.chart = Chart(date, pos)
+        self.facts = ChartFacts(self.chart)
+
+    def test_facts_aspects(self):
+        """Aspect grid must match the objects list."""
+        for point_id in [const.ASC, const.MOON, const.MERCURY]:
+            point = self.chart.get(point_id)
+            for asp_list in [[0], [60, 90, 120, 180], const.MAJOR_ASPECTS]:
+                expected = [obj.id for obj in self.chart.objects.get_objects_aspecting(point, asp_list)]
+                result = [obj.id for obj in self.facts.objects_aspecting(point_id, asp_list)]
+                self.assertListEqual(result, expected)
+
+    def test_facts_houses(self):
+        """House map must match the chart houses."""
+        for obj in self.chart.objects:
+            self.assertEqual(self.facts.houses[obj.id], self.chart.houses.get_object_house(obj))
+
+    def test_pipeline(self):
+        """Protocols computed over shared facts must match the chart protocols."""
+        res = self.chart.protocols()
+        self.assertDictEqual(res['almutem'], almutem.compute(self.chart))
+        self.assertListEqual([sorted(factor[1]) for factor in res['behavior']],
+                             [sorted(factor[1]) for factor in behavior.compute(self.chart)])
+        self.assertListEqual(res['temperament'].get_factors(), temperament.get_factors(self.chart))
+        self.assertDictEqual(res['temperament'].get_score(), self.chart.temperament().get_score())
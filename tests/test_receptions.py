@@ -0,0 +1,65 @@
+import unittest
+
+from pyastra import const
+from pyastra.core.chart import Chart
+from pyastra.integrations import llm, rendering
+from pyastra.tools.chartdynamics import ChartDynamics
+from pyastra.tools.receptions import ReceptionMatrix
+
+from tests.fixtures.common import date, pos
+
+
+class ReceptionTests(unittest.TestCase):
+
+    def setUp(self):
+        self.chart = Chart(date, pos)
+        self.matrix = ReceptionMatrix(self.chart)
+
+    def test_receptions(self):
+        """Matrix receptions must match the chart dynamics."""
+        dyn = ChartDynamics(self.chart)
+        for id_a in const.LIST_SEVEN_PLANETS:
+            for id_b in const.LIST_SEVEN_PLANETS:
+                self.assertListEqual(self.matrix.in_dignities(id_a, id_b),
+                                     dyn.in_dignities(id_a, id_b))
+                self.assertListEqual(self.matrix.receives(id_a, id_b), dyn.receives(id_a, id_b))
+                self.assertListEqual(self.matrix.mutual_receptions(id_a, id_b),
+                                     dyn.mutual_receptions(id_a, id_b))
+
+    def test_receptions_by_type(self):
+        """Mutual receptions must be indexed by the pair of dignities."""
+        res = self.matrix.receptions_by_type()
+        self.assertListEqual(res[('dayTrip', 'partTrip')], [(const.SUN, const.MOON)])
+
+    def test_dispositors(self):
+        """Dispositor chains must end in the dispositor cycles."""
+        self.assertListEqual(self.matrix.dispositor_chain(const.MOON),
+                             [const.MOON, const.JUPITER, const.SUN])
+        self.assertListEqual(self.matrix.dispositor_cycles(),
+                             [[const.SUN, const.JUPITER], [const.MARS]])
+        self.assertIsNone(self.matrix.final_dispositor())
+
+    def test_shared(self):
+        """The chart matrix must be computed once and shared by the accidental dignities."""
+        matrix = self.chart.receptions()
+        self.assertIs(self.chart.receptions(), matrix)
+        for obj_id in const.LIST_SEVEN_PLANETS:
+            dignities = self.chart.get_object(obj_id).accidental_dignities()
+            self.assertIs(dignities.receptions, matrix)
+        self.assertIsNot(self.chart.copy().receptions(), matrix)
+
+    def test_relocated(self):
+        """The chart matrix must be computed again when an object is relocated."""
+        matrix = self.chart.receptions()
+        moon = self.chart.get_object(const.MOON)
+        moon.relocate(moon.lon + 30)
+        self.assertIsNot(self.chart.receptions(), matrix)
+        self.assertListEqual(self.chart.receptions().receives(const.SUN, const.MOON),
+                             ReceptionMatrix(self.chart).receives(const.SUN, const.MOON))
+
+    def test_description(self):
+        """Chart descriptions must include the receptions."""
+        text = llm.describe_receptions(self.chart)
+        self.assertIn('Sun receives Moon by dayTrip', text)
+        self.assertIn(text, llm.describe_chart(self.chart))
+        self.assertIn(rendering.SECTION_RECEPTIONS, rendering.CHART_SECTIONS)
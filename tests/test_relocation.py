@@ -0,0 +1,59 @@
+import random
+import unittest
+
+from pyastra import const
+from pyastra.core import angle
+from pyastra.core.chart import Chart
+from pyastra.core.geopos import GeoPos
+from pyastra.core.relocation import RelocationBatch
+
+from tests.fixtures.common import date, pos
+
+
+class RelocationTest(unittest.TestCase):
+
+    def setUp(self):
+        rand = random.Random(1)
+        self.locations = [(rand.uniform(-60, 60), rand.uniform(-180, 180)) for _ in range(20)]
+        self.locations.append((72.0, 25.0))   # Inside the arctic circle
+
+    def assertRelocated(self, batch, **kwargs):
+        self.assertEqual(len(batch), len(self.locations))
+        for i, location in enumerate(self.locations):
+            chart = Chart(date, GeoPos(*location), **kwargs)
+            for obj_id, values in batch.lons.items():
+                self.assertAlmostEqual(angle.closest_distance(chart.get(obj_id).lon, values[i]),
+                                       0, 8)
+            for house, cusp in zip(chart.houses, batch.cusps[i]):
+                self.assertAlmostEqual(angle.closest_distance(house.lon, cusp), 0, 8)
+            self.assertEqual(batch.diurnal[i], chart.is_diurnal())
+            for obj in chart.objects:
+                index = batch.house_indexes(obj.id)[i]
+                self.assertEqual(const.LIST_HOUSES[index], chart.houses.get_object_house(obj).id)
+
+    def test_house_systems(self):
+        """Relocated charts must match the charts built at each location."""
+        for hsys in [const.HOUSES_ALCABITUS, const.HOUSES_REGIOMONTANUS,
+                     const.HOUSES_PORPHYRIUS, const.HOUSES_WHOLE_SIGN, const.HOUSES_EQUAL]:
+            batch = RelocationBatch.build(date, self.locations, hsys=hsys)
+            self.assertRelocated(batch, hsys=hsys)
+
+    def test_sidereal(self):
+        """Relocated sidereal charts must match the charts built at each location."""
+        self.locations.pop()
+        for hsys in [const.HOUSES_ALCABITUS, const.HOUSES_WHOLE_SIGN]:
+            kwargs = {'hsys': hsys, 'zodiac': const.ZODIAC_SIDEREAL, 'ids': const.LIST_OBJECTS}
+            self.assertRelocated(RelocationBatch.build(date, self.locations, **kwargs), **kwargs)
+
+    def test_from_chart(self):
+        """Positions must come from the chart."""
+        chart = Chart(date, pos)
+        batch = RelocationBatch.from_chart(chart, [pos, (pos.lat, pos.lon + 90)])
+        self.assertEqual(batch.lons[const.SUN], [chart.get(const.SUN).lon] * 2)
+        self.assertEqual(batch.lat, [pos.lat] * 2)
+        self.assertRaises(ValueError, RelocationBatch.from_chart, Chart(date, pos, alt=100.0),
+                          [pos])
+
+
+if __name__ == '__main__':
+    unittest.main()
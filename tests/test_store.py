@@ -0,0 +1,95 @@
+import dataclasses
+import os
+import shutil
+import tempfile
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+
+from pyastra import const, profiling, store
+from pyastra.cache import ChartCache
+from pyastra.context import ChartContext
+from pyastra.core.chart import Chart
+from pyastra.store import ChartStore
+
+from tests.fixtures.common import date, pos
+
+
+def _positions(chart):
+    return [(type(obj), obj.id, obj.lon, obj.lat, getattr(obj, 'lon_speed', None),
+             getattr(obj, 'size', None))
+            for values in [chart.objects, chart.houses, chart.angles] for obj in values]
+
+
+def _contexts(n):
+    return [ChartContext(jd=date.jd + i, lat=pos.lat, lon=pos.lon) for i in range(n)]
+
+
+def _preload(path, contexts):
+    return ChartStore(path).preload(contexts)
+
+
+class ChartStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, 'charts.db')
+        self.store = ChartStore(self.path)
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.dir)
+
+    def test_load(self):
+        """Stored charts must be loaded without ephemeris calls."""
+        chart = Chart(date, pos, store=self.store)
+        with profiling.trace() as trace:
+            loaded = Chart(date, pos, store=self.store)
+        self.assertEqual(trace.total_calls, 0)
+        self.assertEqual(_positions(loaded), _positions(chart))
+        self.assertIs(loaded.get(const.SUN).chart, loaded)
+        self.assertEqual(len(self.store), 1)
+
+    def test_key(self):
+        """Keys must depend on the context, IDs and versions."""
+        context = _contexts(1)[0]
+        key = store.chart_key(context, const.LIST_OBJECTS_TRADITIONAL)
+        self.assertEqual(key, store.chart_key(_contexts(1)[0], const.LIST_OBJECTS_TRADITIONAL))
+        self.assertNotEqual(key, store.chart_key(context, [const.SUN]))
+        self.assertIsNone(self.store.get(context, [const.SUN]))
+        for ephemeris, same in [(const.EPHEM_SWISS, True), (const.EPHEM_MOSHIER, False)]:
+            other = dataclasses.replace(context, ephemeris=ephemeris)
+            self.assertEqual(key == store.chart_key(other, const.LIST_OBJECTS_TRADITIONAL), same)
+
+    def test_preload(self):
+        """Preloads must only compute missing charts."""
+        self.assertEqual(self.store.preload(_contexts(5)), 5)
+        self.assertEqual(self.store.preload(_contexts(8)), 3)
+        self.assertEqual(len(self.store), 8)
+
+    def test_evict(self):
+        """The oldest charts above the maximum must be removed."""
+        self.store.max_entries = 3
+        self.store.preload(_contexts(5))
+        self.assertEqual(self.store.evict(), 2)
+        self.assertEqual(len(self.store), 3)
+        self.assertIsNone(self.store.get(_contexts(1)[0]))
+
+    def test_processes(self):
+        """Several processes must write to the same store."""
+        contexts = _contexts(12)
+        with ProcessPoolExecutor(3) as executor:
+            futures = [executor.submit(_preload, self.path, contexts[i::3]) for i in range(3)]
+            self.assertEqual(sum(future.result() for future in futures), 12)
+        self.assertEqual(len(self.store), 12)
+
+    def test_cache(self):
+        """Chart caches must load charts from the store."""
+        context = _contexts(1)[0]
+        self.store.preload([context])
+        with profiling.trace() as trace:
+            ChartCache(store=self.store).get(context)
+        self.assertEqual(trace.total_calls, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+
+from pyastra import const
+from pyastra.core import angle
+from pyastra.core.chart import Chart
+from pyastra.core.zodiacs import ZodiacBundle, ayanamsa, sidereal_chart
+
+from tests.fixtures.common import date, pos
+
+
+class ZodiacBundleTest(unittest.TestCase):
+
+    def assertSameChart(self, chart, expected):
+        for obj in list(expected.objects) + list(expected.houses) + list(expected.angles):
+            res = chart.get(obj.id)
+            self.assertAlmostEqual(angle.closest_distance(obj.lon, res.lon), 0, 6)
+            self.assertAlmostEqual(obj.lat, res.lat, 6)
+            self.assertAlmostEqual(getattr(obj, 'lon_speed', 0), getattr(res, 'lon_speed', 0), 5)
+            self.assertIs(res.chart, chart)
+
+    def test_sidereal(self):
+        """Derived charts must match the charts computed in the sidereal zodiac."""
+        for hsys in [const.HOUSES_ALCABITUS, const.HOUSES_PLACIDUS, const.HOUSES_WHOLE_SIGN]:
+            bundle = ZodiacBundle.build(date, pos, ids=const.LIST_OBJECTS, hsys=hsys)
+            self.assertEqual(len(bundle), len(const.LIST_AYANAMSAS) + 1)
+            for ayanamsa_id in const.LIST_AYANAMSAS:
+                expected = Chart(date, pos, ids=const.LIST_OBJECTS, hsys=hsys,
+                                 zodiac=const.ZODIAC_SIDEREAL, ayanamsa=ayanamsa_id)
+                self.assertSameChart(bundle[ayanamsa_id], expected)
+                self.assertEqual(bundle[ayanamsa_id].context, expected.context)
+
+    def test_tropical(self):
+        """The tropical chart must be kept and sidereal charts derived from it."""
+        chart = Chart(date, pos)
+        bundle = ZodiacBundle.from_chart(chart, [const.AYANANMSA_LAHIRI])
+        self.assertIs(bundle.tropical, chart)
+        self.assertEqual(list(bundle), [const.ZODIAC_TROPICAL, const.AYANANMSA_LAHIRI])
+        lons = bundle.lons(const.SUN)
+        value, _ = ayanamsa(chart.date.jd, const.AYANANMSA_LAHIRI)
+        self.assertAlmostEqual(lons[const.ZODIAC_TROPICAL] - lons[const.AYANANMSA_LAHIRI],
+                               value)
+        sidereal = bundle[const.AYANANMSA_LAHIRI]
+        self.assertRaises(ValueError, sidereal_chart, sidereal, const.AYANANMSA_RAMAN)
+
+
+if __name__ == '__main__':
+    unittest.main()